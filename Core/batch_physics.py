@@ -0,0 +1,253 @@
+import numpy as np
+
+class BatchBodies:
+    FIELDS = ("x", "y", "vel_x", "vel_y", "width", "height", "jump_time", "coyote_timer", "jump_buffer_timer",
+              "on_ground", "is_jumping", "input_left", "input_right", "input_jump")
+    
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.vel_x = np.zeros(0)
+        self.vel_y = np.zeros(0)
+        self.width = np.zeros(0, dtype=np.int64)
+        self.height = np.zeros(0, dtype=np.int64)
+        self.jump_time = np.zeros(0)
+        self.coyote_timer = np.zeros(0)
+        self.jump_buffer_timer = np.zeros(0)
+        self.on_ground = np.zeros(0, dtype=bool)
+        self.is_jumping = np.zeros(0, dtype=bool)
+        self.input_left = np.zeros(0, dtype=bool)
+        self.input_right = np.zeros(0, dtype=bool)
+        self.input_jump = np.zeros(0, dtype=bool)
+        self.reserve(capacity)
+    
+    def reserve(self, capacity):
+        if capacity <= self.capacity:
+            return
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+    
+    def add(self, x, y, width=16, height=16):
+        if self.count == self.capacity:
+            self.reserve(max(16, self.capacity * 2))
+        index = self.count
+        for name in self.FIELDS:
+            getattr(self, name)[index] = 0
+        self.x[index] = x
+        self.y[index] = y
+        self.width[index] = width
+        self.height[index] = height
+        self.count += 1
+        return index
+    
+    def clear(self):
+        self.count = 0
+    
+    def view(self, name):
+        return getattr(self, name)[:self.count]
+    
+    def set_input(self, left, right, jump):
+        self.input_left[:self.count] = left
+        self.input_right[:self.count] = right
+        self.input_jump[:self.count] = jump
+
+class BatchPhysics:
+    def __init__(self, bodies=None):
+        self.bodies = bodies if bodies is not None else BatchBodies()
+        self.solid = np.zeros((0, 0), dtype=bool)
+        self.tile_size = 16
+        
+        self.max_speed = 120
+        self.acceleration = 600
+        self.friction = 1200
+        self.air_friction = 300
+        self.gravity = 800
+        self.max_fall_speed = 300
+        self.jump_force = 220
+        self.max_jump_time = 0.2
+        self.coyote_time = 0.08
+    
+    def copy_tuning(self, player):
+        for name in ("max_speed", "acceleration", "friction", "air_friction", "gravity", "max_fall_speed",
+                     "jump_force", "max_jump_time", "coyote_time"):
+            setattr(self, name, getattr(player, name))
+    
+    def bind(self, tilemap):
+        if tilemap.stream:
+            raise ValueError("Batch physics needs a fully loaded tilemap, not a streamed one")
+        self.tile_size = tilemap.tile_size
+        self.refresh_collision(tilemap.collision_data)
+    
+    def refresh_collision(self, collision_data):
+        packed = np.frombuffer(bytes(collision_data.bits), dtype=np.uint8).reshape(collision_data.height, collision_data.stride)
+        self.solid = np.unpackbits(packed, axis=1, bitorder='little')[:, :collision_data.width].astype(bool)
+    
+    def set_collision(self, grid_x, grid_y, solid):
+        self.solid[grid_y, grid_x] = solid
+    
+    def step(self, dt):
+        if self.bodies.count == 0:
+            return
+        self.handle_input(dt)
+        self.apply_physics(dt)
+        self.resolve_horizontal(dt)
+        self.resolve_vertical(dt)
+    
+    def start_jump(self, mask):
+        b = self.bodies
+        vel_y = b.view("vel_y")
+        vel_y[mask] = -self.jump_force
+        b.view("is_jumping")[mask] = True
+        b.view("jump_time")[mask] = 0
+        b.view("on_ground")[mask] = False
+        b.view("coyote_timer")[mask] = 0
+    
+    def handle_input(self, dt):
+        b = self.bodies
+        vel_x = b.view("vel_x")
+        vel_y = b.view("vel_y")
+        jump_time = b.view("jump_time")
+        on_ground = b.view("on_ground")
+        is_jumping = b.view("is_jumping")
+        coyote_timer = b.view("coyote_timer")
+        left = b.view("input_left")
+        right = b.view("input_right")
+        jump = b.view("input_jump")
+        
+        vel_x[left] = vel_x[left] - self.acceleration * dt
+        vel_x[right] = vel_x[right] + self.acceleration * dt
+        
+        idle = ~(left | right)
+        if idle.any():
+            friction = np.where(on_ground, self.friction, self.air_friction) * dt
+            slow = idle & (np.abs(vel_x) < 20)
+            forward = idle & ~slow & (vel_x > 0)
+            backward = idle & ~slow & (vel_x < 0)
+            vel_x[forward] = np.maximum(0, vel_x[forward] - friction[forward])
+            vel_x[backward] = np.minimum(0, vel_x[backward] + friction[backward])
+            vel_x[slow] = 0
+        
+        np.clip(vel_x, -self.max_speed, self.max_speed, out=vel_x)
+        
+        can_start = jump & ~is_jumping & (on_ground | (coyote_timer > 0))
+        holding = jump & is_jumping & (jump_time < self.max_jump_time)
+        released = ~jump & is_jumping
+        
+        if can_start.any():
+            self.start_jump(can_start)
+        if holding.any():
+            jump_time[holding] += dt
+            strength = 1.0 - (jump_time[holding] / self.max_jump_time)
+            strength = strength * strength
+            vel_y[holding] -= self.jump_force * 0.8 * strength * dt
+        if released.any():
+            is_jumping[released] = False
+            cut = released & (vel_y < -self.jump_force * 0.3)
+            vel_y[cut] = -self.jump_force * 0.3
+        
+        jump_buffer_timer = b.view("jump_buffer_timer")
+        buffered = jump_buffer_timer > 0
+        if buffered.any():
+            jump_buffer_timer[buffered] -= dt
+            fire = buffered & (on_ground | (coyote_timer > 0)) & ~is_jumping
+            self.start_jump(fire)
+            jump_buffer_timer[fire] = 0
+    
+    def apply_physics(self, dt):
+        b = self.bodies
+        vel_y = b.view("vel_y")
+        coyote_timer = b.view("coyote_timer")
+        airborne = ~b.view("on_ground")
+        
+        vel_y[airborne] = np.minimum(vel_y[airborne] + self.gravity * dt, self.max_fall_speed)
+        ticking = airborne & (coyote_timer > 0)
+        coyote_timer[ticking] -= dt
+        coyote_timer[~airborne] = self.coyote_time
+    
+    def first_solid(self, left, top, width, height):
+        tile_size = self.tile_size
+        grid_height, grid_width = self.solid.shape
+        x0 = left // tile_size
+        y0 = top // tile_size
+        x1 = (left + width - 1) // tile_size
+        y1 = (top + height - 1) // tile_size
+        hit_x = np.full(left.shape, -1, dtype=np.int64)
+        hit_y = np.full(left.shape, -1, dtype=np.int64)
+        if grid_width == 0 or grid_height == 0:
+            return hit_x, hit_y
+        
+        span_x = int((x1 - x0).max()) + 1
+        span_y = int((y1 - y0).max()) + 1
+        missing = np.ones(left.shape, dtype=bool)
+        for dy in range(span_y):
+            cell_y = y0 + dy
+            row_valid = (cell_y <= y1) & (cell_y >= 0) & (cell_y < grid_height)
+            clamped_y = np.clip(cell_y, 0, grid_height - 1)
+            for dx in range(span_x):
+                cell_x = x0 + dx
+                valid = row_valid & (cell_x <= x1) & (cell_x >= 0) & (cell_x < grid_width)
+                found = missing & valid & self.solid[clamped_y, np.clip(cell_x, 0, grid_width - 1)]
+                if found.any():
+                    hit_x[found] = cell_x[found]
+                    hit_y[found] = cell_y[found]
+                    missing &= ~found
+        return hit_x, hit_y
+    
+    def resolve_horizontal(self, dt):
+        b = self.bodies
+        x = b.view("x")
+        vel_x = b.view("vel_x")
+        width = b.view("width")
+        
+        x += vel_x * dt
+        hit_x, _ = self.first_solid(np.trunc(x).astype(np.int64), np.trunc(b.view("y")).astype(np.int64), width, b.view("height"))
+        hit = hit_x >= 0
+        if not hit.any():
+            return
+        
+        tile_size = self.tile_size
+        right = hit & (vel_x > 0)
+        left = hit & (vel_x < 0)
+        x[right] = hit_x[right] * tile_size - width[right]
+        x[left] = hit_x[left] * tile_size + tile_size
+        vel_x[hit] = 0
+    
+    def resolve_vertical(self, dt):
+        b = self.bodies
+        x = b.view("x")
+        y = b.view("y")
+        vel_y = b.view("vel_y")
+        width = b.view("width")
+        height = b.view("height")
+        on_ground = b.view("on_ground")
+        is_jumping = b.view("is_jumping")
+        tile_size = self.tile_size
+        
+        y += vel_y * dt
+        left = np.trunc(x).astype(np.int64)
+        _, hit_y = self.first_solid(left, np.trunc(y).astype(np.int64), width, height)
+        hit = hit_y >= 0
+        on_ground[:] = False
+        
+        if hit.any():
+            falling = hit & (vel_y > 0)
+            rising = hit & (vel_y < 0)
+            y[falling] = hit_y[falling] * tile_size - height[falling]
+            y[rising] = hit_y[rising] * tile_size + tile_size
+            vel_y[falling | rising] = 0
+            on_ground[falling] = True
+            is_jumping[falling | rising] = False
+            b.view("jump_time")[falling] = 0
+        
+        probe = ~on_ground & (vel_y == 0)
+        if probe.any():
+            _, ground_y = self.first_solid(left[probe], np.trunc(y[probe] + height[probe]).astype(np.int64),
+                                           width[probe], np.ones(int(probe.sum()), dtype=np.int64))
+            grounded = np.flatnonzero(probe)[ground_y >= 0]
+            on_ground[grounded] = True
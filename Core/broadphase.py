@@ -0,0 +1,147 @@
+class BroadphaseStats:
+    def __init__(self):
+        self.entities = 0
+        self.occupied_cells = 0
+        self.moved = 0
+        self.rebucketed = 0
+        self.candidate_pairs = 0
+        self.overlapping_pairs = 0
+        self.region_queries = 0
+    
+    def reset(self):
+        self.moved = 0
+        self.rebucketed = 0
+        self.candidate_pairs = 0
+        self.overlapping_pairs = 0
+        self.region_queries = 0
+
+class SpatialHash:
+    def __init__(self, chunk_size=16, tile_size=16):
+        self.chunk_size = chunk_size
+        self.tile_size = tile_size
+        self.cell_size = chunk_size * tile_size
+        self.cells = {}
+        self.entries = {}
+        self.stats = BroadphaseStats()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, handle):
+        return handle in self.entries
+    
+    def cell_range(self, left, top, right, bottom):
+        size = self.cell_size
+        return int(left // size), int(top // size), int(right // size), int(bottom // size)
+    
+    def add_to_cells(self, handle, cell_range):
+        cells = self.cells
+        x0, y0, x1, y1 = cell_range
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [handle]
+                else:
+                    bucket.append(handle)
+    
+    def remove_from_cells(self, handle, cell_range):
+        cells = self.cells
+        x0, y0, x1, y1 = cell_range
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells[(cx, cy)]
+                bucket.remove(handle)
+                if not bucket:
+                    del cells[(cx, cy)]
+    
+    def insert(self, handle, x, y, width, height):
+        if handle in self.entries:
+            self.update(handle, x, y, width, height)
+            return
+        cell_range = self.cell_range(x, y, x + width, y + height)
+        self.entries[handle] = [x, y, x + width, y + height, cell_range]
+        self.add_to_cells(handle, cell_range)
+        self.stats.entities = len(self.entries)
+    
+    def remove(self, handle):
+        entry = self.entries.pop(handle, None)
+        if entry is not None:
+            self.remove_from_cells(handle, entry[4])
+            self.stats.entities = len(self.entries)
+    
+    def update(self, handle, x, y, width, height):
+        entry = self.entries.get(handle)
+        if entry is None:
+            return
+        self.stats.moved += 1
+        right = x + width
+        bottom = y + height
+        entry[0] = x
+        entry[1] = y
+        entry[2] = right
+        entry[3] = bottom
+        cell_range = self.cell_range(x, y, right, bottom)
+        if cell_range == entry[4]:
+            return
+        self.remove_from_cells(handle, entry[4])
+        self.add_to_cells(handle, cell_range)
+        entry[4] = cell_range
+        self.stats.rebucketed += 1
+    
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+        self.stats.entities = 0
+    
+    def query_region(self, left, top, right, bottom):
+        size = self.cell_size
+        x0 = int(left // size)
+        y0 = int(top // size)
+        x1 = int(right // size)
+        y1 = int(bottom // size)
+        cells = self.cells
+        entries = self.entries
+        found = []
+        
+        self.stats.region_queries += 1
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for handle in bucket:
+                    entry = entries[handle]
+                    ex0, ey0 = entry[4][:2]
+                    if max(ex0, x0) != cx or max(ey0, y0) != cy:
+                        continue
+                    if entry[0] < right and entry[2] > left and entry[1] < bottom and entry[3] > top:
+                        found.append(handle)
+        return found
+    
+    def query_pairs(self):
+        entries = self.entries
+        pairs = []
+        candidates = 0
+        
+        for (cx, cy), bucket in self.cells.items():
+            count = len(bucket)
+            if count < 2:
+                continue
+            bounds = [entries[handle] for handle in bucket]
+            for i in range(count - 1):
+                a_left, a_top, a_right, a_bottom, origin = bounds[i]
+                ax0, ay0 = origin[:2]
+                for j in range(i + 1, count):
+                    b = bounds[j]
+                    origin = b[4]
+                    if (origin[0] if origin[0] > ax0 else ax0) != cx or (origin[1] if origin[1] > ay0 else ay0) != cy:
+                        continue
+                    candidates += 1
+                    if a_left < b[2] and b[0] < a_right and a_top < b[3] and b[1] < a_bottom:
+                        pairs.append((bucket[i], bucket[j]))
+        
+        self.stats.candidate_pairs += candidates
+        self.stats.overlapping_pairs += len(pairs)
+        self.stats.occupied_cells = len(self.cells)
+        return pairs
@@ -0,0 +1,80 @@
+import pygame
+from collections import OrderedDict
+from Core.tile_atlas import EMPTY
+
+class ChunkCache:
+    def __init__(self, chunk_size=16, max_chunks=64):
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()
+        self.bake_count = 0
+        self.eviction_count = 0
+    
+    def clear(self):
+        self.chunks.clear()
+    
+    def invalidate_cell(self, grid_x, grid_y):
+        self.invalidate_chunk(grid_x // self.chunk_size, grid_y // self.chunk_size)
+    
+    def invalidate_chunk(self, chunk_x, chunk_y):
+        self.chunks.pop((chunk_x, chunk_y), None)
+    
+    def get_chunk(self, tilemap, chunk_x, chunk_y):
+        key = (chunk_x, chunk_y)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+        
+        surface = self.bake_chunk(tilemap, chunk_x, chunk_y)
+        self.chunks[key] = surface
+        
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+            self.eviction_count += 1
+        
+        return surface
+    
+    def bake_chunk(self, tilemap, chunk_x, chunk_y):
+        tile_size = tilemap.tile_size
+        start_x = chunk_x * self.chunk_size
+        start_y = chunk_y * self.chunk_size
+        end_x = min(tilemap.grid_width, start_x + self.chunk_size)
+        end_y = min(tilemap.grid_height, start_y + self.chunk_size)
+        tiles = tilemap.atlas.tiles
+        kinds = tilemap.atlas.kinds
+        tile_count = len(tiles)
+        
+        self.bake_count += 1
+        surface = None
+        
+        for y in range(start_y, end_y):
+            row = tilemap.world_data[y]
+            for x in range(start_x, end_x):
+                tile_id = row[x]
+                if 0 < tile_id <= tile_count and kinds[tile_id - 1] != EMPTY:
+                    if surface is None:
+                        surface = pygame.Surface(((end_x - start_x) * tile_size, (end_y - start_y) * tile_size), pygame.SRCALPHA)
+                    surface.blit(tiles[tile_id - 1], ((x - start_x) * tile_size, (y - start_y) * tile_size))
+        
+        if surface is not None and pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        
+        return surface
+    
+    def render(self, tilemap, screen, camera_x=0, camera_y=0, area=None):
+        chunk_pixels = self.chunk_size * tilemap.tile_size
+        chunks_x = (tilemap.grid_width + self.chunk_size - 1) // self.chunk_size
+        chunks_y = (tilemap.grid_height + self.chunk_size - 1) // self.chunk_size
+        if area is None:
+            area = screen.get_rect()
+        
+        start_x = max(0, int((camera_x + area.left) // chunk_pixels))
+        end_x = min(chunks_x, int((camera_x + area.right - 1) // chunk_pixels) + 1)
+        start_y = max(0, int((camera_y + area.top) // chunk_pixels))
+        end_y = min(chunks_y, int((camera_y + area.bottom - 1) // chunk_pixels) + 1)
+        
+        for chunk_y in range(start_y, end_y):
+            for chunk_x in range(start_x, end_x):
+                surface = self.get_chunk(tilemap, chunk_x, chunk_y)
+                if surface is not None:
+                    screen.blit(surface, (chunk_x * chunk_pixels - camera_x, chunk_y * chunk_pixels - camera_y))
@@ -0,0 +1,95 @@
+import pygame
+
+class CollisionGeometry:
+    def __init__(self, region_size=16):
+        self.region_size = region_size
+        self.tile_size = 16
+        self.collision_data = None
+        self.regions_x = 0
+        self.regions_y = 0
+        self.regions = {}
+        self.built_regions = set()
+        self.results = []
+        self.rebuild_count = 0
+    
+    def clear(self):
+        self.collision_data = None
+        self.regions_x = 0
+        self.regions_y = 0
+        self.regions.clear()
+        self.built_regions.clear()
+    
+    def build(self, collision_data, tile_size):
+        self.clear()
+        self.collision_data = collision_data
+        self.tile_size = tile_size
+        self.regions_x = (collision_data.width + self.region_size - 1) // self.region_size
+        self.regions_y = (collision_data.height + self.region_size - 1) // self.region_size
+    
+    def invalidate_cell(self, grid_x, grid_y):
+        self.built_regions.discard((grid_x // self.region_size, grid_y // self.region_size))
+    
+    def rebuild_region(self, region_x, region_y):
+        size = self.region_size
+        start_x = region_x * size
+        start_y = region_y * size
+        width = min(size, self.collision_data.width - start_x)
+        height = min(size, self.collision_data.height - start_y)
+        span = (1 << width) - 1
+        
+        rows = [(self.collision_data.row_mask(start_y + y) >> start_x) & span for y in range(height)]
+        rects = []
+        
+        for y in range(height):
+            while rows[y]:
+                bits = rows[y]
+                x = (bits & -bits).bit_length() - 1
+                run = bits >> x
+                run_width = ((run + 1) & ~run).bit_length() - 1
+                run_mask = ((1 << run_width) - 1) << x
+                
+                bottom = y + 1
+                while bottom < height and rows[bottom] & run_mask == run_mask:
+                    bottom += 1
+                
+                for row in range(y, bottom):
+                    rows[row] &= ~run_mask
+                
+                rects.append(pygame.Rect((start_x + x) * self.tile_size, (start_y + y) * self.tile_size,
+                                         run_width * self.tile_size, (bottom - y) * self.tile_size))
+        
+        self.rebuild_count += 1
+        self.built_regions.add((region_x, region_y))
+        if rects:
+            self.regions[(region_x, region_y)] = rects
+        else:
+            self.regions.pop((region_x, region_y), None)
+    
+    def region_rects(self, region_x, region_y):
+        key = (region_x, region_y)
+        if key not in self.built_regions:
+            if not (0 <= region_x < self.regions_x and 0 <= region_y < self.regions_y):
+                return None
+            self.rebuild_region(region_x, region_y)
+        return self.regions.get(key)
+    
+    def query(self, rect):
+        results = self.results
+        results.clear()
+        if self.collision_data is None:
+            return results
+        
+        region_pixels = self.region_size * self.tile_size
+        start_x = max(0, rect.left // region_pixels)
+        end_x = (rect.right - 1) // region_pixels
+        start_y = max(0, rect.top // region_pixels)
+        end_y = (rect.bottom - 1) // region_pixels
+        
+        for region_y in range(start_y, end_y + 1):
+            for region_x in range(start_x, end_x + 1):
+                rects = self.region_rects(region_x, region_y)
+                if rects:
+                    for solid in rects:
+                        if rect.colliderect(solid):
+                            results.append(solid)
+        return results
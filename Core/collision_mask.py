@@ -0,0 +1,170 @@
+class CollisionMask:
+    def __init__(self, region_size=16):
+        self.region_size = region_size
+        self.width = 0
+        self.height = 0
+        self.row_masks = []
+        self.column_masks = []
+        self.built_regions = set()
+    
+    def build(self, collision_data):
+        self.width = collision_data.width
+        self.height = collision_data.height
+        self.row_masks = [collision_data.row_mask(y) for y in range(self.height)]
+        self.column_masks = [0] * self.width
+        self.built_regions.clear()
+    
+    def build_columns(self, region_x):
+        start = region_x * self.region_size
+        span = (1 << min(self.region_size, self.width - start)) - 1
+        column_masks = self.column_masks
+        
+        for y, mask in enumerate(self.row_masks):
+            mask = (mask >> start) & span
+            if not mask:
+                continue
+            bit = 1 << y
+            while mask:
+                low_bit = mask & -mask
+                column_masks[start + low_bit.bit_length() - 1] |= bit
+                mask ^= low_bit
+        self.built_regions.add(region_x)
+    
+    def ensure_columns(self, x0, x1):
+        for region_x in range(x0 // self.region_size, x1 // self.region_size + 1):
+            if region_x not in self.built_regions:
+                self.build_columns(region_x)
+    
+    def clear(self):
+        self.width = 0
+        self.height = 0
+        self.row_masks = []
+        self.column_masks = []
+        self.built_regions.clear()
+    
+    def set_cell(self, x, y, solid):
+        if solid:
+            self.row_masks[y] |= 1 << x
+        else:
+            self.row_masks[y] &= ~(1 << x)
+        if x // self.region_size in self.built_regions:
+            if solid:
+                self.column_masks[x] |= 1 << y
+            else:
+                self.column_masks[x] &= ~(1 << y)
+    
+    def is_solid(self, x, y):
+        return self.row_masks[y] >> x & 1 == 1
+    
+    def clip_span(self, x0, y0, x1, y1):
+        if x0 < 0:
+            x0 = 0
+        if y0 < 0:
+            y0 = 0
+        if x1 >= self.width:
+            x1 = self.width - 1
+        if y1 >= self.height:
+            y1 = self.height - 1
+        return x0, y0, x1, y1
+    
+    def any_in_span(self, x0, y0, x1, y1):
+        x0, y0, x1, y1 = self.clip_span(x0, y0, x1, y1)
+        if x1 < x0 or y1 < y0:
+            return False
+        
+        if x1 - x0 < y1 - y0:
+            self.ensure_columns(x0, x1)
+            span = ((1 << (y1 - y0 + 1)) - 1) << y0
+            for mask in self.column_masks[x0:x1 + 1]:
+                if mask & span:
+                    return True
+            return False
+        
+        span = ((1 << (x1 - x0 + 1)) - 1) << x0
+        for mask in self.row_masks[y0:y1 + 1]:
+            if mask & span:
+                return True
+        return False
+    
+    def first_in_span(self, x0, y0, x1, y1):
+        x0, y0, x1, y1 = self.clip_span(x0, y0, x1, y1)
+        if x1 < x0 or y1 < y0:
+            return None
+        
+        span = ((1 << (x1 - x0 + 1)) - 1) << x0
+        for y in range(y0, y1 + 1):
+            mask = self.row_masks[y] & span
+            if mask:
+                return (mask & -mask).bit_length() - 1, y
+        return None
+    
+    def combined_rows(self, y0, y1):
+        if y0 < 0:
+            y0 = 0
+        if y1 >= self.height:
+            y1 = self.height - 1
+        row_masks = self.row_masks
+        combined = 0
+        for y in range(y0, y1 + 1):
+            combined |= row_masks[y]
+        return combined
+    
+    def combined_columns(self, x0, x1):
+        if x0 < 0:
+            x0 = 0
+        if x1 >= self.width:
+            x1 = self.width - 1
+        self.ensure_columns(x0, x1)
+        column_masks = self.column_masks
+        combined = 0
+        for x in range(x0, x1 + 1):
+            combined |= column_masks[x]
+        return combined
+    
+    def first_right(self, start, end, y0, y1):
+        if start < 0:
+            start = 0
+        if end >= self.width:
+            end = self.width - 1
+        if end < start:
+            return None
+        mask = (self.combined_rows(y0, y1) >> start) & ((1 << (end - start + 1)) - 1)
+        if not mask:
+            return None
+        return start + (mask & -mask).bit_length() - 1
+    
+    def first_left(self, start, end, y0, y1):
+        if start >= self.width:
+            start = self.width - 1
+        if end < 0:
+            end = 0
+        if start < end:
+            return None
+        mask = self.combined_rows(y0, y1) & (((1 << (start - end + 1)) - 1) << end)
+        if not mask:
+            return None
+        return mask.bit_length() - 1
+    
+    def first_down(self, start, end, x0, x1):
+        if start < 0:
+            start = 0
+        if end >= self.height:
+            end = self.height - 1
+        if end < start:
+            return None
+        mask = (self.combined_columns(x0, x1) >> start) & ((1 << (end - start + 1)) - 1)
+        if not mask:
+            return None
+        return start + (mask & -mask).bit_length() - 1
+    
+    def first_up(self, start, end, x0, x1):
+        if start >= self.height:
+            start = self.height - 1
+        if end < 0:
+            end = 0
+        if start < end:
+            return None
+        mask = self.combined_columns(x0, x1) & (((1 << (start - end + 1)) - 1) << end)
+        if not mask:
+            return None
+        return mask.bit_length() - 1
@@ -1,66 +1,181 @@
 import pygame
+import math
+import time
+from Core.broadphase import SpatialHash
 
 class CollisionSystem:
-    def __init__(self):
+    MODES = ("discrete", "swept")
+    
+    def __init__(self, mode="discrete"):
         self.debug_enabled = False
         self.collision_rects = []
+        self.probe_rect = pygame.Rect(0, 0, 0, 0)
+        self.contacts = []
+        self.broadphase = SpatialHash()
+        self.timing = False
+        self.frame_time = 0.0
+        self.set_mode(mode)
         
     def enable_debug(self, enabled=True):
         self.debug_enabled = enabled
         
+    def set_mode(self, mode):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown collision mode: {mode}")
+        self.mode = mode
+        
+    def register_entity(self, entity, x, y, width, height):
+        self.broadphase.insert(entity, x, y, width, height)
+        
+    def unregister_entity(self, entity):
+        self.broadphase.remove(entity)
+        
+    def update_entity(self, entity, x, y, width, height):
+        self.broadphase.update(entity, x, y, width, height)
+        
+    def query_region(self, rect):
+        return self.broadphase.query_region(rect.left, rect.top, rect.right, rect.bottom)
+        
+    def find_entity_pairs(self):
+        return self.broadphase.query_pairs()
+        
+    def begin_frame(self):
+        self.broadphase.stats.reset()
+        self.frame_time = 0.0
+        
     def check_horizontal_collision(self, entity, tilemap, dt):
         entity.x += entity.vel_x * dt
         
         entity_rect = entity.get_rect()
-        collision_tiles = tilemap.get_collision_tiles_in_rect(entity_rect)
-        
-        for tile_rect in collision_tiles:
-            if entity_rect.colliderect(tile_rect):
-                if entity.vel_x > 0:
-                    entity.x = tile_rect.left - entity.width
-                elif entity.vel_x < 0:
-                    entity.x = tile_rect.right
-                entity.vel_x = 0
-                break
+        tile_rect = tilemap.first_collision_tile(entity_rect)
+        
+        if tile_rect:
+            if entity.vel_x > 0:
+                entity.x = tile_rect.left - entity.width
+            elif entity.vel_x < 0:
+                entity.x = tile_rect.right
+            entity.vel_x = 0
                 
     def check_vertical_collision(self, entity, tilemap, dt):
         entity.y += entity.vel_y * dt
         
         entity_rect = entity.get_rect()
-        collision_tiles = tilemap.get_collision_tiles_in_rect(entity_rect)
+        tile_rect = tilemap.first_collision_tile(entity_rect)
         
         entity.on_ground = False
         
-        for tile_rect in collision_tiles:
-            if entity_rect.colliderect(tile_rect):
-                if entity.vel_y > 0:
-                    entity.y = tile_rect.top - entity.height
-                    entity.vel_y = 0
-                    entity.on_ground = True
-                    entity.is_jumping = False
-                    entity.jump_time = 0
-                elif entity.vel_y < 0:
-                    entity.y = tile_rect.bottom
-                    entity.vel_y = 0
-                    entity.is_jumping = False
-                break
+        if tile_rect:
+            if entity.vel_y > 0:
+                entity.y = tile_rect.top - entity.height
+                entity.vel_y = 0
+                entity.on_ground = True
+                entity.is_jumping = False
+                entity.jump_time = 0
+            elif entity.vel_y < 0:
+                entity.y = tile_rect.bottom
+                entity.vel_y = 0
+                entity.is_jumping = False
         
         if not entity.on_ground and entity.vel_y == 0:
-            check_rect = pygame.Rect(entity.x, entity.y + 1, entity.width, entity.height)
-            ground_check = tilemap.get_collision_tiles_in_rect(check_rect)
-            for tile_rect in ground_check:
-                check_bottom = pygame.Rect(entity.x, entity.y + entity.height, entity.width, 1)
-                if check_bottom.colliderect(tile_rect):
-                    entity.on_ground = True
-                    entity.vel_y = 0
-                    break
+            self.probe_rect.update(entity.x, entity.y + entity.height, entity.width, 1)
+            if tilemap.any_collision_in_rect(self.probe_rect):
+                entity.on_ground = True
+                entity.vel_y = 0
                 
         if self.debug_enabled:
-            self.collision_rects = collision_tiles
+            self.collision_rects = list(tilemap.get_collision_rects_in_rect(entity_rect.inflate(2, 2)))
             
+    def sweep_horizontal(self, entity, tilemap, dx):
+        tile_size = tilemap.tile_size
+        top = int(entity.y)
+        band_start = top // tile_size
+        band_end = (top + entity.height - 1) // tile_size
+        
+        if dx > 0:
+            edge = entity.x + entity.width
+            col = tilemap.first_solid_between("right", int(edge // tile_size), math.ceil((edge + dx) / tile_size) - 1, band_start, band_end)
+            if col is None:
+                entity.x += dx
+                return
+            entity.x = col * tile_size - entity.width
+            self.contacts.append((-1, 0, max(0.0, (col * tile_size - edge) / dx)))
+        else:
+            edge = entity.x
+            col = tilemap.first_solid_between("left", math.ceil(edge / tile_size) - 1, int((edge + dx) // tile_size), band_start, band_end)
+            if col is None:
+                entity.x += dx
+                return
+            entity.x = (col + 1) * tile_size
+            self.contacts.append((1, 0, max(0.0, ((col + 1) * tile_size - edge) / dx)))
+        entity.vel_x = 0
+        
+    def sweep_vertical(self, entity, tilemap, dy):
+        tile_size = tilemap.tile_size
+        left = int(entity.x)
+        band_start = left // tile_size
+        band_end = (left + entity.width - 1) // tile_size
+        
+        if dy > 0:
+            edge = entity.y + entity.height
+            row = tilemap.first_solid_between("down", int(edge // tile_size), math.ceil((edge + dy) / tile_size) - 1, band_start, band_end)
+            if row is None:
+                entity.y += dy
+                return
+            entity.y = row * tile_size - entity.height
+            entity.on_ground = True
+            entity.jump_time = 0
+            self.contacts.append((0, -1, max(0.0, (row * tile_size - edge) / dy)))
+        else:
+            edge = entity.y
+            row = tilemap.first_solid_between("up", math.ceil(edge / tile_size) - 1, int((edge + dy) // tile_size), band_start, band_end)
+            if row is None:
+                entity.y += dy
+                return
+            entity.y = (row + 1) * tile_size
+            self.contacts.append((0, 1, max(0.0, ((row + 1) * tile_size - edge) / dy)))
+        entity.vel_y = 0
+        entity.is_jumping = False
+        
+    def sweep_entity(self, entity, tilemap, dt):
+        self.contacts.clear()
+        
+        dx = entity.vel_x * dt
+        if dx:
+            self.sweep_horizontal(entity, tilemap, dx)
+        
+        entity.on_ground = False
+        dy = entity.vel_y * dt
+        if dy:
+            self.sweep_vertical(entity, tilemap, dy)
+        
+        if not entity.on_ground and entity.vel_y == 0:
+            tile_size = tilemap.tile_size
+            left = int(entity.x)
+            if tilemap.any_solid_in_cells(left // tile_size, int(entity.y + entity.height) // tile_size, (left + entity.width - 1) // tile_size, int(entity.y + entity.height) // tile_size):
+                entity.on_ground = True
+        
+        if self.debug_enabled:
+            self.collision_rects = list(tilemap.get_collision_rects_in_rect(entity.get_rect().inflate(2, 2)))
+        
+        return self.contacts
+        
     def handle_entity_collision(self, entity, tilemap, dt):
-        self.check_horizontal_collision(entity, tilemap, dt)
-        self.check_vertical_collision(entity, tilemap, dt)
+        if not self.timing:
+            self.resolve_entity(entity, tilemap, dt)
+            return
+        start = time.perf_counter()
+        self.resolve_entity(entity, tilemap, dt)
+        self.frame_time += time.perf_counter() - start
+        
+    def resolve_entity(self, entity, tilemap, dt):
+        if tilemap.stream and not tilemap.is_region_loaded(entity.get_rect().inflate(abs(entity.vel_x * dt) * 2 + 2, abs(entity.vel_y * dt) * 2 + 2)):
+            return
+        
+        if self.mode == "swept":
+            self.sweep_entity(entity, tilemap, dt)
+        else:
+            self.check_horizontal_collision(entity, tilemap, dt)
+            self.check_vertical_collision(entity, tilemap, dt)
         
     def render_debug(self, screen, camera_x=0, camera_y=0):
         if not self.debug_enabled:
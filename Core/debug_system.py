@@ -1,48 +1,101 @@
+import time
 import pygame
+from Core.text_cache import TextCache, GlyphAtlas
+
+GRID_KEY = (255, 0, 255)
 
 class DebugSystem:
-    def __init__(self):
+    def __init__(self, refresh_rate=10):
         self.enabled = False
         self.font = None
         self.info_lines = []
+        self.text_cache = TextCache()
+        self.glyphs = None
+        self.refresh_rate = refresh_rate
+        self.next_refresh = 0.0
+        self.next_fps_refresh = 0.0
+        self.fps_surface = None
+        self.line_texts = []
+        self.line_blits = []
+        self.rendered_lines = None
+        self.line_renders = 0
+        self.grid_key = None
+        self.grid_surface = None
         
     def enable(self, enabled=True):
         self.enabled = enabled
         if self.enabled and not self.font:
             pygame.font.init()
             self.font = pygame.font.Font(None, 16)
+            self.glyphs = GlyphAtlas(self.font)
+        self.next_refresh = 0.0
+        self.next_fps_refresh = 0.0
             
     def toggle(self):
         self.enable(not self.enabled)
         
+    def refresh_interval(self):
+        return 1.0 / self.refresh_rate if self.refresh_rate else 0.0
+        
+    def wants_info(self):
+        return self.enabled and time.perf_counter() >= self.next_refresh
+        
     def add_info(self, label, value):
         if self.enabled:
             self.info_lines.append(f"{label}: {value}")
             
     def clear_info(self):
         self.info_lines = []
+        self.next_refresh = time.perf_counter() + self.refresh_interval()
+        
+    def build_line(self, text):
+        label, separator, value = text.partition(": ")
+        label_surface = self.text_cache.render(self.font, label + separator)
+        label_width = label_surface.get_width()
+        
+        surface = pygame.Surface((label_width + self.glyphs.width(value) + 4, self.font.get_height() + 2))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill((0, 0, 0))
+        surface.blit(label_surface, (2, 1))
+        self.glyphs.draw(surface, value, (2 + label_width, 1))
+        self.line_renders += 1
+        return surface
+        
+    def refresh_lines(self):
+        if self.rendered_lines is self.info_lines:
+            return
+        self.rendered_lines = self.info_lines
+        
+        del self.line_texts[len(self.info_lines):]
+        del self.line_blits[len(self.info_lines):]
+        y_offset = 5
+        for index, line in enumerate(self.info_lines):
+            if index == len(self.line_texts):
+                self.line_texts.append(None)
+                self.line_blits.append(None)
+            if self.line_texts[index] != line:
+                self.line_texts[index] = line
+                self.line_blits[index] = (self.build_line(line), (5, y_offset))
+            y_offset += 18
         
     def render_info(self, screen):
         if not self.enabled or not self.font:
             return
             
-        y_offset = 5
-        for line in self.info_lines:
-            text_surface = self.font.render(line, False, (255, 255, 255))
-            
-            bg_rect = pygame.Rect(5, y_offset, text_surface.get_width() + 4, text_surface.get_height() + 2)
-            pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
-            
-            screen.blit(text_surface, (7, y_offset + 1))
-            y_offset += 18
+        self.refresh_lines()
+        screen.blits(self.line_blits, doreturn=False)
             
     def render_fps(self, screen, clock):
         if not self.enabled or not self.font:
             return
             
-        fps = int(clock.get_fps())
-        fps_text = f"FPS: {fps}"
-        text_surface = self.font.render(fps_text, False, (255, 255, 255))
+        now = time.perf_counter()
+        if self.fps_surface is None or now >= self.next_fps_refresh:
+            self.next_fps_refresh = now + self.refresh_interval()
+            fps = int(clock.get_fps())
+            self.fps_surface = self.text_cache.render(self.font, f"FPS: {fps}")
+        text_surface = self.fps_surface
         
         screen_width = screen.get_width()
         x_pos = screen_width - text_surface.get_width() - 7
@@ -52,22 +105,34 @@ class DebugSystem:
         
         screen.blit(text_surface, (x_pos, 7))
         
+    def build_grid(self, width, height, tile_size):
+        surface = pygame.Surface((width + tile_size, height + tile_size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(GRID_KEY)
+        
+        x = 0
+        while x < surface.get_width():
+            pygame.draw.line(surface, (100, 100, 100, 50), (x, 0), (x, surface.get_height()))
+            x += tile_size
+            
+        y = 0
+        while y < surface.get_height():
+            pygame.draw.line(surface, (100, 100, 100, 50), (0, y), (surface.get_width(), y))
+            y += tile_size
+        
+        surface.set_colorkey(GRID_KEY, pygame.RLEACCEL)
+        return surface
+        
     def render_grid(self, screen, tile_size, camera_x=0, camera_y=0):
         if not self.enabled:
             return
             
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
+        key = (screen.get_size(), tile_size)
+        if self.grid_key != key:
+            self.grid_key = key
+            self.grid_surface = self.build_grid(screen.get_width(), screen.get_height(), tile_size)
         
         start_x = int(camera_x // tile_size) * tile_size - camera_x
         start_y = int(camera_y // tile_size) * tile_size - camera_y
-        
-        x = start_x
-        while x < screen_width:
-            pygame.draw.line(screen, (100, 100, 100, 50), (x, 0), (x, screen_height))
-            x += tile_size
-            
-        y = start_y
-        while y < screen_height:
-            pygame.draw.line(screen, (100, 100, 100, 50), (0, y), (screen_width, y))
-            y += tile_size
\ No newline at end of file
+        screen.blit(self.grid_surface, (start_x, start_y))
@@ -0,0 +1,295 @@
+import sys
+import time
+import pygame
+from array import array
+
+class ComponentStore:
+    def __init__(self, fields):
+        self.typecodes = dict(fields)
+        self.columns = {name: array(code) if code else [] for name, code in self.typecodes.items()}
+        self.entities = array('l')
+        self.sparse = array('l')
+    
+    def __len__(self):
+        return len(self.entities)
+    
+    def __contains__(self, entity):
+        return entity < len(self.sparse) and self.sparse[entity] >= 0
+    
+    def index_of(self, entity):
+        if entity < len(self.sparse):
+            return self.sparse[entity]
+        return -1
+    
+    def add(self, entity, **values):
+        if entity in self:
+            for name, value in values.items():
+                self.set(entity, name, value)
+            return
+        if entity >= len(self.sparse):
+            self.sparse.extend([-1] * (entity + 1 - len(self.sparse)))
+        self.sparse[entity] = len(self.entities)
+        self.entities.append(entity)
+        for name, column in self.columns.items():
+            column.append(values.get(name, 0 if self.typecodes[name] else None))
+    
+    def remove(self, entity):
+        index = self.index_of(entity)
+        if index < 0:
+            return
+        self.sparse[entity] = -1
+        last = len(self.entities) - 1
+        if index != last:
+            moved = self.entities[last]
+            self.entities[index] = moved
+            self.sparse[moved] = index
+            for column in self.columns.values():
+                column[index] = column[last]
+        self.entities.pop()
+        for column in self.columns.values():
+            column.pop()
+    
+    def get(self, entity, name):
+        return self.columns[name][self.sparse[entity]]
+    
+    def set(self, entity, name, value):
+        self.columns[name][self.sparse[entity]] = value
+    
+    def column(self, name):
+        return self.columns[name]
+    
+    def nbytes(self):
+        total = 0
+        for column in (self.entities, self.sparse, *self.columns.values()):
+            if isinstance(column, array):
+                total += column.buffer_info()[1] * column.itemsize
+            else:
+                total += sys.getsizeof(column)
+        return total
+
+class EntityWorld:
+    def __init__(self):
+        self.next_entity = 0
+        self.free_entities = []
+        self.alive = bytearray()
+        self.count = 0
+        self.stores = {}
+        self.systems = []
+        self.render_systems = []
+        self.system_times = {}
+        self.drawn_rects = []
+        
+        self.define("transform", {"x": "d", "y": "d", "prev_x": "d", "prev_y": "d"})
+        self.define("motion", {"vel_x": "d", "vel_y": "d"})
+        self.define("body", {"width": "l", "height": "l"})
+        self.define("contact", {"on_ground": "b", "is_jumping": "b", "jump_time": "d"})
+        self.define("gravity", {"gravity": "d", "max_fall_speed": "d"})
+        self.define("sprite", {"surface": None})
+    
+    def define(self, name, fields):
+        store = self.stores.get(name)
+        if store is None:
+            store = ComponentStore(fields)
+            self.stores[name] = store
+        return store
+    
+    def __len__(self):
+        return self.count
+    
+    def is_alive(self, entity):
+        return 0 <= entity < len(self.alive) and self.alive[entity] == 1
+    
+    def create_entity(self):
+        if self.free_entities:
+            entity = self.free_entities.pop()
+        else:
+            entity = self.next_entity
+            self.next_entity += 1
+            self.alive.append(0)
+        self.alive[entity] = 1
+        self.count += 1
+        return entity
+    
+    def destroy_entity(self, entity):
+        if not self.is_alive(entity):
+            return
+        for store in self.stores.values():
+            store.remove(entity)
+        self.alive[entity] = 0
+        self.count -= 1
+        self.free_entities.append(entity)
+    
+    def spawn_body(self, x, y, width, height, surface=None, vel_x=0, vel_y=0, gravity=800, max_fall_speed=300):
+        entity = self.create_entity()
+        self.stores["transform"].add(entity, x=x, y=y, prev_x=x, prev_y=y)
+        self.stores["motion"].add(entity, vel_x=vel_x, vel_y=vel_y)
+        self.stores["body"].add(entity, width=width, height=height)
+        self.stores["contact"].add(entity)
+        self.stores["gravity"].add(entity, gravity=gravity, max_fall_speed=max_fall_speed)
+        if surface is not None:
+            self.stores["sprite"].add(entity, surface=surface)
+        return entity
+    
+    def add_system(self, name, system):
+        self.systems.append((name, system))
+    
+    def add_render_system(self, name, system):
+        self.render_systems.append((name, system))
+    
+    def store_previous(self):
+        transform = self.stores["transform"]
+        transform.columns["prev_x"][:] = transform.columns["x"]
+        transform.columns["prev_y"][:] = transform.columns["y"]
+    
+    def update(self, dt, keys=None, collision_system=None, tilemap=None):
+        self.store_previous()
+        times = self.system_times
+        for name, system in self.systems:
+            start = time.perf_counter()
+            system.update(self, dt, keys, collision_system, tilemap)
+            times[name] = time.perf_counter() - start
+    
+    def render(self, screen, camera_x=0, camera_y=0, alpha=1.0):
+        times = self.system_times
+        self.drawn_rects.clear()
+        for name, system in self.render_systems:
+            start = time.perf_counter()
+            rects = system.render(self, screen, camera_x, camera_y, alpha)
+            if rects:
+                self.drawn_rects.extend(rects)
+            times[name] = time.perf_counter() - start
+    
+    def memory_report(self):
+        store_bytes = {name: store.nbytes() for name, store in self.stores.items()}
+        total = sum(store_bytes.values()) + sys.getsizeof(self.alive) + sys.getsizeof(self.free_entities)
+        count = self.count
+        return total, count, total / count if count else 0.0, store_bytes
+
+class BodyCursor:
+    __slots__ = ("x", "y", "vel_x", "vel_y", "width", "height", "on_ground", "is_jumping", "jump_time")
+    
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+class PlayerControlSystem:
+    def update(self, world, dt, keys, collision_system, tilemap):
+        players = world.stores.get("player")
+        if not players or keys is None:
+            return
+        for controller in list(players.column("controller")):
+            controller.update(keys, dt, collision_system, tilemap)
+
+class PhysicsSystem:
+    def __init__(self):
+        self.cursor = BodyCursor()
+    
+    def update(self, world, dt, keys, collision_system, tilemap):
+        stores = world.stores
+        gravity_store = stores["gravity"]
+        if not gravity_store:
+            return
+        
+        transform = stores["transform"]
+        motion = stores["motion"]
+        body = stores["body"]
+        contact = stores["contact"]
+        xs = transform.column("x")
+        ys = transform.column("y")
+        vel_xs = motion.column("vel_x")
+        vel_ys = motion.column("vel_y")
+        widths = body.column("width")
+        heights = body.column("height")
+        grounded = contact.column("on_ground")
+        jumping = contact.column("is_jumping")
+        jump_times = contact.column("jump_time")
+        gravities = gravity_store.column("gravity")
+        fall_limits = gravity_store.column("max_fall_speed")
+        transform_slots = transform.sparse
+        motion_slots = motion.sparse
+        body_slots = body.sparse
+        contact_slots = contact.sparse
+        cursor = self.cursor
+        
+        for index, entity in enumerate(gravity_store.entities):
+            t = transform_slots[entity]
+            m = motion_slots[entity]
+            b = body_slots[entity]
+            c = contact_slots[entity]
+            
+            vel_y = vel_ys[m]
+            if not grounded[c]:
+                vel_y = min(vel_y + gravities[index] * dt, fall_limits[index])
+            
+            cursor.x = xs[t]
+            cursor.y = ys[t]
+            cursor.vel_x = vel_xs[m]
+            cursor.vel_y = vel_y
+            cursor.width = widths[b]
+            cursor.height = heights[b]
+            cursor.on_ground = grounded[c]
+            cursor.is_jumping = jumping[c]
+            cursor.jump_time = jump_times[c]
+            
+            if collision_system and tilemap:
+                collision_system.handle_entity_collision(cursor, tilemap, dt)
+            else:
+                cursor.x += cursor.vel_x * dt
+                cursor.y += cursor.vel_y * dt
+            
+            xs[t] = cursor.x
+            ys[t] = cursor.y
+            vel_xs[m] = cursor.vel_x
+            vel_ys[m] = cursor.vel_y
+            grounded[c] = cursor.on_ground
+            jumping[c] = cursor.is_jumping
+            jump_times[c] = cursor.jump_time
+            
+            if collision_system and entity in collision_system.broadphase:
+                collision_system.update_entity(entity, cursor.x, cursor.y, cursor.width, cursor.height)
+
+class SpriteRenderSystem:
+    def __init__(self):
+        self.batch = []
+        self.drawn = 0
+    
+    def render(self, world, screen, camera_x, camera_y, alpha=1.0):
+        stores = world.stores
+        sprites = stores["sprite"]
+        transform = stores["transform"]
+        xs = transform.column("x")
+        ys = transform.column("y")
+        prev_xs = transform.column("prev_x")
+        prev_ys = transform.column("prev_y")
+        screen_width = screen.get_width()
+        screen_height = screen.get_height()
+        batch = self.batch
+        batch.clear()
+        
+        for entity, surface in zip(sprites.entities, sprites.column("surface")):
+            t = transform.index_of(entity)
+            if t < 0:
+                continue
+            x = xs[t]
+            y = ys[t]
+            if alpha < 1.0:
+                x = prev_xs[t] + (x - prev_xs[t]) * alpha
+                y = prev_ys[t] + (y - prev_ys[t]) * alpha
+            screen_x = int(x - camera_x)
+            screen_y = int(y - camera_y)
+            if screen_x >= screen_width or screen_y >= screen_height:
+                continue
+            if screen_x + surface.get_width() <= 0 or screen_y + surface.get_height() <= 0:
+                continue
+            batch.append((surface, (screen_x, screen_y)))
+        
+        self.drawn = len(batch)
+        if batch:
+            return screen.blits(batch)
+        return None
+
+def create_default_world():
+    world = EntityWorld()
+    world.add_system("player", PlayerControlSystem())
+    world.add_system("physics", PhysicsSystem())
+    world.add_render_system("sprites", SpriteRenderSystem())
+    return world
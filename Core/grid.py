@@ -0,0 +1,238 @@
+from array import array
+
+class TileGrid:
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        if cells is None:
+            cells = array('H', bytes(width * height * 2))
+        self.cells = cells
+    
+    @classmethod
+    def from_rows(cls, rows, width, height):
+        grid = cls(width, height)
+        for y, row in enumerate(rows[:height]):
+            row = row[:width]
+            start = y * width
+            grid.cells[start:start + len(row)] = array('H', row)
+        return grid
+    
+    @property
+    def nbytes(self):
+        return self.width * self.height * 2
+    
+    def __len__(self):
+        return self.height
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            y, x = key
+            return self.cells[y * self.width + x]
+        return self.row(key)
+    
+    def __setitem__(self, key, value):
+        y, x = key
+        self.cells[y * self.width + x] = value
+    
+    def get(self, x, y):
+        return self.cells[y * self.width + x]
+    
+    def set(self, x, y, value):
+        self.cells[y * self.width + x] = value
+    
+    def row(self, y):
+        start = y * self.width
+        return memoryview(self.cells)[start:start + self.width]
+    
+    def region(self, x, y, width, height):
+        return GridRegion(self, x, y, width, height)
+    
+    def any_in_region(self, x, y, width, height):
+        for row_y in range(y, y + height):
+            if any(self.row(row_y)[x:x + width]):
+                return True
+        return False
+    
+    def count_in_region(self, x, y, width, height):
+        count = 0
+        for row_y in range(y, y + height):
+            count += width - self.row(row_y)[x:x + width].tolist().count(0)
+        return count
+    
+    def cells_in_region(self, x, y, width, height):
+        for row_y in range(y, y + height):
+            row = self.row(row_y)
+            for cell_x in range(x, x + width):
+                value = row[cell_x]
+                if value:
+                    yield cell_x, row_y, value
+    
+    def fill_region(self, x, y, width, height, value):
+        for row_y in range(y, y + height):
+            start = row_y * self.width + x
+            self.cells[start:start + width] = array('H', [value]) * width
+    
+    def resized(self, width, height):
+        grid = TileGrid(width, height)
+        copy_width = min(self.width, width)
+        for y in range(min(self.height, height)):
+            grid.cells[y * width:y * width + copy_width] = array('H', self.row(y)[:copy_width])
+        return grid
+    
+    def copy(self):
+        return TileGrid(self.width, self.height, array('H', self.cells))
+    
+    def tolist(self):
+        return [self.row(y).tolist() for y in range(self.height)]
+
+class BitGrid:
+    def __init__(self, width, height, bits=None):
+        self.width = width
+        self.height = height
+        self.stride = (width + 7) // 8
+        if bits is None:
+            bits = bytearray(self.stride * height)
+        self.bits = bits
+    
+    @classmethod
+    def from_rows(cls, rows, width, height):
+        grid = cls(width, height)
+        for y, row in enumerate(rows[:height]):
+            mask = 0
+            for x, value in enumerate(row[:width]):
+                if value:
+                    mask |= 1 << x
+            grid.set_row_mask(y, mask)
+        return grid
+    
+    @property
+    def nbytes(self):
+        return self.stride * self.height
+    
+    def __len__(self):
+        return self.height
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            y, x = key
+            return self.get(x, y)
+        return BitRow(self, key)
+    
+    def __setitem__(self, key, value):
+        y, x = key
+        self.set(x, y, value)
+    
+    def get(self, x, y):
+        return bool(self.bits[y * self.stride + (x >> 3)] >> (x & 7) & 1)
+    
+    def set(self, x, y, value):
+        index = y * self.stride + (x >> 3)
+        if value:
+            self.bits[index] |= 1 << (x & 7)
+        else:
+            self.bits[index] &= ~(1 << (x & 7)) & 0xFF
+    
+    def row(self, y):
+        start = y * self.stride
+        return memoryview(self.bits)[start:start + self.stride]
+    
+    def row_mask(self, y):
+        return int.from_bytes(self.row(y), 'little')
+    
+    def set_row_mask(self, y, mask):
+        start = y * self.stride
+        self.bits[start:start + self.stride] = mask.to_bytes(self.stride, 'little')
+    
+    def region(self, x, y, width, height):
+        return GridRegion(self, x, y, width, height)
+    
+    def any_in_region(self, x, y, width, height):
+        span = ((1 << width) - 1) << x
+        for row_y in range(y, y + height):
+            if self.row_mask(row_y) & span:
+                return True
+        return False
+    
+    def count_in_region(self, x, y, width, height):
+        span = ((1 << width) - 1) << x
+        count = 0
+        for row_y in range(y, y + height):
+            count += bin(self.row_mask(row_y) & span).count('1')
+        return count
+    
+    def cells_in_region(self, x, y, width, height):
+        span = ((1 << width) - 1) << x
+        for row_y in range(y, y + height):
+            mask = self.row_mask(row_y) & span
+            while mask:
+                low_bit = mask & -mask
+                yield low_bit.bit_length() - 1, row_y
+                mask ^= low_bit
+    
+    def fill_region(self, x, y, width, height, value):
+        span = ((1 << width) - 1) << x
+        for row_y in range(y, y + height):
+            mask = self.row_mask(row_y)
+            self.set_row_mask(row_y, mask | span if value else mask & ~span)
+    
+    def resized(self, width, height):
+        grid = BitGrid(width, height)
+        keep = (1 << min(self.width, width)) - 1
+        for y in range(min(self.height, height)):
+            grid.set_row_mask(y, self.row_mask(y) & keep)
+        return grid
+    
+    def copy(self):
+        return BitGrid(self.width, self.height, bytearray(self.bits))
+    
+    def tolist(self):
+        return [[self.get(x, y) for x in range(self.width)] for y in range(self.height)]
+
+class BitRow:
+    def __init__(self, grid, y):
+        self.grid = grid
+        self.y = y
+    
+    def __len__(self):
+        return self.grid.width
+    
+    def __getitem__(self, x):
+        return self.grid.get(x, self.y)
+    
+    def __setitem__(self, x, value):
+        self.grid.set(x, self.y, value)
+    
+    def tolist(self):
+        return [self.grid.get(x, self.y) for x in range(self.grid.width)]
+
+class GridRegion:
+    def __init__(self, grid, x, y, width, height):
+        self.grid = grid
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+    
+    def __getitem__(self, key):
+        y, x = key
+        return self.grid.get(self.x + x, self.y + y)
+    
+    def __setitem__(self, key, value):
+        y, x = key
+        self.grid.set(self.x + x, self.y + y, value)
+    
+    def any(self):
+        return self.grid.any_in_region(self.x, self.y, self.width, self.height)
+    
+    def count(self):
+        return self.grid.count_in_region(self.x, self.y, self.width, self.height)
+    
+    def cells(self):
+        return self.grid.cells_in_region(self.x, self.y, self.width, self.height)
+    
+    def fill(self, value):
+        self.grid.fill_region(self.x, self.y, self.width, self.height, value)
+    
+    def tolist(self):
+        return [[self.grid.get(x, y) for x in range(self.x, self.x + self.width)]
+                for y in range(self.y, self.y + self.height)]
@@ -0,0 +1,233 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from Core.grid import TileGrid, BitGrid
+
+MAGIC = b'IASE'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIHHQQ')
+PLANE_ALIGN = 8
+
+CHUNKED_MAGIC = b'IASC'
+CHUNKED_HEADER = struct.Struct('<4sHHIIHHHHQ')
+
+class LevelFormatError(Exception):
+    pass
+
+def align(offset):
+    return (offset + PLANE_ALIGN - 1) // PLANE_ALIGN * PLANE_ALIGN
+
+class Level:
+    def __init__(self, tile_size, world_data, collision_data, viewport_width=320, viewport_height=180):
+        self.tile_size = tile_size
+        self.grid_width = world_data.width
+        self.grid_height = world_data.height
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+        self.world_data = world_data
+        self.collision_data = collision_data
+    
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+class MappedLevel(Level):
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as f:
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        
+        try:
+            header = self.read_header(filepath)
+        except LevelFormatError:
+            self.mapping.close()
+            raise
+        tile_size, grid_width, grid_height, viewport_width, viewport_height, tile_offset, collision_offset = header
+        tile_bytes = grid_width * grid_height * 2
+        collision_bytes = (grid_width + 7) // 8 * grid_height
+        
+        view = memoryview(self.mapping)
+        tile_plane = view[tile_offset:tile_offset + tile_bytes]
+        collision_plane = view[collision_offset:collision_offset + collision_bytes]
+        self.views = [view, tile_plane, collision_plane]
+        if sys.byteorder == 'little':
+            cells = tile_plane.cast('H')
+            self.views.append(cells)
+        else:
+            cells = array('H')
+            cells.frombytes(tile_plane)
+            cells.byteswap()
+        
+        world_data = TileGrid(grid_width, grid_height, cells)
+        collision_data = BitGrid(grid_width, grid_height, collision_plane)
+        super().__init__(tile_size, world_data, collision_data, viewport_width, viewport_height)
+    
+    def read_header(self, filepath):
+        if len(self.mapping) < HEADER.size:
+            raise LevelFormatError(f"{filepath}: file too small for level header")
+        
+        magic, version, tile_size, grid_width, grid_height, viewport_width, viewport_height, tile_offset, collision_offset = HEADER.unpack_from(self.mapping, 0)
+        if magic != MAGIC:
+            raise LevelFormatError(f"{filepath}: not a binary level file")
+        if version != VERSION:
+            raise LevelFormatError(f"{filepath}: unsupported level version {version}")
+        
+        tile_bytes = grid_width * grid_height * 2
+        collision_bytes = (grid_width + 7) // 8 * grid_height
+        if tile_offset + tile_bytes > len(self.mapping) or collision_offset + collision_bytes > len(self.mapping):
+            raise LevelFormatError(f"{filepath}: truncated level planes")
+        return tile_size, grid_width, grid_height, viewport_width, viewport_height, tile_offset, collision_offset
+    
+    def close(self):
+        if self.mapping.closed:
+            return
+        for view in reversed(self.views):
+            view.release()
+        self.views.clear()
+        self.mapping.close()
+
+def is_binary_level(filepath):
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+def load_binary_level(filepath):
+    return MappedLevel(filepath)
+
+def save_binary_level(filepath, level):
+    tile_offset = align(HEADER.size)
+    collision_offset = align(tile_offset + level.grid_width * level.grid_height * 2)
+    
+    header = HEADER.pack(MAGIC, VERSION, level.tile_size, level.grid_width, level.grid_height,
+                         level.viewport_width, level.viewport_height, tile_offset, collision_offset)
+    
+    cells = level.world_data.cells
+    if sys.byteorder != 'little':
+        cells = array('H', cells)
+        cells.byteswap()
+    
+    with open(filepath, 'wb') as f:
+        f.write(header)
+        f.write(bytes(tile_offset - HEADER.size))
+        f.write(cells)
+        f.write(bytes(collision_offset - tile_offset - level.grid_width * level.grid_height * 2))
+        f.write(level.collision_data.bits)
+
+def load_json_level(filepath):
+    with open(filepath, 'r') as f:
+        data = json.load(f)
+    
+    grid_width = data.get('grid_width', 100)
+    grid_height = data.get('grid_height', 100)
+    return Level(
+        data.get('tile_size', 16),
+        TileGrid.from_rows(data.get('world_data', []), grid_width, grid_height),
+        BitGrid.from_rows(data.get('collision_data', []), grid_width, grid_height),
+        data.get('viewport_width', 320),
+        data.get('viewport_height', 180)
+    )
+
+def save_json_level(filepath, level):
+    data = {
+        'tile_size': level.tile_size,
+        'grid_width': level.grid_width,
+        'grid_height': level.grid_height,
+        'viewport_width': level.viewport_width,
+        'viewport_height': level.viewport_height,
+        'world_data': level.world_data.tolist(),
+        'collision_data': level.collision_data.tolist()
+    }
+    
+    with open(filepath, 'w') as f:
+        json.dump(data, f, indent=2)
+
+class ChunkedLevelInfo:
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as f:
+            header = f.read(CHUNKED_HEADER.size)
+        
+        if len(header) < CHUNKED_HEADER.size:
+            raise LevelFormatError(f"{filepath}: file too small for chunked level header")
+        
+        magic, version, tile_size, grid_width, grid_height, viewport_width, viewport_height, chunk_size, _, data_offset = CHUNKED_HEADER.unpack(header)
+        if magic != CHUNKED_MAGIC:
+            raise LevelFormatError(f"{filepath}: not a chunked level file")
+        if version != VERSION:
+            raise LevelFormatError(f"{filepath}: unsupported level version {version}")
+        
+        self.filepath = filepath
+        self.tile_size = tile_size
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+        self.chunk_size = chunk_size
+        self.data_offset = data_offset
+        self.chunks_x = (grid_width + chunk_size - 1) // chunk_size
+        self.chunks_y = (grid_height + chunk_size - 1) // chunk_size
+        self.tile_bytes = chunk_size * chunk_size * 2
+        self.collision_bytes = chunk_size // 8 * chunk_size
+        self.chunk_bytes = self.tile_bytes + self.collision_bytes
+    
+    def chunk_offset(self, chunk_x, chunk_y):
+        return self.data_offset + (chunk_y * self.chunks_x + chunk_x) * self.chunk_bytes
+
+def is_chunked_level(filepath):
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read(len(CHUNKED_MAGIC)) == CHUNKED_MAGIC
+    except OSError:
+        return False
+
+def write_chunked_level(filepath, tile_size, grid_width, grid_height, chunk_source, chunk_size=64, viewport_width=320, viewport_height=180):
+    if chunk_size % 8:
+        raise LevelFormatError("chunk size must be a multiple of 8")
+    
+    data_offset = align(CHUNKED_HEADER.size)
+    chunks_x = (grid_width + chunk_size - 1) // chunk_size
+    chunks_y = (grid_height + chunk_size - 1) // chunk_size
+    
+    with open(filepath, 'wb') as f:
+        f.write(CHUNKED_HEADER.pack(CHUNKED_MAGIC, VERSION, tile_size, grid_width, grid_height,
+                                    viewport_width, viewport_height, chunk_size, 0, data_offset))
+        f.write(bytes(data_offset - CHUNKED_HEADER.size))
+        
+        for chunk_y in range(chunks_y):
+            for chunk_x in range(chunks_x):
+                tiles, collision = chunk_source(chunk_x, chunk_y)
+                if sys.byteorder != 'little':
+                    tiles = array('H', tiles)
+                    tiles.byteswap()
+                f.write(tiles)
+                f.write(collision)
+
+def save_chunked_level(filepath, level, chunk_size=64):
+    def chunk_source(chunk_x, chunk_y):
+        start_x = chunk_x * chunk_size
+        start_y = chunk_y * chunk_size
+        width = min(chunk_size, level.grid_width - start_x)
+        tiles = TileGrid(chunk_size, chunk_size)
+        collision = BitGrid(chunk_size, chunk_size)
+        
+        for y in range(min(chunk_size, level.grid_height - start_y)):
+            tiles.cells[y * chunk_size:y * chunk_size + width] = array('H', level.world_data.row(start_y + y)[start_x:start_x + width])
+            mask = level.collision_data.row_mask(start_y + y) >> start_x
+            collision.set_row_mask(y, mask & ((1 << width) - 1))
+        
+        return tiles.cells, collision.bits
+    
+    write_chunked_level(filepath, level.tile_size, level.grid_width, level.grid_height, chunk_source,
+                        chunk_size, level.viewport_width, level.viewport_height)
+
+def load_level(filepath):
+    if is_binary_level(filepath):
+        return load_binary_level(filepath)
+    return load_json_level(filepath)
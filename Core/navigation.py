@@ -0,0 +1,352 @@
+import heapq
+from collections import OrderedDict
+
+WALK = "walk"
+DROP = "drop"
+JUMP = "jump"
+
+class JumpEnvelope:
+    def __init__(self, tile_size, jump_force=220, gravity=800, max_speed=120, acceleration=600, max_fall_speed=300, max_jump_time=0.2, dt=1 / 60, max_drop=12):
+        self.tile_size = tile_size
+        self.max_drop = max_drop
+        self.reach = {}
+        
+        x = 0.0
+        height = 0.0
+        vel_x = 0.0
+        vel_y = 0.0
+        jump_time = 0.0
+        peak = 0.0
+        samples = []
+        while height > -max_drop * tile_size:
+            vel_x = min(vel_x + acceleration * dt, max_speed)
+            if not samples:
+                vel_y = -jump_force
+            elif jump_time < max_jump_time:
+                jump_time += dt
+                strength = 1.0 - (jump_time / max_jump_time)
+                vel_y -= jump_force * 0.8 * strength * strength * dt
+            vel_y = min(vel_y + gravity * dt, max_fall_speed)
+            x += vel_x * dt
+            height -= vel_y * dt
+            peak = max(peak, height)
+            samples.append((x, height))
+        
+        self.max_rise = int(peak // tile_size)
+        for rise in range(-max_drop, self.max_rise + 1):
+            best = 0.0
+            for sample_x, sample_height in samples:
+                if sample_height >= rise * tile_size:
+                    best = sample_x
+            self.reach[rise] = int(best // tile_size)
+        self.max_reach = max(self.reach.values())
+
+class NavGraph:
+    def __init__(self, region_size=16, max_paths=2048, field_threshold=4):
+        self.region_size = region_size
+        self.max_paths = max_paths
+        self.field_threshold = field_threshold
+        self.tilemap = None
+        self.envelope = None
+        self.width = 0
+        self.height = 0
+        self.nodes = {}
+        self.dirty_cells = []
+        
+        self.paths = OrderedDict()
+        self.goal_index = {}
+        self.region_paths = {}
+        self.unreachable = set()
+        self.reverse_edges = None
+        self.fields = {}
+        self.goal_queries = {}
+        
+        self.query_count = 0
+        self.cache_hits = 0
+        self.search_count = 0
+        self.expanded_count = 0
+        self.rebuild_count = 0
+    
+    def build(self, tilemap, player=None):
+        self.tilemap = tilemap
+        self.width = tilemap.grid_width
+        self.height = tilemap.grid_height
+        if player is None:
+            self.envelope = JumpEnvelope(tilemap.tile_size)
+        else:
+            self.envelope = JumpEnvelope(tilemap.tile_size, player.jump_force, player.gravity, player.max_speed,
+                                         player.acceleration, player.max_fall_speed, player.max_jump_time)
+        self.nodes.clear()
+        self.dirty_cells.clear()
+        self.clear_paths()
+        self.rebuild_area(0, 0, self.width - 1, self.height - 1)
+    
+    def clear_paths(self):
+        self.paths.clear()
+        self.goal_index.clear()
+        self.region_paths.clear()
+        self.unreachable.clear()
+        self.fields.clear()
+        self.goal_queries.clear()
+    
+    def solid(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.tilemap.collision_data.get(x, y)
+        return False
+    
+    def clear_cells(self, x0, y0, x1, y1):
+        return not self.tilemap.any_solid_in_cells(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+    
+    def is_standable(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height - 1 and not self.solid(x, y) and self.solid(x, y + 1)
+    
+    def node_id(self, x, y):
+        return y * self.width + x
+    
+    def node_cell(self, node):
+        return node % self.width, node // self.width
+    
+    def rebuild_area(self, x0, y0, x1, y1):
+        x0 = max(0, x0)
+        y0 = max(0, y0)
+        x1 = min(self.width - 1, x1)
+        y1 = min(self.height - 1, y1)
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                self.nodes.pop(self.node_id(x, y), None)
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                if self.is_standable(x, y):
+                    self.nodes[self.node_id(x, y)] = self.build_edges(x, y)
+        self.reverse_edges = None
+        self.fields.clear()
+        self.rebuild_count += 1
+    
+    def build_edges(self, x, y):
+        edges = []
+        envelope = self.envelope
+        
+        for direction in (-1, 1):
+            side = x + direction
+            if not (0 <= side < self.width) or self.solid(side, y):
+                continue
+            if self.is_standable(side, y):
+                edges.append((self.node_id(side, y), 1, WALK))
+                continue
+            for land in range(y + 1, min(self.height - 1, y + envelope.max_drop + 1)):
+                if self.solid(side, land):
+                    break
+                if self.is_standable(side, land):
+                    edges.append((self.node_id(side, land), 1 + land - y, DROP))
+                    break
+        
+        for rise in range(envelope.max_rise, -envelope.max_drop - 1, -1):
+            target_y = y - rise
+            if not (0 <= target_y < self.height):
+                continue
+            top = min(y, target_y) - 1
+            if top < 0 or not self.clear_cells(x, top, x, y - 1):
+                continue
+            reach = min(envelope.reach[max(rise, 1)], envelope.reach[rise])
+            for direction in (-1, 1):
+                for distance in range(1, reach + 1):
+                    target_x = x + direction * distance
+                    if not (0 <= target_x < self.width) or self.solid(target_x, top):
+                        break
+                    if rise == 0 and distance == 1 or not self.is_standable(target_x, target_y):
+                        continue
+                    if self.clear_cells(target_x, top, target_x, target_y):
+                        edges.append((self.node_id(target_x, target_y), distance + abs(rise) + 1, JUMP))
+        return edges
+    
+    def invalidate_cell(self, grid_x, grid_y):
+        self.dirty_cells.append((grid_x, grid_y))
+    
+    def refresh(self):
+        if not self.dirty_cells:
+            return
+        envelope = self.envelope
+        margin = envelope.max_reach + 1
+        regions = set()
+        for grid_x, grid_y in self.dirty_cells:
+            x0 = grid_x - margin
+            x1 = grid_x + margin
+            y0 = grid_y - envelope.max_drop - 1
+            y1 = grid_y + envelope.max_rise + 1
+            self.rebuild_area(x0, y0, x1, y1)
+            size = self.region_size
+            for region_y in range(max(0, y0) // size, min(self.height - 1, y1) // size + 1):
+                for region_x in range(max(0, x0) // size, min(self.width - 1, x1) // size + 1):
+                    regions.add((region_x, region_y))
+        self.dirty_cells.clear()
+        
+        for region in regions:
+            for key in list(self.region_paths.get(region, ())):
+                self.forget_path(key)
+        self.unreachable.clear()
+    
+    def region_of(self, node):
+        x, y = self.node_cell(node)
+        return x // self.region_size, y // self.region_size
+    
+    def remember_path(self, key, path):
+        self.paths[key] = path
+        goal = key[1]
+        index = self.goal_index.setdefault(goal, {})
+        for position, (node, _) in enumerate(path):
+            index[node] = (key, position)
+        for region in {self.region_of(node) for node, _ in path}:
+            self.region_paths.setdefault(region, set()).add(key)
+        
+        while len(self.paths) > self.max_paths:
+            self.forget_path(next(iter(self.paths)))
+    
+    def forget_path(self, key):
+        path = self.paths.pop(key, None)
+        if path is None:
+            return
+        index = self.goal_index.get(key[1])
+        for node, _ in path:
+            if index is not None and index.get(node, (None,))[0] == key:
+                del index[node]
+            keys = self.region_paths.get(self.region_of(node))
+            if keys is not None:
+                keys.discard(key)
+        if index is not None and not index:
+            del self.goal_index[key[1]]
+    
+    def node_below(self, pixel_x, pixel_y):
+        tile_size = self.tilemap.tile_size
+        x = int(pixel_x // tile_size)
+        y = int(pixel_y // tile_size)
+        if not (0 <= x < self.width):
+            return None
+        for row in range(max(0, y), min(self.height, y + self.envelope.max_drop + 1)):
+            node = self.node_id(x, row)
+            if node in self.nodes:
+                return node
+            if self.solid(x, row):
+                return None
+        return None
+    
+    def find_path(self, start_x, start_y, goal_x, goal_y):
+        self.refresh()
+        start = self.node_below(start_x, start_y)
+        goal = self.node_below(goal_x, goal_y)
+        if start is None or goal is None:
+            return None
+        return self.find_node_path(start, goal)
+    
+    def find_node_path(self, start, goal):
+        self.query_count += 1
+        key = (start, goal)
+        
+        path = self.paths.get(key)
+        if path is not None:
+            self.paths.move_to_end(key)
+            self.cache_hits += 1
+            return path
+        
+        suffix = self.goal_index.get(goal, {}).get(start)
+        if suffix is not None:
+            owner, position = suffix
+            self.paths.move_to_end(owner)
+            self.cache_hits += 1
+            return self.paths[owner][position:]
+        
+        if key in self.unreachable:
+            self.cache_hits += 1
+            return None
+        
+        field = self.fields.get(goal)
+        if field is None:
+            queries = self.goal_queries.get(goal, 0) + 1
+            self.goal_queries[goal] = queries
+            if queries >= self.field_threshold:
+                field = self.build_field(goal)
+        if field is not None:
+            self.cache_hits += 1
+            return self.field_path(field, start, goal)
+        
+        path = self.search(start, goal)
+        if path is None:
+            self.unreachable.add(key)
+            return None
+        self.remember_path(key, path)
+        return path
+    
+    def search(self, start, goal):
+        self.search_count += 1
+        nodes = self.nodes
+        width = self.width
+        goal_x = goal % width
+        goal_y = goal // width
+        
+        came_from = {start: (None, None)}
+        cost_so_far = {start: 0}
+        frontier = [(0, 0, start)]
+        
+        while frontier:
+            _, current_cost, current = heapq.heappop(frontier)
+            if current == goal:
+                break
+            if current_cost > cost_so_far[current]:
+                continue
+            self.expanded_count += 1
+            for target, cost, kind in nodes.get(current, ()):
+                new_cost = current_cost + cost
+                if target not in cost_so_far or new_cost < cost_so_far[target]:
+                    cost_so_far[target] = new_cost
+                    came_from[target] = (current, kind)
+                    heuristic = abs(target % width - goal_x) + abs(target // width - goal_y)
+                    heapq.heappush(frontier, (new_cost + heuristic, new_cost, target))
+        else:
+            return None
+        
+        path = []
+        node = goal
+        kind = None
+        while node is not None:
+            previous, previous_kind = came_from[node]
+            path.append((node, kind))
+            kind = previous_kind
+            node = previous
+        path.reverse()
+        return tuple(path)
+    
+    def build_field(self, goal):
+        if self.reverse_edges is None:
+            self.reverse_edges = {}
+            for source, edges in self.nodes.items():
+                for target, cost, kind in edges:
+                    self.reverse_edges.setdefault(target, []).append((source, cost, kind))
+        
+        next_hop = {goal: (None, None)}
+        cost_so_far = {goal: 0}
+        frontier = [(0, goal)]
+        while frontier:
+            current_cost, current = heapq.heappop(frontier)
+            if current_cost > cost_so_far[current]:
+                continue
+            self.expanded_count += 1
+            for source, cost, kind in self.reverse_edges.get(current, ()):
+                new_cost = current_cost + cost
+                if source not in cost_so_far or new_cost < cost_so_far[source]:
+                    cost_so_far[source] = new_cost
+                    next_hop[source] = (current, kind)
+                    heapq.heappush(frontier, (new_cost, source))
+        
+        self.fields[goal] = next_hop
+        return next_hop
+    
+    def field_path(self, field, start, goal):
+        if start not in field:
+            return None
+        path = []
+        node = start
+        while node != goal:
+            following, kind = field[node]
+            path.append((node, kind))
+            node = following
+        path.append((goal, None))
+        return tuple(path)
\ No newline at end of file
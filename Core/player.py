@@ -1,53 +1,33 @@
 import pygame
 import math
+from Core.ecs import EntityWorld, BodyCursor
+from Core import trace
 
-class Player:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 16
-        self.height = 16
-        
-        self.vel_x = 0
-        self.vel_y = 0
-        
-        self.max_speed = 120
-        self.acceleration = 600
-        self.friction = 1200
-        self.air_friction = 300
-        self.gravity = 800
-        self.max_fall_speed = 300
-        
-        self.jump_force = 220
-        self.max_jump_time = 0.2
-        self.jump_time = 0
-        self.is_jumping = False
-        self.on_ground = False
-        self.coyote_time = 0.08
-        self.coyote_timer = 0
-        self.jump_buffer = 0.1
-        self.jump_buffer_timer = 0
-        
-        self.surface = pygame.Surface((self.width, self.height))
-        self.surface.fill((255, 100, 100))
-        
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-        
-    def update(self, keys, dt, collision_system=None, tilemap=None):
-        old_y = self.y
-        old_vel_y = self.vel_y
-        old_on_ground = self.on_ground
-        
-        self.handle_input(keys, dt)
-        self.apply_physics(dt)
-        
-        if collision_system and tilemap:
-            collision_system.handle_entity_collision(self, tilemap, dt)
-        
-        if abs(old_y - self.y) > 0.01 or old_on_ground != self.on_ground:
-            print(f"Y: {old_y:.2f} -> {self.y:.2f} | VelY: {old_vel_y:.2f} -> {self.vel_y:.2f} | Ground: {old_on_ground} -> {self.on_ground}")
-        
+PLAYER_FIELDS = {"controller": None, "max_speed": "d", "acceleration": "d", "friction": "d", "air_friction": "d",
+                 "gravity": "d", "max_fall_speed": "d", "jump_force": "d", "max_jump_time": "d", "coyote_time": "d",
+                 "coyote_timer": "d", "jump_buffer": "d", "jump_buffer_timer": "d"}
+
+PLAYER_PARAMS = ("max_speed", "acceleration", "friction", "air_friction", "gravity", "max_fall_speed", "jump_force",
+                 "max_jump_time", "coyote_time", "coyote_timer", "jump_buffer", "jump_buffer_timer")
+
+PHYSICS_TRACE = trace.channel("player.physics", (("y_from", "f"), ("y_to", "f"), ("vel_y_from", "f"), ("vel_y_to", "f"),
+                                                 ("ground_from", "b"), ("ground_to", "b")))
+
+def component_property(store_name, field, cast=None):
+    def getter(self):
+        store = self.world.stores[store_name]
+        value = store.columns[field][store.sparse[self.entity]]
+        return cast(value) if cast else value
+    
+    def setter(self, value):
+        store = self.world.stores[store_name]
+        store.columns[field][store.sparse[self.entity]] = value
+    
+    return property(getter, setter)
+
+class PlayerBody(BodyCursor):
+    __slots__ = PLAYER_PARAMS
+    
     def handle_input(self, keys, dt):
         moving = False
         
@@ -107,7 +87,152 @@ class Player:
                 self.coyote_timer -= dt
         else:
             self.coyote_timer = self.coyote_time
-            
+
+class Player:
+    __slots__ = ("world", "entity", "body", "columns")
+    
+    x = component_property("transform", "x")
+    y = component_property("transform", "y")
+    vel_x = component_property("motion", "vel_x")
+    vel_y = component_property("motion", "vel_y")
+    width = component_property("body", "width")
+    height = component_property("body", "height")
+    on_ground = component_property("contact", "on_ground", bool)
+    is_jumping = component_property("contact", "is_jumping", bool)
+    jump_time = component_property("contact", "jump_time")
+    surface = component_property("sprite", "surface")
+    
+    max_speed = component_property("player", "max_speed")
+    acceleration = component_property("player", "acceleration")
+    friction = component_property("player", "friction")
+    air_friction = component_property("player", "air_friction")
+    gravity = component_property("player", "gravity")
+    max_fall_speed = component_property("player", "max_fall_speed")
+    jump_force = component_property("player", "jump_force")
+    max_jump_time = component_property("player", "max_jump_time")
+    coyote_time = component_property("player", "coyote_time")
+    coyote_timer = component_property("player", "coyote_timer")
+    jump_buffer = component_property("player", "jump_buffer")
+    jump_buffer_timer = component_property("player", "jump_buffer_timer")
+    
+    def __init__(self, x, y, world=None, assets=None):
+        self.world = world if world is not None else EntityWorld()
+        self.entity = self.world.create_entity()
+        self.body = PlayerBody()
+        stores = self.world.stores
+        players = self.world.define("player", PLAYER_FIELDS)
+        
+        stores["transform"].add(self.entity, x=x, y=y, prev_x=x, prev_y=y)
+        stores["motion"].add(self.entity, vel_x=0, vel_y=0)
+        stores["body"].add(self.entity, width=16, height=16)
+        stores["contact"].add(self.entity, on_ground=False, is_jumping=False, jump_time=0)
+        
+        players.add(self.entity, controller=self,
+                    max_speed=120, acceleration=600, friction=1200, air_friction=300, gravity=800, max_fall_speed=300,
+                    jump_force=220, max_jump_time=0.2, coyote_time=0.08, coyote_timer=0, jump_buffer=0.1, jump_buffer_timer=0)
+        
+        if assets:
+            surface = assets.get_solid((self.width, self.height), (255, 100, 100))
+        else:
+            surface = pygame.Surface((self.width, self.height))
+            surface.fill((255, 100, 100))
+        stores["sprite"].add(self.entity, surface=surface)
+        self.bind_columns()
+        
+    def destroy(self):
+        self.world.destroy_entity(self.entity)
+        
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+        
+    def bind_columns(self):
+        stores = self.world.stores
+        bound = []
+        for name, fields in (("transform", ("x", "y")), ("motion", ("vel_x", "vel_y")), ("body", ("width", "height")),
+                             ("contact", ("on_ground", "is_jumping", "jump_time")), ("player", PLAYER_PARAMS)):
+            store = stores[name]
+            bound.append(store.sparse)
+            bound.extend(store.columns[field] for field in fields)
+        self.columns = tuple(bound)
+    
+    def load_body(self):
+        (transform, xs, ys, motion, vel_xs, vel_ys, shape, widths, heights,
+         contact, grounded, jumping, jump_times, players, max_speeds, accelerations, frictions, air_frictions,
+         gravities, fall_limits, jump_forces, jump_limits, coyote_times, coyote_timers, jump_buffers, buffer_timers) = self.columns
+        body = self.body
+        entity = self.entity
+        
+        t = transform[entity]
+        body.x = xs[t]
+        body.y = ys[t]
+        m = motion[entity]
+        body.vel_x = vel_xs[m]
+        body.vel_y = vel_ys[m]
+        b = shape[entity]
+        body.width = widths[b]
+        body.height = heights[b]
+        c = contact[entity]
+        body.on_ground = bool(grounded[c])
+        body.is_jumping = bool(jumping[c])
+        body.jump_time = jump_times[c]
+        
+        p = players[entity]
+        body.max_speed = max_speeds[p]
+        body.acceleration = accelerations[p]
+        body.friction = frictions[p]
+        body.air_friction = air_frictions[p]
+        body.gravity = gravities[p]
+        body.max_fall_speed = fall_limits[p]
+        body.jump_force = jump_forces[p]
+        body.max_jump_time = jump_limits[p]
+        body.coyote_time = coyote_times[p]
+        body.coyote_timer = coyote_timers[p]
+        body.jump_buffer = jump_buffers[p]
+        body.jump_buffer_timer = buffer_timers[p]
+        return body
+    
+    def store_body(self):
+        (transform, xs, ys, motion, vel_xs, vel_ys, shape, widths, heights,
+         contact, grounded, jumping, jump_times, players, max_speeds, accelerations, frictions, air_frictions,
+         gravities, fall_limits, jump_forces, jump_limits, coyote_times, coyote_timers, jump_buffers, buffer_timers) = self.columns
+        body = self.body
+        entity = self.entity
+        
+        t = transform[entity]
+        xs[t] = body.x
+        ys[t] = body.y
+        m = motion[entity]
+        vel_xs[m] = body.vel_x
+        vel_ys[m] = body.vel_y
+        c = contact[entity]
+        grounded[c] = body.on_ground
+        jumping[c] = body.is_jumping
+        jump_times[c] = body.jump_time
+        p = players[entity]
+        coyote_timers[p] = body.coyote_timer
+        buffer_timers[p] = body.jump_buffer_timer
+    
+    def update(self, keys, dt, collision_system=None, tilemap=None):
+        body = self.load_body()
+        tracing = PHYSICS_TRACE.enabled
+        if tracing:
+            old_y = body.y
+            old_vel_y = body.vel_y
+            old_on_ground = body.on_ground
+        
+        body.handle_input(keys, dt)
+        body.apply_physics(dt)
+        
+        if collision_system and tilemap:
+            collision_system.handle_entity_collision(body, tilemap, dt)
+        
+        self.store_body()
+        if collision_system and self.entity in collision_system.broadphase:
+            collision_system.update_entity(self.entity, body.x, body.y, body.width, body.height)
+        
+        if tracing and (abs(old_y - body.y) > 0.01 or old_on_ground != body.on_ground):
+            PHYSICS_TRACE.emit(old_y, body.y, old_vel_y, body.vel_y, old_on_ground, body.on_ground)
+        
     def render(self, screen, camera_x=0, camera_y=0):
         screen_x = self.x - camera_x
         screen_y = self.y - camera_y
@@ -0,0 +1,160 @@
+import math
+
+class RayHit:
+    def __init__(self):
+        self.hit = False
+        self.cell_x = -1
+        self.cell_y = -1
+        self.x = 0.0
+        self.y = 0.0
+        self.normal_x = 0
+        self.normal_y = 0
+        self.distance = 0.0
+        self.cells_visited = 0
+
+class Raycaster:
+    def __init__(self):
+        self.fan_directions = {}
+        self.cells_visited = 0
+    
+    def directions(self, count, start_angle, spread):
+        key = (count, start_angle, spread)
+        directions = self.fan_directions.get(key)
+        if directions is None:
+            step = spread / count if spread >= math.tau else spread / max(1, count - 1)
+            directions = [(math.cos(start_angle + step * i), math.sin(start_angle + step * i)) for i in range(count)]
+            if len(self.fan_directions) > 32:
+                self.fan_directions.clear()
+            self.fan_directions[key] = directions
+        return directions
+    
+    def cast(self, tilemap, origin_x, origin_y, dir_x, dir_y, max_distance, hit=None):
+        if hit is None:
+            hit = RayHit()
+        length = math.hypot(dir_x, dir_y)
+        if length:
+            dir_x /= length
+            dir_y /= length
+        
+        tile_size = tilemap.tile_size
+        width = tilemap.grid_width
+        height = tilemap.grid_height
+        rows = None if tilemap.stream else tilemap.collision_mask.row_masks
+        layer = tilemap.collision_data
+        
+        cell_x = int(origin_x // tile_size)
+        cell_y = int(origin_y // tile_size)
+        hit.hit = False
+        hit.normal_x = 0
+        hit.normal_y = 0
+        visited = 1
+        
+        if 0 <= cell_x < width and 0 <= cell_y < height:
+            solid = rows[cell_y] >> cell_x & 1 if rows is not None else layer.get(cell_x, cell_y)
+            if solid:
+                hit.hit = True
+                hit.cell_x = cell_x
+                hit.cell_y = cell_y
+                hit.x = origin_x
+                hit.y = origin_y
+                hit.distance = 0.0
+                hit.cells_visited = visited
+                self.cells_visited += visited
+                return hit
+        
+        if not length:
+            hit.cell_x = -1
+            hit.cell_y = -1
+            hit.x = origin_x
+            hit.y = origin_y
+            hit.distance = 0.0
+            hit.cells_visited = visited
+            self.cells_visited += visited
+            return hit
+        
+        if dir_x > 0:
+            step_x = 1
+            delta_x = tile_size / dir_x
+            next_x = ((cell_x + 1) * tile_size - origin_x) / dir_x
+        elif dir_x < 0:
+            step_x = -1
+            delta_x = -tile_size / dir_x
+            next_x = (cell_x * tile_size - origin_x) / dir_x
+        else:
+            step_x = 0
+            delta_x = next_x = math.inf
+        
+        if dir_y > 0:
+            step_y = 1
+            delta_y = tile_size / dir_y
+            next_y = ((cell_y + 1) * tile_size - origin_y) / dir_y
+        elif dir_y < 0:
+            step_y = -1
+            delta_y = -tile_size / dir_y
+            next_y = (cell_y * tile_size - origin_y) / dir_y
+        else:
+            step_y = 0
+            delta_y = next_y = math.inf
+        
+        while True:
+            if next_x < next_y:
+                distance = next_x
+                cell_x += step_x
+                next_x += delta_x
+                normal_x = -step_x
+                normal_y = 0
+            else:
+                distance = next_y
+                cell_y += step_y
+                next_y += delta_y
+                normal_x = 0
+                normal_y = -step_y
+            
+            if distance > max_distance:
+                break
+            if cell_x < 0 and step_x <= 0 or cell_x >= width and step_x >= 0 or cell_y < 0 and step_y <= 0 or cell_y >= height and step_y >= 0:
+                break
+            visited += 1
+            if 0 <= cell_x < width and 0 <= cell_y < height:
+                solid = rows[cell_y] >> cell_x & 1 if rows is not None else layer.get(cell_x, cell_y)
+                if solid:
+                    hit.hit = True
+                    hit.cell_x = cell_x
+                    hit.cell_y = cell_y
+                    hit.x = origin_x + dir_x * distance
+                    hit.y = origin_y + dir_y * distance
+                    hit.normal_x = normal_x
+                    hit.normal_y = normal_y
+                    hit.distance = distance
+                    hit.cells_visited = visited
+                    self.cells_visited += visited
+                    return hit
+        
+        hit.cell_x = -1
+        hit.cell_y = -1
+        hit.x = origin_x + dir_x * max_distance
+        hit.y = origin_y + dir_y * max_distance
+        hit.distance = max_distance
+        hit.cells_visited = visited
+        self.cells_visited += visited
+        return hit
+    
+    def fill_hits(self, hits, count):
+        if hits is None:
+            return [RayHit() for _ in range(count)]
+        while len(hits) < count:
+            hits.append(RayHit())
+        del hits[count:]
+        return hits
+    
+    def cast_many(self, tilemap, rays, max_distance, hits=None):
+        hits = self.fill_hits(hits, len(rays))
+        for hit, (origin_x, origin_y, dir_x, dir_y) in zip(hits, rays):
+            self.cast(tilemap, origin_x, origin_y, dir_x, dir_y, max_distance, hit)
+        return hits
+    
+    def cast_fan(self, tilemap, origin_x, origin_y, count, max_distance, start_angle=0.0, spread=math.tau, hits=None):
+        hits = self.fill_hits(hits, count)
+        for hit, (dir_x, dir_y) in zip(hits, self.directions(count, start_angle, spread)):
+            self.cast(tilemap, origin_x, origin_y, dir_x, dir_y, max_distance, hit)
+        return hits
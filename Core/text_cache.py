@@ -0,0 +1,74 @@
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def render(self, font, text, color=(255, 255, 255)):
+        key = (text, color, id(font))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, False, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+    
+    def clear(self):
+        self.surfaces.clear()
+
+class GlyphAtlas:
+    def __init__(self, font, color=(255, 255, 255), characters=None):
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.glyphs = {}
+        self.advances = {}
+        self.batch = []
+        for char in characters or "".join(chr(code) for code in range(32, 127)):
+            self.add(char)
+    
+    def add(self, char):
+        metrics = self.font.metrics(char)
+        advance = metrics[0][4] if metrics and metrics[0] else self.font.size(char)[0]
+        surface = self.font.render(char, False, self.color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.glyphs[char] = surface
+        self.advances[char] = advance
+    
+    def width(self, text):
+        advances = self.advances
+        total = 0
+        for char in text:
+            if char not in advances:
+                self.add(char)
+            total += advances[char]
+        return total
+    
+    def draw(self, target, text, position):
+        glyphs = self.glyphs
+        advances = self.advances
+        x, y = position
+        for char in text:
+            if char not in glyphs:
+                self.add(char)
+            if char != " ":
+                self.batch.append((glyphs[char], (x, y)))
+            x += advances[char]
+        target.blits(self.batch, doreturn=False)
+        self.batch.clear()
+        return x - position[0]
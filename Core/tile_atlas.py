@@ -0,0 +1,86 @@
+import pygame
+
+EMPTY = 0
+OPAQUE = 1
+COLORKEY = 2
+ALPHA = 3
+KIND_NAMES = {EMPTY: "empty", OPAQUE: "opaque", COLORKEY: "colorkey", ALPHA: "alpha"}
+COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3), (254, 1, 253))
+
+def classify_tile(surface):
+    pixels = surface.get_width() * surface.get_height()
+    visible = pygame.mask.from_surface(surface, 0).count()
+    if visible == 0:
+        return EMPTY
+    solid = pygame.mask.from_surface(surface, 254).count()
+    if solid == pixels:
+        return OPAQUE
+    if solid == visible:
+        return COLORKEY
+    return ALPHA
+
+def pick_colorkey(surface):
+    used = set()
+    for y in range(surface.get_height()):
+        for x in range(surface.get_width()):
+            color = surface.get_at((x, y))
+            if color.a:
+                used.add((color.r, color.g, color.b))
+    for candidate in COLORKEY_CANDIDATES:
+        if candidate not in used:
+            return candidate
+    for value in range(1 << 24):
+        candidate = (value >> 16, (value >> 8) & 255, value & 255)
+        if candidate not in used:
+            return candidate
+
+class TileAtlas:
+    def __init__(self, tileset_image=None, tile_size=16):
+        self.tile_size = tile_size
+        self.tiles = []
+        self.kinds = []
+        self.counts = {kind: 0 for kind in KIND_NAMES}
+        if tileset_image is not None:
+            self.build(tileset_image, tile_size)
+    
+    def __len__(self):
+        return len(self.tiles)
+    
+    def build(self, tileset_image, tile_size):
+        self.tile_size = tile_size
+        self.tiles = []
+        self.kinds = []
+        self.counts = {kind: 0 for kind in KIND_NAMES}
+        can_convert = pygame.display.get_surface() is not None
+        tiles_x = tileset_image.get_width() // tile_size
+        tiles_y = tileset_image.get_height() // tile_size
+        
+        for y in range(tiles_y):
+            for x in range(tiles_x):
+                rect = pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+                tile = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+                tile.blit(tileset_image, (0, 0), rect)
+                kind = classify_tile(tile)
+                self.tiles.append(self.prepare(tile, kind, can_convert))
+                self.kinds.append(kind)
+                self.counts[kind] += 1
+    
+    def prepare(self, tile, kind, can_convert):
+        if not can_convert:
+            return tile
+        if kind == OPAQUE:
+            return tile.convert()
+        if kind == COLORKEY:
+            key = pick_colorkey(tile)
+            keyed = pygame.Surface(tile.get_size()).convert()
+            keyed.fill(key)
+            keyed.blit(tile, (0, 0))
+            keyed.set_colorkey(key, pygame.RLEACCEL)
+            return keyed
+        return tile.convert_alpha()
+    
+    def is_empty(self, tile_id):
+        return tile_id <= 0 or tile_id > len(self.tiles) or self.kinds[tile_id - 1] == EMPTY
+    
+    def describe(self):
+        return ", ".join(f"{KIND_NAMES[kind]} {count}" for kind, count in self.counts.items())
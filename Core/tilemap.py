@@ -1,36 +1,127 @@
 import pygame
-import json
 import os
+import math
+from Core.chunk_cache import ChunkCache
+from Core.world_layer import WorldLayer
+from Core.tile_atlas import TileAtlas
+from Core.collision_geometry import CollisionGeometry
+from Core.collision_mask import CollisionMask
+from Core.grid import TileGrid, BitGrid
+from Core.level_format import load_level, is_chunked_level
+from Core.raycast import Raycaster
+from Core.navigation import NavGraph
+from Core.world_stream import StreamedWorld
 
 class Tilemap:
     def __init__(self):
         self.tile_size = 16
         self.grid_width = 0
         self.grid_height = 0
-        self.world_data = []
-        self.collision_data = []
+        self.world_data = TileGrid(0, 0)
+        self.collision_data = BitGrid(0, 0)
+        self.level = None
+        self.stream = None
         self.tileset_image = None
         self.tile_surfaces = []
+        self.atlas = TileAtlas()
+        self.chunk_cache = ChunkCache()
+        self.world_layer = None
+        self.collision_geometry = CollisionGeometry()
+        self.collision_mask = CollisionMask()
+        self.raycaster = Raycaster()
+        self.navigation = None
+        self.contact_rect = pygame.Rect(0, 0, 0, 0)
         
-    def load_tilemap(self, filepath):
+    def load_tilemap(self, filepath, assets=None):
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            if is_chunked_level(filepath):
+                return self.load_streamed_world(filepath)
             
-            self.tile_size = data.get('tile_size', 16)
-            self.grid_width = data.get('grid_width', 100)
-            self.grid_height = data.get('grid_height', 100)
-            self.world_data = data.get('world_data', [])
-            self.collision_data = data.get('collision_data', [])
+            level = assets.take_level(filepath) if assets else load_level(filepath)
+            self.close_stream()
+            self.close_level()
+            
+            self.tile_size = level.tile_size
+            self.grid_width = level.grid_width
+            self.grid_height = level.grid_height
+            self.world_data = level.world_data
+            self.collision_data = level.collision_data
+            self.level = level
+            self.chunk_cache.clear()
+            self.invalidate_world_layer()
+            self.collision_geometry.build(self.collision_data, self.tile_size)
+            self.collision_mask.build(self.collision_data)
+            if self.navigation:
+                self.navigation.build(self)
             
             return True
         except Exception as e:
             print(f"Failed to load tilemap: {e}")
             return False
     
-    def load_tileset(self, tileset_path):
+    def load_streamed_world(self, filepath, memory_budget=32 * 1024 * 1024, prefetch_margin=2):
+        stream = StreamedWorld(filepath, memory_budget, prefetch_margin)
+        self.close_stream()
+        self.close_level()
+        
+        self.tile_size = stream.tile_size
+        self.grid_width = stream.grid_width
+        self.grid_height = stream.grid_height
+        self.world_data = stream.tiles
+        self.collision_data = stream.collision
+        self.level = stream.info
+        self.stream = stream
+        
+        stream.on_chunk_loaded = self.invalidate_stream_chunk
+        stream.on_chunk_evicted = self.invalidate_stream_chunk
+        self.chunk_cache.clear()
+        self.invalidate_world_layer()
+        self.collision_geometry.clear()
+        self.collision_mask.clear()
+        self.navigation = None
+        
+        return True
+    
+    def close_stream(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+            self.level = None
+    
+    def close_level(self):
+        if self.level is None:
+            return
+        try:
+            self.level.close()
+        except Exception as e:
+            print(f"Failed to close level: {e}")
+        self.level = None
+    
+    def invalidate_stream_chunk(self, chunk_x, chunk_y):
+        size = self.stream.chunk_size
+        render_size = self.chunk_cache.chunk_size
+        for render_y in range(chunk_y * size // render_size, ((chunk_y + 1) * size - 1) // render_size + 1):
+            for render_x in range(chunk_x * size // render_size, ((chunk_x + 1) * size - 1) // render_size + 1):
+                self.chunk_cache.invalidate_chunk(render_x, render_y)
+        if self.world_layer:
+            pixels = size * self.tile_size
+            self.world_layer.invalidate_rect(chunk_x * pixels, chunk_y * pixels, pixels, pixels)
+    
+    def update_streaming(self, camera_x, camera_y, view_width, view_height, vel_x=0, vel_y=0, block=False):
+        if self.stream:
+            self.stream.update(camera_x, camera_y, view_width, view_height, vel_x, vel_y, block)
+    
+    def is_region_loaded(self, rect):
+        if not self.stream:
+            return True
+        return self.stream.is_region_resident(rect.left, rect.top, rect.right, rect.bottom)
+    
+    def load_tileset(self, tileset_path, assets=None):
         try:
-            self.tileset_image = pygame.image.load(tileset_path).convert_alpha()
+            if assets:
+                self.tileset_image = assets.get(tileset_path)
+            else:
+                self.tileset_image = pygame.image.load(tileset_path).convert_alpha()
             self.extract_tiles()
             return True
         except Exception as e:
@@ -41,23 +132,35 @@ class Tilemap:
         if not self.tileset_image:
             return
         
-        self.tile_surfaces = []
-        tiles_x = self.tileset_image.get_width() // self.tile_size
-        tiles_y = self.tileset_image.get_height() // self.tile_size
+        self.atlas = TileAtlas(self.tileset_image, self.tile_size)
+        self.tile_surfaces = self.atlas.tiles
         
-        for y in range(tiles_y):
-            for x in range(tiles_x):
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size)
-                tile_surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
-                tile_surface.blit(self.tileset_image, (0, 0), rect)
-                self.tile_surfaces.append(tile_surface)
+        self.chunk_cache.clear()
+        self.invalidate_world_layer()
+    
+    def set_tile(self, grid_x, grid_y, tile_id):
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            if self.world_data.get(grid_x, grid_y) != tile_id:
+                self.world_data.set(grid_x, grid_y, tile_id)
+                self.chunk_cache.invalidate_cell(grid_x, grid_y)
+                if self.world_layer:
+                    self.world_layer.invalidate_cell(grid_x, grid_y, self.tile_size)
+    
+    def set_collision(self, grid_x, grid_y, solid):
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            self.collision_data.set(grid_x, grid_y, solid)
+            self.collision_geometry.invalidate_cell(grid_x, grid_y)
+            if not self.stream:
+                self.collision_mask.set_cell(grid_x, grid_y, solid)
+            if self.navigation:
+                self.navigation.invalidate_cell(grid_x, grid_y)
     
     def get_tile_at_position(self, x, y):
         grid_x = int(x // self.tile_size)
         grid_y = int(y // self.tile_size)
         
         if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
-            return self.world_data[grid_y][grid_x]
+            return self.world_data.get(grid_x, grid_y)
         return 0
     
     def is_collision_at_position(self, x, y):
@@ -65,26 +168,17 @@ class Tilemap:
         grid_y = int(y // self.tile_size)
         
         if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
-            return self.collision_data[grid_y][grid_x]
+            if self.stream:
+                return self.collision_data.get(grid_x, grid_y)
+            return self.collision_mask.row_masks[grid_y] >> grid_x & 1 == 1
         return False
     
     def check_collision_rect(self, rect):
-        left = rect.left
-        right = rect.right
-        top = rect.top
-        bottom = rect.bottom
-        
-        corners = [
-            (left, top),
-            (right - 1, top),
-            (left, bottom - 1),
-            (right - 1, bottom - 1)
-        ]
-        
-        for x, y in corners:
-            if self.is_collision_at_position(x, y):
-                return True
-        return False
+        return self.any_collision_in_rect(rect)
+    
+    def rect_cell_span(self, rect):
+        tile_size = self.tile_size
+        return rect.left // tile_size, rect.top // tile_size, (rect.right - 1) // tile_size, (rect.bottom - 1) // tile_size
     
     def get_collision_tiles_in_rect(self, rect):
         collision_tiles = []
@@ -94,30 +188,148 @@ class Tilemap:
         start_y = max(0, int(rect.top // self.tile_size))
         end_y = min(self.grid_height, int(rect.bottom // self.tile_size) + 1)
         
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if self.collision_data[y][x]:
-                    tile_rect = pygame.Rect(x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size)
-                    collision_tiles.append(tile_rect)
+        if end_x <= start_x or end_y <= start_y:
+            return collision_tiles
+        
+        for x, y in self.collision_data.cells_in_region(start_x, start_y, end_x - start_x, end_y - start_y):
+            tile_rect = pygame.Rect(x * self.tile_size, y * self.tile_size, self.tile_size, self.tile_size)
+            collision_tiles.append(tile_rect)
         
         return collision_tiles
     
+    def get_collision_rects_in_rect(self, rect):
+        if self.stream:
+            return [tile_rect for tile_rect in self.get_collision_tiles_in_rect(rect) if rect.colliderect(tile_rect)]
+        return self.collision_geometry.query(rect)
+    
+    def first_collision_tile(self, rect):
+        if self.stream:
+            for tile_rect in self.get_collision_tiles_in_rect(rect):
+                if rect.colliderect(tile_rect):
+                    return tile_rect
+            return None
+        
+        if rect.width <= 0 or rect.height <= 0:
+            return None
+        
+        cell = self.collision_mask.first_in_span(*self.rect_cell_span(rect))
+        if cell is None:
+            return None
+        
+        self.contact_rect.update(cell[0] * self.tile_size, cell[1] * self.tile_size, self.tile_size, self.tile_size)
+        return self.contact_rect
+    
+    def any_collision_in_rect(self, rect):
+        if self.stream:
+            return self.first_collision_tile(rect) is not None
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        return self.collision_mask.any_in_span(*self.rect_cell_span(rect))
+    
+    def any_solid_in_cells(self, x0, y0, x1, y1):
+        if not self.stream:
+            return self.collision_mask.any_in_span(x0, y0, x1, y1)
+        x0 = max(0, x0)
+        y0 = max(0, y0)
+        x1 = min(self.grid_width - 1, x1)
+        y1 = min(self.grid_height - 1, y1)
+        if x1 < x0 or y1 < y0:
+            return False
+        return self.collision_data.any_in_region(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+    
+    def first_solid_in_direction(self, rect, direction, distance):
+        tile_size = self.tile_size
+        left, top, right, bottom = self.rect_cell_span(rect)
+        
+        if direction == "right":
+            return self.first_solid_between(direction, rect.right // tile_size, (rect.right + distance - 1) // tile_size, top, bottom)
+        if direction == "left":
+            return self.first_solid_between(direction, (rect.left - 1) // tile_size, (rect.left - distance) // tile_size, top, bottom)
+        if direction == "down":
+            return self.first_solid_between(direction, rect.bottom // tile_size, (rect.bottom + distance - 1) // tile_size, left, right)
+        if direction == "up":
+            return self.first_solid_between(direction, (rect.top - 1) // tile_size, (rect.top - distance) // tile_size, left, right)
+        raise ValueError(f"Unknown direction: {direction}")
+    
+    def first_solid_between(self, direction, start, end, band_start, band_end):
+        if not self.stream:
+            if direction == "right":
+                return self.collision_mask.first_right(start, end, band_start, band_end)
+            if direction == "left":
+                return self.collision_mask.first_left(start, end, band_start, band_end)
+            if direction == "down":
+                return self.collision_mask.first_down(start, end, band_start, band_end)
+            return self.collision_mask.first_up(start, end, band_start, band_end)
+        
+        horizontal = direction in ("left", "right")
+        limit = self.grid_width if horizontal else self.grid_height
+        band_limit = self.grid_height if horizontal else self.grid_width
+        band_start = max(0, band_start)
+        band_end = min(band_limit - 1, band_end)
+        if band_end < band_start:
+            return None
+        
+        step = 1 if direction in ("right", "down") else -1
+        for index in range(start, end + step, step):
+            if 0 <= index < limit:
+                if horizontal:
+                    if self.collision_data.any_in_region(index, band_start, 1, band_end - band_start + 1):
+                        return index
+                elif self.collision_data.any_in_region(band_start, index, band_end - band_start + 1, 1):
+                    return index
+        return None
+    
+    def build_navigation(self, player=None):
+        if self.stream:
+            print("Failed to build navigation: streamed worlds are not supported")
+            return None
+        self.navigation = NavGraph()
+        self.navigation.build(self, player)
+        return self.navigation
+    
+    def find_path(self, start_x, start_y, goal_x, goal_y):
+        if not self.navigation:
+            return None
+        return self.navigation.find_path(start_x, start_y, goal_x, goal_y)
+    
+    def raycast(self, origin_x, origin_y, dir_x, dir_y, max_distance, hit=None):
+        return self.raycaster.cast(self, origin_x, origin_y, dir_x, dir_y, max_distance, hit)
+    
+    def raycast_many(self, rays, max_distance, hits=None):
+        return self.raycaster.cast_many(self, rays, max_distance, hits)
+    
+    def raycast_fan(self, origin_x, origin_y, count, max_distance, start_angle=0.0, spread=math.tau, hits=None):
+        return self.raycaster.cast_fan(self, origin_x, origin_y, count, max_distance, start_angle, spread, hits)
+    
+    def has_line_of_sight(self, start_x, start_y, end_x, end_y):
+        distance = math.hypot(end_x - start_x, end_y - start_y)
+        return not self.raycaster.cast(self, start_x, start_y, end_x - start_x, end_y - start_y, distance).hit
+    
+    def enable_world_layer(self, width, height, background=(0, 0, 0)):
+        self.world_layer = WorldLayer(width, height, background)
+        return self.world_layer
+    
+    def disable_world_layer(self):
+        self.world_layer = None
+    
+    def invalidate_world_layer(self):
+        if self.world_layer:
+            self.world_layer.invalidate()
+    
     def render(self, screen, camera_x=0, camera_y=0):
         if not self.tile_surfaces or not self.world_data:
             return
         
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-        
-        start_x = max(0, int(camera_x // self.tile_size))
-        end_x = min(self.grid_width, int((camera_x + screen_width) // self.tile_size) + 1)
-        start_y = max(0, int(camera_y // self.tile_size))
-        end_y = min(self.grid_height, int((camera_y + screen_height) // self.tile_size) + 1)
-        
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile_id = self.world_data[y][x]
-                if tile_id > 0 and tile_id <= len(self.tile_surfaces):
-                    screen_x = x * self.tile_size - camera_x
-                    screen_y = y * self.tile_size - camera_y
-                    screen.blit(self.tile_surfaces[tile_id - 1], (screen_x, screen_y))
\ No newline at end of file
+        self.chunk_cache.render(self, screen, camera_x, camera_y)
+    
+    def render_world_layer(self, screen, camera_x=0, camera_y=0, restore_rects=None):
+        layer = self.world_layer
+        surface = layer.render(self, camera_x, camera_y)
+        if layer.changed_all or restore_rects is None:
+            screen.blit(surface, (0, 0))
+            return None
+        
+        rects = layer.changed_rects + restore_rects
+        for rect in rects:
+            screen.blit(surface, rect, rect)
+        return rects
@@ -0,0 +1,189 @@
+import json
+import struct
+import threading
+import time
+
+TRACE_MAGIC = b'IATR'
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct('<4sHH')
+RECORD_HEADER = struct.Struct('<HxxId')
+BLOCK_HEADER = struct.Struct('<cI')
+FIELD_CODES = {"f": "d", "i": "q", "b": "?"}
+
+class TraceChannel:
+    __slots__ = ("tracer", "name", "channel_id", "fields", "payload", "packer", "enabled")
+    
+    def __init__(self, tracer, name, channel_id, fields):
+        self.tracer = tracer
+        self.name = name
+        self.channel_id = channel_id
+        self.fields = fields
+        self.payload = struct.Struct('<' + ''.join(FIELD_CODES[kind] for _, kind in fields))
+        self.packer = struct.Struct(RECORD_HEADER.format + self.payload.format[1:])
+        self.enabled = False
+    
+    def emit(self, *values):
+        if self.enabled:
+            self.tracer.record(self, values)
+    
+    def describe(self):
+        return {"id": self.channel_id, "name": self.name, "fields": [list(field) for field in self.fields]}
+
+class Tracer:
+    def __init__(self, capacity=16384, slot_size=64, flush_interval=0.25):
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self.flush_interval = flush_interval
+        self.buffer = bytearray(capacity * slot_size)
+        self.channels = {}
+        self.file_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+        self.file = None
+        self.running = False
+        self.wake_pending = False
+        self.active_names = None
+        
+        self.frame = 0
+        self.write_index = 0
+        self.read_index = 0
+        self.start_time = time.perf_counter()
+        
+        self.dropped = 0
+        self.flushed_bytes = 0
+    
+    @property
+    def recorded(self):
+        return self.write_index
+    
+    def channel(self, name, fields):
+        channel = self.channels.get(name)
+        if channel is not None:
+            return channel
+        
+        fields = tuple((field, kind) for field, kind in fields)
+        channel = TraceChannel(self, name, len(self.channels), fields)
+        if RECORD_HEADER.size + channel.payload.size > self.slot_size:
+            raise ValueError(f"Trace channel {name} does not fit in a {self.slot_size} byte slot")
+        self.channels[name] = channel
+        
+        if self.running:
+            channel.enabled = self.active_names is None or name in self.active_names
+            with self.file_lock:
+                self.write_block(b'C', json.dumps(channel.describe()).encode())
+        return channel
+    
+    def next_frame(self):
+        self.frame += 1
+    
+    def record(self, channel, values):
+        index = self.write_index
+        pending = index - self.read_index
+        if pending >= self.capacity:
+            self.dropped += 1
+            return
+        channel.packer.pack_into(self.buffer, (index % self.capacity) * self.slot_size,
+                                 channel.channel_id, self.frame, time.perf_counter() - self.start_time, *values)
+        self.write_index = index + 1
+        
+        if pending >= self.capacity // 2 and not self.wake_pending:
+            self.wake_pending = True
+            self.wake.set()
+    
+    def start(self, filepath, channel_names=None):
+        if self.running:
+            self.stop()
+        
+        self.file = open(filepath, 'wb')
+        self.file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.slot_size))
+        self.active_names = set(channel_names) if channel_names else None
+        self.write_index = 0
+        self.read_index = 0
+        self.dropped = 0
+        self.flushed_bytes = 0
+        self.start_time = time.perf_counter()
+        
+        for channel in self.channels.values():
+            self.write_block(b'C', json.dumps(channel.describe()).encode())
+            channel.enabled = self.active_names is None or channel.name in self.active_names
+        
+        self.running = True
+        self.wake.clear()
+        self.thread = threading.Thread(target=self.flush_loop, name="trace-flush", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        if not self.running:
+            return
+        for channel in self.channels.values():
+            channel.enabled = False
+        self.running = False
+        self.wake.set()
+        self.thread.join()
+        self.flush()
+        self.file.close()
+        self.file = None
+        self.thread = None
+    
+    def write_block(self, kind, data):
+        self.file.write(BLOCK_HEADER.pack(kind, len(data)))
+        self.file.write(data)
+        self.flushed_bytes += BLOCK_HEADER.size + len(data)
+    
+    def flush_loop(self):
+        while self.running:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.wake_pending = False
+            self.flush()
+    
+    def flush(self):
+        start = self.read_index
+        end = self.write_index
+        if end == start:
+            return
+        first = start % self.capacity
+        count = end - start
+        if first + count <= self.capacity:
+            data = bytes(self.buffer[first * self.slot_size:(first + count) * self.slot_size])
+        else:
+            data = bytes(self.buffer[first * self.slot_size:]) + bytes(self.buffer[:(first + count - self.capacity) * self.slot_size])
+        self.read_index = end
+        
+        with self.file_lock:
+            self.write_block(b'R', data)
+
+def read_trace(filepath):
+    with open(filepath, 'rb') as file:
+        data = file.read()
+    
+    magic, version, slot_size = TRACE_HEADER.unpack_from(data, 0)
+    if magic != TRACE_MAGIC:
+        raise ValueError(f"{filepath} is not a trace file")
+    if version != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version {version}")
+    
+    channels = {}
+    offset = TRACE_HEADER.size
+    while offset + BLOCK_HEADER.size <= len(data):
+        kind, length = BLOCK_HEADER.unpack_from(data, offset)
+        offset += BLOCK_HEADER.size
+        block = data[offset:offset + length]
+        offset += length
+        
+        if kind == b'C':
+            info = json.loads(block)
+            payload = struct.Struct('<' + ''.join(FIELD_CODES[field_kind] for _, field_kind in info["fields"]))
+            channels[info["id"]] = (info["name"], [name for name, _ in info["fields"]], payload)
+            continue
+        
+        for record_offset in range(0, len(block), slot_size):
+            channel_id, frame, timestamp = RECORD_HEADER.unpack_from(block, record_offset)
+            name, fields, payload = channels[channel_id]
+            values = payload.unpack_from(block, record_offset + RECORD_HEADER.size)
+            yield name, frame, timestamp, dict(zip(fields, values))
+
+tracer = Tracer()
+
+def channel(name, fields):
+    return tracer.channel(name, fields)
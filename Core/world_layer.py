@@ -0,0 +1,83 @@
+import math
+import pygame
+
+class WorldLayer:
+    def __init__(self, width, height, background=(0, 0, 0), redraw_threshold=0.3):
+        self.width = width
+        self.height = height
+        self.background = background
+        self.redraw_threshold = redraw_threshold
+        self.surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+        self.view = self.surface.get_rect()
+        self.camera_x = 0
+        self.camera_y = 0
+        self.valid = False
+        self.dirty = []
+        self.changed_all = True
+        self.changed_rects = []
+        
+        self.full_redraws = 0
+        self.scrolls = 0
+        self.redrawn_pixels = 0
+    
+    def invalidate(self):
+        self.valid = False
+        self.dirty.clear()
+    
+    def invalidate_rect(self, left, top, width, height):
+        if self.valid:
+            self.dirty.append(pygame.Rect(left, top, width, height))
+    
+    def invalidate_cell(self, grid_x, grid_y, tile_size):
+        self.invalidate_rect(grid_x * tile_size, grid_y * tile_size, tile_size, tile_size)
+    
+    def render(self, tilemap, camera_x, camera_y):
+        camera_x = math.floor(camera_x)
+        camera_y = math.floor(camera_y)
+        dx = camera_x - self.camera_x
+        dy = camera_y - self.camera_y
+        self.camera_x = camera_x
+        self.camera_y = camera_y
+        self.redrawn_pixels = 0
+        self.changed_all = bool(dx or dy) or not self.valid
+        self.changed_rects.clear()
+        
+        exposed = abs(dx) * self.height + abs(dy) * (self.width - abs(dx))
+        if not self.valid or abs(dx) >= self.width or abs(dy) >= self.height or exposed > self.redraw_threshold * self.width * self.height:
+            self.valid = True
+            self.dirty.clear()
+            self.full_redraws += 1
+            self.redraw(tilemap, self.view)
+            return self.surface
+        
+        if dx or dy:
+            self.scrolls += 1
+            self.surface.scroll(-dx, -dy)
+            if dx > 0:
+                self.redraw(tilemap, pygame.Rect(self.width - dx, 0, dx, self.height))
+            elif dx < 0:
+                self.redraw(tilemap, pygame.Rect(0, 0, -dx, self.height))
+            left = max(0, -dx)
+            if dy > 0:
+                self.redraw(tilemap, pygame.Rect(left, self.height - dy, self.width - abs(dx), dy))
+            elif dy < 0:
+                self.redraw(tilemap, pygame.Rect(left, 0, self.width - abs(dx), -dy))
+        
+        if self.dirty:
+            for rect in self.dirty:
+                area = rect.move(-camera_x, -camera_y).clip(self.view)
+                if area.width and area.height:
+                    self.redraw(tilemap, area)
+                    self.changed_rects.append(area)
+            self.dirty.clear()
+        return self.surface
+    
+    def redraw(self, tilemap, area):
+        self.redrawn_pixels += area.width * area.height
+        self.surface.set_clip(area)
+        self.surface.fill(self.background, area)
+        if tilemap.tile_surfaces and tilemap.world_data:
+            tilemap.chunk_cache.render(tilemap, self.surface, self.camera_x, self.camera_y, area)
+        self.surface.set_clip(None)
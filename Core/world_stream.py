@@ -0,0 +1,325 @@
+import sys
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict, deque
+from Core.grid import TileGrid, BitGrid
+from Core.level_format import ChunkedLevelInfo
+
+class WorldChunk:
+    def __init__(self, chunk_x, chunk_y, tiles, collision):
+        self.chunk_x = chunk_x
+        self.chunk_y = chunk_y
+        self.tiles = tiles
+        self.collision = collision
+        self.dirty = False
+
+class StreamedWorld:
+    def __init__(self, filepath, memory_budget=32 * 1024 * 1024, prefetch_margin=2, view_margin=1, unloaded_solid=True):
+        self.info = ChunkedLevelInfo(filepath)
+        self.chunk_size = self.info.chunk_size
+        self.tile_size = self.info.tile_size
+        self.grid_width = self.info.grid_width
+        self.grid_height = self.info.grid_height
+        self.chunk_memory = self.chunk_size * self.chunk_size * 2 + self.info.collision_bytes
+        
+        self.memory_budget = memory_budget
+        self.prefetch_margin = prefetch_margin
+        self.view_margin = view_margin
+        self.unloaded_solid = unloaded_solid
+        
+        self.resident = OrderedDict()
+        self.pending = set()
+        self.requests = deque()
+        self.completed = deque()
+        self.condition = threading.Condition()
+        self.file_lock = threading.Lock()
+        self.file = open(filepath, 'rb')
+        self.overlay = None
+        self.overlay_offsets = {}
+        self.running = True
+        
+        self.on_chunk_loaded = None
+        self.on_chunk_evicted = None
+        
+        self.load_count = 0
+        self.eviction_count = 0
+        self.writeback_count = 0
+        self.miss_count = 0
+        
+        self.tiles = StreamedTileLayer(self)
+        self.collision = StreamedCollisionLayer(self)
+        
+        self.thread = threading.Thread(target=self.loader_loop, name="world-stream", daemon=True)
+        self.thread.start()
+    
+    @property
+    def resident_bytes(self):
+        return len(self.resident) * self.chunk_memory
+    
+    def loader_loop(self):
+        while True:
+            with self.condition:
+                while self.running and not self.requests:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                chunk_x, chunk_y = self.requests.popleft()
+            
+            self.completed.append(self.read_chunk(chunk_x, chunk_y))
+    
+    def read_chunk(self, chunk_x, chunk_y):
+        with self.file_lock:
+            offset = self.overlay_offsets.get((chunk_x, chunk_y))
+            if offset is None:
+                self.file.seek(self.info.chunk_offset(chunk_x, chunk_y))
+                data = self.file.read(self.info.chunk_bytes)
+            else:
+                self.overlay.seek(offset)
+                data = self.overlay.read(self.info.chunk_bytes)
+        
+        cells = array('H')
+        cells.frombytes(data[:self.info.tile_bytes])
+        if sys.byteorder != 'little':
+            cells.byteswap()
+        
+        tiles = TileGrid(self.chunk_size, self.chunk_size, cells)
+        collision = BitGrid(self.chunk_size, self.chunk_size, bytearray(data[self.info.tile_bytes:]))
+        return WorldChunk(chunk_x, chunk_y, tiles, collision)
+    
+    def write_chunk(self, chunk):
+        cells = chunk.tiles.cells
+        if sys.byteorder != 'little':
+            cells = array('H', cells)
+            cells.byteswap()
+        
+        key = (chunk.chunk_x, chunk.chunk_y)
+        with self.file_lock:
+            if self.overlay is None:
+                self.overlay = tempfile.TemporaryFile()
+            offset = self.overlay_offsets.get(key)
+            if offset is None:
+                offset = self.overlay.seek(0, 2)
+            self.overlay.seek(offset)
+            self.overlay.write(cells)
+            self.overlay.write(chunk.collision.bits)
+            self.overlay_offsets[key] = offset
+        chunk.dirty = False
+        self.writeback_count += 1
+    
+    def request(self, key, urgent=False):
+        if key in self.resident:
+            return
+        with self.condition:
+            if key in self.pending:
+                if urgent and self.requests and self.requests[0] != key and key in self.requests:
+                    self.requests.remove(key)
+                    self.requests.appendleft(key)
+                return
+            self.pending.add(key)
+            if urgent:
+                self.requests.appendleft(key)
+            else:
+                self.requests.append(key)
+            self.condition.notify()
+    
+    def integrate(self):
+        while self.completed:
+            chunk = self.completed.popleft()
+            if (chunk.chunk_x, chunk.chunk_y) in self.pending:
+                self.add_resident(chunk)
+    
+    def add_resident(self, chunk):
+        key = (chunk.chunk_x, chunk.chunk_y)
+        self.pending.discard(key)
+        if key in self.resident:
+            return
+        self.resident[key] = chunk
+        self.load_count += 1
+        if self.on_chunk_loaded:
+            self.on_chunk_loaded(chunk.chunk_x, chunk.chunk_y)
+    
+    def chunks_in_rect(self, left, top, right, bottom):
+        chunk_pixels = self.chunk_size * self.tile_size
+        start_x = max(0, int(left // chunk_pixels))
+        end_x = min(self.info.chunks_x, int(right // chunk_pixels) + 1)
+        start_y = max(0, int(top // chunk_pixels))
+        end_y = min(self.info.chunks_y, int(bottom // chunk_pixels) + 1)
+        return [(x, y) for y in range(start_y, end_y) for x in range(start_x, end_x)]
+    
+    def update(self, camera_x, camera_y, view_width, view_height, vel_x=0, vel_y=0, block=False):
+        self.integrate()
+        
+        chunk_pixels = self.chunk_size * self.tile_size
+        margin = self.view_margin * chunk_pixels
+        left = camera_x - margin
+        top = camera_y - margin
+        right = camera_x + view_width + margin
+        bottom = camera_y + view_height + margin
+        needed = self.chunks_in_rect(left, top, right, bottom)
+        
+        prefetch = self.prefetch_margin * chunk_pixels
+        if vel_x > 0:
+            right += prefetch
+        elif vel_x < 0:
+            left -= prefetch
+        if vel_y > 0:
+            bottom += prefetch
+        elif vel_y < 0:
+            top -= prefetch
+        wanted = set(self.chunks_in_rect(left, top, right, bottom))
+        
+        with self.condition:
+            if len(self.requests) > len(wanted):
+                stale = [key for key in self.requests if key not in wanted]
+                self.requests = deque(key for key in self.requests if key in wanted)
+                self.pending.difference_update(stale)
+        
+        for key in needed:
+            if key in self.resident:
+                self.resident.move_to_end(key)
+            elif block:
+                self.add_resident(self.read_chunk(*key))
+            else:
+                self.request(key, urgent=True)
+        
+        for key in wanted:
+            self.request(key)
+        
+        self.evict(wanted)
+    
+    def evict(self, keep):
+        while self.resident_bytes > self.memory_budget:
+            victim = None
+            for key in self.resident:
+                if key not in keep:
+                    victim = key
+                    break
+            if victim is None:
+                break
+            
+            chunk = self.resident.pop(victim)
+            if chunk.dirty:
+                try:
+                    self.write_chunk(chunk)
+                except Exception as e:
+                    print(f"Failed to write back chunk {victim}: {e}")
+                    self.resident[victim] = chunk
+                    break
+            self.eviction_count += 1
+            if self.on_chunk_evicted:
+                self.on_chunk_evicted(*victim)
+    
+    def chunk_for_cell(self, x, y):
+        return self.resident.get((x // self.chunk_size, y // self.chunk_size))
+    
+    def is_region_resident(self, left, top, right, bottom):
+        for key in self.chunks_in_rect(left, top, right, bottom):
+            if key not in self.resident:
+                return False
+        return True
+    
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+        self.file.close()
+        if self.overlay:
+            self.overlay.close()
+
+class StreamedTileLayer:
+    def __init__(self, world):
+        self.world = world
+        self.width = world.grid_width
+        self.height = world.grid_height
+    
+    def __len__(self):
+        return self.height
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            y, x = key
+            return self.get(x, y)
+        return StreamedRow(self, key)
+    
+    def get(self, x, y):
+        chunk = self.world.chunk_for_cell(x, y)
+        if chunk is None:
+            return 0
+        size = self.world.chunk_size
+        return chunk.tiles.get(x - chunk.chunk_x * size, y - chunk.chunk_y * size)
+    
+    def set(self, x, y, value):
+        chunk = self.world.chunk_for_cell(x, y)
+        if chunk is not None:
+            size = self.world.chunk_size
+            chunk.tiles.set(x - chunk.chunk_x * size, y - chunk.chunk_y * size, value)
+            chunk.dirty = True
+
+class StreamedCollisionLayer:
+    def __init__(self, world):
+        self.world = world
+        self.width = world.grid_width
+        self.height = world.grid_height
+    
+    def __len__(self):
+        return self.height
+    
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            y, x = key
+            return self.get(x, y)
+        return StreamedRow(self, key)
+    
+    def get(self, x, y):
+        chunk = self.world.chunk_for_cell(x, y)
+        if chunk is None:
+            self.world.miss_count += 1
+            return self.world.unloaded_solid
+        size = self.world.chunk_size
+        return chunk.collision.get(x - chunk.chunk_x * size, y - chunk.chunk_y * size)
+    
+    def set(self, x, y, value):
+        chunk = self.world.chunk_for_cell(x, y)
+        if chunk is not None:
+            size = self.world.chunk_size
+            chunk.collision.set(x - chunk.chunk_x * size, y - chunk.chunk_y * size, value)
+            chunk.dirty = True
+    
+    def row_mask(self, y, x, width):
+        size = self.world.chunk_size
+        mask = 0
+        chunk_x = x // size
+        while chunk_x * size < x + width:
+            chunk = self.world.resident.get((chunk_x, y // size))
+            if chunk is None:
+                self.world.miss_count += 1
+                segment = ((1 << size) - 1) if self.world.unloaded_solid else 0
+            else:
+                segment = chunk.collision.row_mask(y - chunk.chunk_y * size)
+            mask |= segment << (chunk_x * size)
+            chunk_x += 1
+        return mask & (((1 << width) - 1) << x)
+    
+    def any_in_region(self, x, y, width, height):
+        for row_y in range(y, y + height):
+            if self.row_mask(row_y, x, width):
+                return True
+        return False
+    
+    def cells_in_region(self, x, y, width, height):
+        for row_y in range(y, y + height):
+            mask = self.row_mask(row_y, x, width)
+            while mask:
+                low_bit = mask & -mask
+                yield low_bit.bit_length() - 1, row_y
+                mask ^= low_bit
+
+class StreamedRow:
+    def __init__(self, layer, y):
+        self.layer = layer
+        self.y = y
+    
+    def __getitem__(self, x):
+        return self.layer.get(x, self.y)
@@ -0,0 +1,92 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from game import Game
+from engine.assets import AssetManager
+from Core.tilemap import Tilemap
+
+LOGO = os.path.join("Assets", "Util", "engine_logo.png")
+TILESET = os.path.join("Assets", "world_tileset.png")
+
+def serial_load(level_path):
+    start = time.perf_counter()
+    pygame.image.load(LOGO).convert_alpha()
+    tilemap = Tilemap()
+    tilemap.load_tilemap(level_path)
+    tilemap.load_tileset(TILESET)
+    return time.perf_counter() - start
+
+def splash_load(frame_time):
+    start = time.perf_counter()
+    game = Game()
+    init_time = time.perf_counter() - start
+    window = game.window
+    window.max_fps = 0
+    
+    frames = 0
+    worst = 0.0
+    while not game.level_loaded:
+        window.dt = frame_time
+        start = time.perf_counter()
+        game.update()
+        game.render()
+        worst = max(worst, time.perf_counter() - start)
+        frames += 1
+        time.sleep(frame_time)
+    
+    start = time.perf_counter()
+    game.start()
+    start_time = time.perf_counter() - start
+    level_path = game.level_path
+    pygame.quit()
+    return init_time, frames, worst, start_time, level_path
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure asset preloading during the splash and surface cache behaviour")
+    parser.add_argument("--frame-time", type=float, default=1 / 60)
+    parser.add_argument("--gets", type=int, default=1000)
+    args = parser.parse_args()
+    
+    init_time, frames, worst, start_time, level_path = splash_load(args.frame_time)
+    
+    pygame.init()
+    pygame.display.set_mode((320, 180))
+    serial = min(serial_load(level_path) for _ in range(3))
+    print(f"serial load of logo, level and tileset: {serial * 1000:.2f} ms on the main thread")
+    print(f"Game() with preload: {init_time * 1000:.2f} ms, level ready after {frames} splash frames "
+          f"(slowest frame {worst * 1000:.2f} ms), start() {start_time * 1000:.3f} ms")
+    
+    assets = AssetManager()
+    for _ in range(3):
+        assets.request(TILESET)
+    assets.get(TILESET)
+    print(f"3 requests + get of one path: {assets.loads} decode")
+    
+    start = time.perf_counter()
+    for _ in range(args.gets):
+        assets.get(TILESET)
+    cached = (time.perf_counter() - start) / args.gets
+    start = time.perf_counter()
+    for _ in range(max(1, args.gets // 50)):
+        pygame.image.load(TILESET).convert_alpha()
+    uncached = (time.perf_counter() - start) / max(1, args.gets // 50)
+    print(f"get(tileset): cached {cached * 1e6:.2f} us, load+convert {uncached * 1e6:.1f} us ({uncached / cached:.0f}x)")
+    
+    tileset_bytes = assets.cache_bytes
+    small = AssetManager(budget=tileset_bytes + 64 * 1024)
+    small.get(TILESET)
+    small.get(TILESET, "opaque")
+    small.get(LOGO)
+    small.get(TILESET, "opaque")
+    print(f"budget {small.budget // 1024} KiB: {small.describe()}")
+    assets.close()
+    small.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
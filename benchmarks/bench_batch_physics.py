@@ -0,0 +1,139 @@
+import sys
+import os
+import argparse
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+import numpy as np
+from Core.tilemap import Tilemap
+from Core.player import Player
+from Core.collision_system import CollisionSystem
+from Core.batch_physics import BatchPhysics
+
+class ScriptedKeys:
+    def __init__(self):
+        self.left = False
+        self.right = False
+        self.jump = False
+    
+    def __getitem__(self, key):
+        if key in (pygame.K_LEFT, pygame.K_a):
+            return self.left
+        if key in (pygame.K_RIGHT, pygame.K_d):
+            return self.right
+        if key in (pygame.K_SPACE, pygame.K_x, pygame.K_UP, pygame.K_w):
+            return self.jump
+        return False
+
+def free_position(tilemap, rng):
+    while True:
+        x = rng.uniform(0, (tilemap.grid_width - 1) * tilemap.tile_size)
+        y = rng.uniform(0, (tilemap.grid_height - 1) * tilemap.tile_size)
+        if not tilemap.any_collision_in_rect(pygame.Rect(x, y, 16, 16)):
+            return x, y
+
+def random_inputs(rng, count):
+    return ([rng.random() < 0.4 for _ in range(count)],
+            [rng.random() < 0.4 for _ in range(count)],
+            [rng.random() < 0.3 for _ in range(count)])
+
+def step_players(players, keys, collision_system, tilemap, dt):
+    for player, key_state in zip(players, keys):
+        player.update(key_state, dt, collision_system, tilemap)
+
+def mismatch(players, physics):
+    b = physics.bodies
+    for index, player in enumerate(players):
+        for name in ("x", "y", "vel_x", "vel_y", "jump_time", "coyote_timer", "on_ground", "is_jumping"):
+            if getattr(player, name) != b.view(name)[index]:
+                return index, name, getattr(player, name), b.view(name)[index]
+    return None
+
+def check_regression(tilemap, count, frames, seed):
+    rng = random.Random(seed)
+    collision_system = CollisionSystem()
+    physics = BatchPhysics()
+    physics.bind(tilemap)
+    
+    players = [Player(32, 32)]
+    for _ in range(count - 1):
+        players.append(Player(*free_position(tilemap, rng)))
+    for player in players:
+        physics.bodies.add(player.x, player.y, player.width, player.height)
+    keys = [ScriptedKeys() for _ in players]
+    
+    for frame in range(frames):
+        if frame % 15 == 0:
+            left, right, jump = random_inputs(rng, count)
+            for key_state, l, r, j in zip(keys, left, right, jump):
+                key_state.left, key_state.right, key_state.jump = l, r, j
+            physics.bodies.set_input(left, right, jump)
+        dt = 1 / 60 if frame % 50 else rng.uniform(1 / 240, 1 / 20)
+        
+        step_players(players, keys, collision_system, tilemap, dt)
+        physics.step(dt)
+        
+        diff = mismatch(players, physics)
+        if diff:
+            index, name, expected, actual = diff
+            print(f"Regression failed at frame {frame}: body {index} {name} player={expected!r} batch={actual!r}")
+            return False
+    return True
+
+def measure(tilemap, count, frames, seed):
+    rng = random.Random(seed)
+    collision_system = CollisionSystem()
+    physics = BatchPhysics()
+    physics.bind(tilemap)
+    players = []
+    for _ in range(count):
+        x, y = free_position(tilemap, rng)
+        players.append(Player(x, y))
+        physics.bodies.add(x, y)
+    keys = [ScriptedKeys() for _ in players]
+    left, right, jump = random_inputs(rng, count)
+    for key_state, l, r, j in zip(keys, left, right, jump):
+        key_state.left, key_state.right, key_state.jump = l, r, j
+    physics.bodies.set_input(np.array(left), np.array(right), np.array(jump))
+    
+    start = time.perf_counter()
+    for _ in range(frames):
+        step_players(players, keys, collision_system, tilemap, 1 / 60)
+    scalar = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for _ in range(frames):
+        physics.step(1 / 60)
+    batch = time.perf_counter() - start
+    
+    return scalar, batch
+
+def main():
+    parser = argparse.ArgumentParser(description="Check batch physics against Player and report bodies simulated per millisecond")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--counts", default="1,100,1000,10000")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--regression-bodies", type=int, default=200)
+    parser.add_argument("--regression-frames", type=int, default=1200)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level):
+        return 1
+    
+    if not check_regression(tilemap, args.regression_bodies, args.regression_frames, args.seed):
+        return 1
+    print(f"Regression passed: {args.regression_bodies} bodies match Player for {args.regression_frames} frames")
+    
+    for count in [int(value) for value in args.counts.split(",")]:
+        scalar, batch = measure(tilemap, count, args.frames, args.seed)
+        simulated = count * args.frames
+        print(f"{count:>6} bodies: scalar {simulated / (scalar * 1000):9.1f} bodies/ms, "
+              f"batch {simulated / (batch * 1000):9.1f} bodies/ms ({scalar / batch:5.1f}x)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
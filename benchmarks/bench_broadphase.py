@@ -0,0 +1,107 @@
+import sys
+import os
+import argparse
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.broadphase import SpatialHash
+
+class Mover:
+    def __init__(self, x, y, width, height, vel_x, vel_y):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.vel_x = vel_x
+        self.vel_y = vel_y
+
+def spawn_movers(count, world_size, rng):
+    movers = []
+    for _ in range(count):
+        size = rng.choice((8, 16, 16, 24, 32))
+        movers.append(Mover(rng.uniform(0, world_size - size), rng.uniform(0, world_size - size), size, size,
+                            rng.uniform(-200, 200), rng.uniform(-200, 200)))
+    return movers
+
+def step(movers, world_size, dt):
+    for mover in movers:
+        mover.x += mover.vel_x * dt
+        mover.y += mover.vel_y * dt
+        if mover.x < 0 or mover.x + mover.width > world_size:
+            mover.vel_x = -mover.vel_x
+            mover.x = min(max(mover.x, 0), world_size - mover.width)
+        if mover.y < 0 or mover.y + mover.height > world_size:
+            mover.vel_y = -mover.vel_y
+            mover.y = min(max(mover.y, 0), world_size - mover.height)
+
+def naive_pairs(movers):
+    pairs = 0
+    count = len(movers)
+    for i in range(count - 1):
+        a = movers[i]
+        for j in range(i + 1, count):
+            b = movers[j]
+            if a.x < b.x + b.width and b.x < a.x + a.width and a.y < b.y + b.height and b.y < a.y + a.height:
+                pairs += 1
+    return pairs
+
+def run(count, frames, density, naive_limit, seed):
+    rng = random.Random(seed)
+    world_size = int((count * density) ** 0.5) + 256
+    movers = spawn_movers(count, world_size, rng)
+    broadphase = SpatialHash()
+    for handle, mover in enumerate(movers):
+        broadphase.insert(handle, mover.x, mover.y, mover.width, mover.height)
+    
+    update_time = 0.0
+    pair_time = 0.0
+    candidates = 0
+    overlaps = 0
+    rebucketed = 0
+    for _ in range(frames):
+        step(movers, world_size, 1 / 60)
+        broadphase.stats.reset()
+        
+        start = time.perf_counter()
+        for handle, mover in enumerate(movers):
+            broadphase.update(handle, mover.x, mover.y, mover.width, mover.height)
+        update_time += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        broadphase.query_pairs()
+        pair_time += time.perf_counter() - start
+        
+        candidates += broadphase.stats.candidate_pairs
+        overlaps += broadphase.stats.overlapping_pairs
+        rebucketed += broadphase.stats.rebucketed
+    
+    naive_time = None
+    if count <= naive_limit:
+        start = time.perf_counter()
+        expected = naive_pairs(movers)
+        naive_time = time.perf_counter() - start
+        found = len(broadphase.query_pairs())
+        if found != expected:
+            print(f"Pair mismatch at {count} entities: broadphase {found}, naive {expected}")
+    
+    return update_time / frames, pair_time / frames, candidates / frames, overlaps / frames, rebucketed / frames, naive_time
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure spatial hash broadphase cost as the entity count grows")
+    parser.add_argument("--counts", default="10,100,1000,5000,10000")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--density", type=float, default=4096.0, help="world pixels squared per entity")
+    parser.add_argument("--naive-limit", type=int, default=2000, help="largest count to check against the O(n^2) pass")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    
+    print(f"{'entities':>8} {'update ms':>10} {'pairs ms':>9} {'candidates':>11} {'overlaps':>9} {'rebucket':>9} {'naive ms':>9}")
+    for count in [int(value) for value in args.counts.split(",")]:
+        update, pairs, candidates, overlaps, rebucketed, naive = run(count, args.frames, args.density, args.naive_limit, args.seed)
+        naive_text = f"{naive * 1000:9.2f}" if naive is not None else f"{'-':>9}"
+        print(f"{count:>8} {update * 1000:10.3f} {pairs * 1000:9.3f} {candidates:11.0f} {overlaps:9.1f} {rebucketed:9.1f} {naive_text}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from game import Game
+from engine.input import ScriptedInput
+
+def uncached_info(debug_system, screen):
+    y_offset = 5
+    for line in debug_system.info_lines:
+        text_surface = debug_system.font.render(line, False, (255, 255, 255))
+        bg_rect = pygame.Rect(5, y_offset, text_surface.get_width() + 4, text_surface.get_height() + 2)
+        pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
+        screen.blit(text_surface, (7, y_offset + 1))
+        y_offset += 18
+
+def run_frames(game, frames, debug):
+    window = game.window
+    debug_system = game.debug_system
+    debug_system.enable(debug)
+    game.collision_system.enable_debug(debug)
+    for _ in range(30):
+        window.dt = game.timestep.step
+        game.update()
+        game.render()
+    
+    total = 0.0
+    text = 0.0
+    for _ in range(frames):
+        window.dt = game.timestep.step
+        start = time.perf_counter()
+        game.update()
+        game.render()
+        total += time.perf_counter() - start
+        if debug:
+            start = time.perf_counter()
+            debug_system.render_info(window.virtual_screen)
+            debug_system.render_fps(window.virtual_screen, window.clock)
+            text += time.perf_counter() - start
+        window.present()
+    return total / frames, text / frames
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the frame cost of the F1 debug overlay")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--refresh-rate", type=float, default=10)
+    args = parser.parse_args()
+    
+    game = Game(input_source=ScriptedInput.parse("right:60,right+jump:12,left:60", loop=True))
+    game.start()
+    game.window.max_fps = 0
+    game.debug_system.refresh_rate = args.refresh_rate
+    
+    off, _ = run_frames(game, args.frames, False)
+    on, text = run_frames(game, args.frames, True)
+    debug_system = game.debug_system
+    screen = game.window.virtual_screen
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        uncached_info(debug_system, screen)
+    uncached = (time.perf_counter() - start) / args.frames
+    
+    print(f"frame: debug off {off * 1000:.3f} ms, debug on {on * 1000:.3f} ms (+{(on - off) * 1000:.3f} ms)")
+    print(f"text overlay: cached {text * 1e6:.1f} us/frame, font.render per line {uncached * 1e6:.1f} us/frame "
+          f"({uncached / max(text, 1e-9):.1f}x), {len(debug_system.info_lines)} lines, "
+          f"{debug_system.line_renders} line rebuilds at {args.refresh_rate:g} Hz")
+    cache = debug_system.text_cache
+    print(f"text cache: {len(cache.surfaces)} strings, {cache.hits} hits, {cache.misses} misses, {cache.evictions} evictions")
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
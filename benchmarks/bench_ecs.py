@@ -0,0 +1,89 @@
+import sys
+import os
+import argparse
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Core.tilemap import Tilemap
+from Core.collision_system import CollisionSystem
+from Core.ecs import create_default_world
+
+class DictBody:
+    def __init__(self, x, y, width, height, surface):
+        self.x = x + 0.5
+        self.y = y + 0.5
+        self.vel_x = x * 0.01
+        self.vel_y = y * 0.01
+        self.width = width
+        self.height = height
+        self.on_ground = False
+        self.is_jumping = False
+        self.jump_time = y * 0.001
+        self.gravity = 800.0
+        self.max_fall_speed = 300.0
+        self.surface = surface
+
+def spawn_positions(tilemap, count, rng):
+    world_width = tilemap.grid_width * tilemap.tile_size
+    world_height = tilemap.grid_height * tilemap.tile_size
+    return [(rng.uniform(0, world_width - 16), rng.uniform(0, world_height - 16)) for _ in range(count)]
+
+def measure_memory(positions, surface):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [DictBody(x, y, 16, 16, surface) for x, y in positions]
+    dict_bytes = tracemalloc.get_traced_memory()[0] - before
+    del objects
+    
+    before = tracemalloc.get_traced_memory()[0]
+    world = create_default_world()
+    for x, y in positions:
+        world.spawn_body(x, y, 16, 16, surface)
+    ecs_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return dict_bytes, ecs_bytes, world
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-system timing and memory per entity for the entity world")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--counts", default="100,1000,5000")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+    
+    pygame.init()
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level):
+        return 1
+    screen = pygame.Surface((320, 180))
+    surface = pygame.Surface((16, 16))
+    surface.fill((200, 160, 60))
+    collision_system = CollisionSystem()
+    
+    for count in [int(value) for value in args.counts.split(",")]:
+        rng = random.Random(args.seed)
+        positions = spawn_positions(tilemap, count, rng)
+        dict_bytes, ecs_bytes, world = measure_memory(positions, surface)
+        
+        totals = {}
+        for frame in range(args.frames):
+            world.update(1 / 60, None, collision_system, tilemap)
+            camera_x = (frame * 4) % max(1, tilemap.grid_width * tilemap.tile_size - 320)
+            world.render(screen, camera_x, 0)
+            for name, elapsed in world.system_times.items():
+                totals[name] = totals.get(name, 0.0) + elapsed
+        
+        store_total, entities, per_entity, store_bytes = world.memory_report()
+        timings = ", ".join(f"{name} {elapsed * 1000 / args.frames:.2f} ms" for name, elapsed in totals.items())
+        print(f"{count:>6} entities: {timings}")
+        print(f"        memory: stores {per_entity:.0f} B/entity, traced {ecs_bytes / count:.0f} B/entity vs "
+              f"{dict_bytes / count:.0f} B/entity for dict-backed objects holding live float state")
+        largest = sorted(store_bytes.items(), key=lambda item: -item[1])[:3]
+        print("        largest stores: " + ", ".join(f"{name} {size / 1024:.1f} KiB" for name, size in largest))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
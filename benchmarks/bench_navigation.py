@@ -0,0 +1,163 @@
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.tilemap import Tilemap
+from Core.player import Player
+from Core.grid import TileGrid, BitGrid
+from Core.level_format import Level, save_binary_level
+
+def path_cost(navigation, path):
+    total = 0
+    for (node, kind), (next_node, _) in zip(path, path[1:]):
+        for target, cost, edge_kind in navigation.nodes[node]:
+            if target == next_node and edge_kind == kind:
+                total += cost
+                break
+        else:
+            return None
+    return total
+
+def synthetic_level(width, height, rng):
+    tiles = TileGrid(width, height)
+    collision = BitGrid(width, height)
+    for x in range(width):
+        collision.set(x, height - 1, True)
+    for _ in range(width * height // 40):
+        length = rng.randint(3, 10)
+        x = rng.randrange(width - length)
+        y = rng.randrange(4, height - 2)
+        for cell in range(x, x + length):
+            collision.set(cell, y, True)
+    for x, y in collision.cells_in_region(0, 0, width, height):
+        tiles.set(x, y, 1)
+    return Level(16, tiles, collision)
+
+def step_level(width=16, height=8, step_x=8):
+    tiles = TileGrid(width, height)
+    collision = BitGrid(width, height)
+    for x in range(width):
+        collision.set(x, height - 1, True)
+    for x in range(step_x, width):
+        collision.set(x, height - 2, True)
+    for x, y in collision.cells_in_region(0, 0, width, height):
+        tiles.set(x, y, 1)
+    return Level(16, tiles, collision)
+
+def check_climb():
+    level_path = os.path.join(tempfile.mkdtemp(), "nav_step.lvl")
+    save_binary_level(level_path, step_level())
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(level_path):
+        return False
+    navigation = tilemap.build_navigation(Player(0, 0))
+    tile_size = tilemap.tile_size
+    height = tilemap.grid_height
+    path = tilemap.find_path(2 * tile_size + 8, (height - 2) * tile_size + 8, 12 * tile_size + 8, (height - 3) * tile_size + 8)
+    assert path is not None, "no path up a one-tile step"
+    assert any(kind == "jump" for _, kind in path), "climb path has no jump edge"
+    back = tilemap.find_path(12 * tile_size + 8, (height - 3) * tile_size + 8, 2 * tile_size + 8, (height - 2) * tile_size + 8)
+    assert back is not None, "no path down a one-tile step"
+    print(f"One-tile step: climb path of {len(path)} nodes, descent path of {len(back)} nodes "
+          f"(max rise {navigation.envelope.max_rise} tiles)")
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate AI agents re-pathing once per second on the navigation graph")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--synthetic", default="256x128", help="generate a random platform level of WxH tiles instead (empty to use --level)")
+    parser.add_argument("--agents", type=int, default=500)
+    parser.add_argument("--seconds", type=int, default=20)
+    parser.add_argument("--goals", type=int, default=4, help="number of distinct targets the agents chase")
+    parser.add_argument("--steps-per-second", type=int, default=4, help="path nodes an agent advances between re-paths")
+    parser.add_argument("--edit-every", type=int, default=5, help="toggle one collision cell every N seconds (0 disables)")
+    parser.add_argument("--seed", type=int, default=9)
+    args = parser.parse_args()
+    
+    if not check_climb():
+        return 1
+    
+    rng = random.Random(args.seed)
+    level_path = args.level
+    if args.synthetic:
+        width, height = (int(value) for value in args.synthetic.lower().split("x"))
+        level_path = os.path.join(tempfile.mkdtemp(), "nav_bench.lvl")
+        save_binary_level(level_path, synthetic_level(width, height, rng))
+    
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(level_path):
+        return 1
+    
+    start = time.perf_counter()
+    navigation = tilemap.build_navigation(Player(0, 0))
+    build_time = time.perf_counter() - start
+    edges = sum(len(edge_list) for edge_list in navigation.nodes.values())
+    print(f"Built {len(navigation.nodes)} nodes / {edges} edges in {build_time * 1000:.1f} ms "
+          f"(max rise {navigation.envelope.max_rise} tiles, max reach {navigation.envelope.max_reach} tiles)")
+    
+    node_list = list(navigation.nodes)
+    agents = [rng.choice(node_list) for _ in range(args.agents)]
+    goals = [rng.choice(node_list) for _ in range(args.goals)]
+    tile_size = tilemap.tile_size
+    
+    repath_time = 0.0
+    edit_time = 0.0
+    worst_second = 0.0
+    invalid = 0
+    for second in range(args.seconds):
+        if args.edit_every and second and second % args.edit_every == 0:
+            x = rng.randrange(tilemap.grid_width)
+            y = rng.randrange(tilemap.grid_height)
+            start = time.perf_counter()
+            tilemap.set_collision(x, y, not tilemap.collision_data.get(x, y))
+            navigation.refresh()
+            edit_time += time.perf_counter() - start
+            node_list = list(navigation.nodes)
+            agents = [agent if agent in navigation.nodes else rng.choice(node_list) for agent in agents]
+            goals = [goal if goal in navigation.nodes else rng.choice(node_list) for goal in goals]
+        if second % 5 == 0:
+            goals[rng.randrange(len(goals))] = rng.choice(node_list)
+        
+        start = time.perf_counter()
+        paths = []
+        for index, agent in enumerate(agents):
+            goal = goals[index % len(goals)]
+            agent_x, agent_y = navigation.node_cell(agent)
+            goal_x, goal_y = navigation.node_cell(goal)
+            paths.append(tilemap.find_path(agent_x * tile_size + 8, agent_y * tile_size + 8, goal_x * tile_size + 8, goal_y * tile_size + 8))
+        elapsed = time.perf_counter() - start
+        repath_time += elapsed
+        worst_second = max(worst_second, elapsed)
+        
+        for index, path in enumerate(paths):
+            if path:
+                if path_cost(navigation, path) is None:
+                    invalid += 1
+                agents[index] = path[min(args.steps_per_second, len(path) - 1)][0]
+    
+    sample = rng.sample(range(len(agents)), min(50, len(agents)))
+    mismatched = 0
+    for index in sample:
+        goal = goals[index % len(goals)]
+        cached = navigation.find_node_path(agents[index], goal)
+        fresh = navigation.search(agents[index], goal)
+        if (cached is None) != (fresh is None) or cached and path_cost(navigation, cached) != path_cost(navigation, fresh):
+            mismatched += 1
+    
+    queries = args.agents * args.seconds
+    print(f"{args.agents} agents x {args.seconds} s: {repath_time * 1000 / args.seconds:.2f} ms of re-pathing per second "
+          f"(worst {worst_second * 1000:.2f} ms), {queries / repath_time:.0f} queries/s capacity")
+    print(f"Cache hits {navigation.cache_hits}/{navigation.query_count}, A* searches {navigation.search_count}, "
+          f"nodes expanded {navigation.expanded_count}, cached paths {len(navigation.paths)}")
+    if args.edit_every:
+        edits = (args.seconds - 1) // args.edit_every
+        print(f"{edits} cell edits, {edit_time * 1000 / max(1, edits):.2f} ms per incremental rebuild vs {build_time * 1000:.1f} ms full build")
+    print(f"{invalid} paths with missing edges, {mismatched}/{len(sample)} cached paths costlier than a fresh search")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
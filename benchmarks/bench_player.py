@@ -0,0 +1,72 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Core.tilemap import Tilemap
+from Core.collision_system import CollisionSystem
+from Core.ecs import create_default_world
+from Core.player import Player, PlayerBody
+from engine.input import ScriptedInput
+
+class PropertyPlayer(Player):
+    __slots__ = ()
+    
+    handle_input = PlayerBody.handle_input
+    start_jump = PlayerBody.start_jump
+    continue_jump = PlayerBody.continue_jump
+    apply_physics = PlayerBody.apply_physics
+    
+    def update(self, keys, dt, collision_system=None, tilemap=None):
+        self.handle_input(keys, dt)
+        self.apply_physics(dt)
+        if collision_system and tilemap:
+            collision_system.handle_entity_collision(self, tilemap, dt)
+
+def run(player_class, tilemap, script, ticks, dt):
+    world = create_default_world()
+    player = player_class(32, 32, world)
+    collision_system = None
+    if tilemap:
+        collision_system = CollisionSystem()
+        collision_system.register_entity(player.entity, player.x, player.y, player.width, player.height)
+    source = ScriptedInput.parse(script, loop=True)
+    inputs = [source.poll(tick) for tick in range(ticks)]
+    path = []
+    start = time.perf_counter()
+    for keys in inputs:
+        player.update(keys, dt, collision_system, tilemap)
+        path.append((player.x, player.y, player.vel_x, player.vel_y))
+    return (time.perf_counter() - start) / ticks, path
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Player.update through per-field store properties against a synced body")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--script", default="right:60,right+jump:12,left:60,jump:20")
+    args = parser.parse_args()
+    
+    pygame.init()
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level):
+        return 1
+    
+    dt = 1 / 60
+    before, _ = run(PropertyPlayer, None, args.script, args.ticks, dt)
+    after, _ = run(Player, None, args.script, args.ticks, dt)
+    print(f"Player.update alone:          properties {before * 1e6:.2f} us, synced body {after * 1e6:.2f} us ({before / after:.1f}x)")
+    before, before_path = run(PropertyPlayer, tilemap, args.script, args.ticks, dt)
+    after, after_path = run(Player, tilemap, args.script, args.ticks, dt)
+    print(f"Player.update with collision: properties {before * 1e6:.2f} us, synced body {after * 1e6:.2f} us ({before / after:.1f}x)")
+    
+    if before_path != after_path:
+        print("FAIL: trajectories differ")
+        return 1
+    print(f"trajectories identical over {args.ticks} ticks")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
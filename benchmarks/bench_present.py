@@ -0,0 +1,81 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from game import Game
+from engine.input import ScriptedInput
+
+SCENARIOS = {
+    "splash": None,
+    "idle": "idle:600",
+    "walk": "right:60,left:60",
+    "jump": "right+jump:12,right:48,left+jump:12,left:48",
+}
+
+def expected_display(window):
+    expected = pygame.Surface(window.viewport.size, 0, window.screen)
+    pygame.transform.scale(window.virtual_screen, window.viewport.size, expected)
+    return pygame.image.tobytes(expected, "RGB")
+
+def run(scenario, frames, threshold, window_size, verify):
+    script = SCENARIOS[scenario]
+    game = Game(input_source=ScriptedInput.parse(script) if script else None, window_size=window_size)
+    window = game.window
+    window.max_fps = 0
+    window.dirty_threshold = threshold
+    if script:
+        game.start()
+        for _ in range(120):
+            window.dt = game.timestep.step
+            game.update()
+            game.render()
+            window.present()
+    window.present_total = 0.0
+    window.present_frames = 0
+    window.full_presents = window.partial_presents = window.skipped_presents = 0
+    
+    pixels = 0
+    mismatches = 0
+    render_time = 0.0
+    for frame in range(frames):
+        window.dt = game.timestep.step
+        game.update()
+        start = time.perf_counter()
+        game.render()
+        render_time += time.perf_counter() - start
+        window.present()
+        pixels += window.presented_pixels
+        if verify and pygame.image.tobytes(window.target, "RGB") != expected_display(window):
+            mismatches += 1
+    
+    result = (window.average_present_time(), render_time / frames, pixels / frames,
+              window.full_presents, window.partial_presents, window.skipped_presents, mismatches)
+    pygame.quit()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare dirty-rect presents against full flips")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--window", default="1280x720")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--no-verify", action="store_true")
+    args = parser.parse_args()
+    width, _, height = args.window.partition("x")
+    window_size = (int(width), int(height))
+    
+    for scenario in SCENARIOS:
+        full = run(scenario, args.frames, 0.0, window_size, False)
+        dirty = run(scenario, args.frames, args.threshold, window_size, not args.no_verify)
+        present, render, pixels, full_count, partial, skipped, mismatches = dirty
+        print(f"{scenario:>7}: full flips {full[0] * 1000:.3f} ms/frame, dirty rects {present * 1000:.3f} ms/frame "
+              f"({full[0] / max(present, 1e-9):.1f}x), {pixels:.0f} px/frame, render {render * 1000:.3f} ms "
+              f"[{full_count} full, {partial} partial, {skipped} skipped]"
+              + (f", {mismatches} frames differ from a full present" if mismatches else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
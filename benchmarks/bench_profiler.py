@@ -0,0 +1,68 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from game import Game
+from engine.input import ScriptedInput
+from engine.profiler import FrameProfiler, PHASE_NAMES, PRESENT
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cost of frame profiling and the percentile HUD")
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--laps", type=int, default=14, help="laps per frame, roughly what one game frame records")
+    parser.add_argument("--save", metavar="PNG", help="save a screenshot with the HUD visible")
+    args = parser.parse_args()
+    
+    profiler = FrameProfiler()
+    phases = len(PHASE_NAMES)
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        profiler.begin_frame()
+        for lap in range(args.laps):
+            profiler.lap(lap % phases)
+        profiler.end_frame()
+    per_frame = (time.perf_counter() - start) / args.frames
+    print(f"recording: {per_frame * 1e6:.2f} us/frame for {args.laps} laps ({per_frame / (args.laps + 2) * 1e9:.0f} ns per call)")
+    
+    start = time.perf_counter()
+    for _ in range(20):
+        profiler.summary()
+    print(f"summary of {profiler.count} frames x {phases + 1} series: {(time.perf_counter() - start) / 20 * 1000:.2f} ms")
+    
+    game = Game(input_source=ScriptedInput.parse("right:60,right+jump:12,left:60", loop=True))
+    game.start()
+    window = game.window
+    window.max_fps = 0
+    hud = game.profiler_hud
+    for visible in (False, True):
+        hud.visible = visible
+        game.overlay_rects = None
+        total = 0.0
+        for _ in range(600):
+            game.profiler.begin_frame()
+            window.dt = game.timestep.step
+            start = time.perf_counter()
+            game.update()
+            game.render()
+            total += time.perf_counter() - start
+            window.present()
+            game.profiler.lap(PRESENT)
+            game.profiler.end_frame()
+        print(f"update+render with HUD {'on ' if visible else 'off'}: {total / 600 * 1000:.3f} ms/frame")
+    if args.save:
+        pygame.image.save(pygame.transform.scale(window.virtual_screen, (960, 540)), args.save)
+    
+    summary = game.profiler.summary()
+    print(f"{'phase':<10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name in PHASE_NAMES + ("frame",):
+        stats = summary[name]
+        print(f"{name:<10} {stats['p50'] * 1000:>8.3f} {stats['p95'] * 1000:>8.3f} {stats['p99'] * 1000:>8.3f}")
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
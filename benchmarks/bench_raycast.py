@@ -0,0 +1,81 @@
+import sys
+import os
+import argparse
+import math
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.tilemap import Tilemap
+
+def sampled_distance(tilemap, origin_x, origin_y, dir_x, dir_y, max_distance, step):
+    distance = 0.0
+    while distance <= max_distance:
+        if tilemap.is_collision_at_position(origin_x + dir_x * distance, origin_y + dir_y * distance):
+            return distance
+        distance += step
+    return None
+
+def check(tilemap, rays, max_distance, rng):
+    world_width = tilemap.grid_width * tilemap.tile_size
+    world_height = tilemap.grid_height * tilemap.tile_size
+    errors = 0
+    for _ in range(rays):
+        origin_x = rng.uniform(0, world_width)
+        origin_y = rng.uniform(0, world_height)
+        angle = rng.uniform(0, math.tau)
+        dir_x = math.cos(angle)
+        dir_y = math.sin(angle)
+        hit = tilemap.raycast(origin_x, origin_y, dir_x, dir_y, max_distance)
+        sampled = sampled_distance(tilemap, origin_x, origin_y, dir_x, dir_y, max_distance, 0.25)
+        if sampled is None:
+            if hit.hit and hit.distance < max_distance - 0.25:
+                errors += 1
+        elif not hit.hit or hit.distance > sampled or sampled - hit.distance > 0.5:
+            errors += 1
+    return errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare DDA raycasts with point sampling and time visibility fans")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--rays", type=int, default=360)
+    parser.add_argument("--fans", type=int, default=200)
+    parser.add_argument("--max-distance", type=float, default=400.0)
+    parser.add_argument("--check-rays", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level):
+        return 1
+    
+    rng = random.Random(args.seed)
+    errors = check(tilemap, args.check_rays, args.max_distance, rng)
+    print(f"{args.check_rays} random rays checked against 0.25 px sampling: {errors} disagreements")
+    
+    world_width = tilemap.grid_width * tilemap.tile_size
+    world_height = tilemap.grid_height * tilemap.tile_size
+    origins = [(rng.uniform(0, world_width), rng.uniform(0, world_height)) for _ in range(args.fans)]
+    
+    hits = []
+    tilemap.raycaster.cells_visited = 0
+    start = time.perf_counter()
+    for origin_x, origin_y in origins:
+        tilemap.raycast_fan(origin_x, origin_y, args.rays, args.max_distance, hits=hits)
+    dda = time.perf_counter() - start
+    cells = tilemap.raycaster.cells_visited
+    
+    start = time.perf_counter()
+    directions = tilemap.raycaster.directions(args.rays, 0.0, math.tau)
+    for origin_x, origin_y in origins[:max(1, args.fans // 20)]:
+        for dir_x, dir_y in directions:
+            sampled_distance(tilemap, origin_x, origin_y, dir_x, dir_y, args.max_distance, 1.0)
+    sampled = (time.perf_counter() - start) * args.fans / max(1, args.fans // 20)
+    
+    total = args.fans * args.rays
+    print(f"DDA fans: {dda * 1000 / args.fans:.2f} ms per {args.rays}-ray fan, {cells / total:.1f} cells per ray")
+    print(f"1 px point sampling (extrapolated): {sampled * 1000 / args.fans:.2f} ms per fan ({sampled / dda:.1f}x slower)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import sys
+import os
+import argparse
+import math
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from Core.tilemap import Tilemap
+from Core.collision_system import CollisionSystem
+
+class Body:
+    def __init__(self, x, y, vel_x):
+        self.x = x
+        self.y = y
+        self.width = 16
+        self.height = 16
+        self.vel_x = vel_x
+        self.vel_y = 0
+        self.on_ground = False
+        self.is_jumping = False
+        self.jump_time = 0
+    
+    def get_rect(self):
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+def free_position(tilemap, rng):
+    while True:
+        x = rng.uniform(0, (tilemap.grid_width - 1) * tilemap.tile_size)
+        y = rng.uniform(0, (tilemap.grid_height - 1) * tilemap.tile_size)
+        if not tilemap.any_collision_in_rect(pygame.Rect(x, y, 16, 16)):
+            return x, y
+
+def spawn_bodies(tilemap, count, rng):
+    bodies = []
+    for _ in range(count):
+        x, y = free_position(tilemap, rng)
+        bodies.append(Body(x, y, rng.choice((-1, 1)) * rng.uniform(60, 400)))
+    return bodies
+
+def passed_through_wall(tilemap, body, start_x, start_y):
+    tile_size = tilemap.tile_size
+    rows = (int(start_y) // tile_size, (int(start_y) + body.height - 1) // tile_size)
+    if body.x > start_x:
+        wall = tilemap.first_solid_between("right", int((start_x + body.width) // tile_size), math.ceil((body.x + body.width) / tile_size) - 1, *rows)
+        if wall is not None and body.x + body.width > wall * tile_size:
+            return True
+    elif body.x < start_x:
+        wall = tilemap.first_solid_between("left", math.ceil(start_x / tile_size) - 1, int(body.x // tile_size), *rows)
+        if wall is not None and body.x < (wall + 1) * tile_size:
+            return True
+    
+    cols = (int(body.x) // tile_size, (int(body.x) + body.width - 1) // tile_size)
+    if body.y > start_y:
+        floor = tilemap.first_solid_between("down", int((start_y + body.height) // tile_size), math.ceil((body.y + body.height) / tile_size) - 1, *cols)
+        if floor is not None and body.y + body.height > floor * tile_size:
+            return True
+    elif body.y < start_y:
+        ceiling = tilemap.first_solid_between("up", math.ceil(start_y / tile_size) - 1, int(body.y // tile_size), *cols)
+        if ceiling is not None and body.y < (ceiling + 1) * tile_size:
+            return True
+    return False
+
+def run(tilemap, mode, count, frames, spike_every, spike_dt, seed):
+    collision_system = CollisionSystem(mode)
+    rng = random.Random(seed)
+    bodies = spawn_bodies(tilemap, count, rng)
+    speeds = [body.vel_x for body in bodies]
+    world_height = tilemap.grid_height * tilemap.tile_size
+    embedded = 0
+    tunneled = 0
+    lost = 0
+    elapsed = 0.0
+    
+    for frame in range(frames):
+        dt = spike_dt if spike_every and frame % spike_every == spike_every - 1 else 1 / 60
+        for body, speed in zip(bodies, speeds):
+            if body.vel_x == 0:
+                body.vel_x = -speed if frame % 2 else speed
+            if body.on_ground and frame % 40 == 0:
+                body.vel_y = -260
+            body.vel_y = min(body.vel_y + 800 * dt, 600)
+        
+        starts = [(body.x, body.y) for body in bodies]
+        start = time.perf_counter()
+        for body in bodies:
+            collision_system.handle_entity_collision(body, tilemap, dt)
+        elapsed += time.perf_counter() - start
+        
+        for body, (start_x, start_y) in zip(bodies, starts):
+            if passed_through_wall(tilemap, body, start_x, start_y):
+                tunneled += 1
+            if tilemap.any_collision_in_rect(body.get_rect()):
+                embedded += 1
+            if body.y > world_height:
+                lost += 1
+                body.x, body.y = free_position(tilemap, rng)
+                body.vel_y = 0
+    
+    return elapsed, embedded, tunneled, lost
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare discrete and swept collision resolution on many moving bodies")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--bodies", type=int, default=500)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--spike-every", type=int, default=30, help="insert a long frame every N frames (0 disables)")
+    parser.add_argument("--spike-dt", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level):
+        return 1
+    
+    for mode in CollisionSystem.MODES:
+        elapsed, embedded, tunneled, lost = run(tilemap, mode, args.bodies, args.frames, args.spike_every, args.spike_dt, args.seed)
+        resolved = args.bodies * args.frames
+        print(f"{mode:>8}: {elapsed * 1000:8.1f} ms total, {resolved / (elapsed * 1000):7.1f} bodies/ms, "
+              f"{tunneled} tunneled, {embedded} embedded body-frames, {lost} fell out of the map")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Core.tilemap import Tilemap
+from Core.tile_atlas import KIND_NAMES, EMPTY
+
+def alpha_tiles(tileset_image, tile_size):
+    tiles = []
+    for y in range(tileset_image.get_height() // tile_size):
+        for x in range(tileset_image.get_width() // tile_size):
+            tile = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+            tile.blit(tileset_image, (0, 0), pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size))
+            tiles.append(tile)
+    return tiles
+
+def time_blits(target, surface, count, rounds):
+    positions = [((index * 16) % (target.get_width() - 16), (index * 16 // target.get_width() * 16) % (target.get_height() - 16)) for index in range(count)]
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for position in positions:
+            target.blit(surface, position)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / count
+
+def bake_per_tile(tilemap, tiles, chunk_size, chunk_x, chunk_y):
+    tile_size = tilemap.tile_size
+    start_x = chunk_x * chunk_size
+    start_y = chunk_y * chunk_size
+    end_x = min(tilemap.grid_width, start_x + chunk_size)
+    end_y = min(tilemap.grid_height, start_y + chunk_size)
+    surface = None
+    for y in range(start_y, end_y):
+        row = tilemap.world_data[y]
+        for x in range(start_x, end_x):
+            tile_id = row[x]
+            if 0 < tile_id <= len(tiles):
+                if surface is None:
+                    surface = pygame.Surface(((end_x - start_x) * tile_size, (end_y - start_y) * tile_size), pygame.SRCALPHA)
+                surface.blit(tiles[tile_id - 1], ((x - start_x) * tile_size, (y - start_y) * tile_size))
+    if surface is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+def composited(surface, size):
+    background = pygame.Surface(size)
+    background.fill((135, 206, 235))
+    if surface is not None:
+        background.blit(surface, (0, 0))
+    return pygame.image.tobytes(background, "RGB")
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark opaque, colorkey and alpha tile blits and chunk baking")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--tileset", default=os.path.join("Assets", "world_tileset.png"))
+    parser.add_argument("--blits", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=16)
+    args = parser.parse_args()
+    
+    pygame.init()
+    pygame.display.set_mode((320, 180))
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level) or not tilemap.load_tileset(args.tileset):
+        return 1
+    
+    atlas = tilemap.atlas
+    old_tiles = alpha_tiles(tilemap.tileset_image, tilemap.tile_size)
+    print(f"tileset: {len(atlas)} tiles ({atlas.describe()})")
+    
+    screen = pygame.Surface((320, 180)).convert()
+    layer = pygame.Surface((256, 256), pygame.SRCALPHA)
+    for kind, name in KIND_NAMES.items():
+        if kind == EMPTY or kind not in atlas.kinds:
+            continue
+        index = atlas.kinds.index(kind)
+        for label, target in (("screen", screen), ("chunk", layer)):
+            before = time_blits(target, old_tiles[index], args.blits, args.rounds)
+            after = time_blits(target, atlas.tiles[index], args.blits, args.rounds)
+            print(f"{name:>9} tile onto {label:<6}: SRCALPHA {before * 1e9:7.0f} ns, atlas {after * 1e9:7.0f} ns ({before / after:.1f}x)")
+    
+    cache = tilemap.chunk_cache
+    cache.chunk_size = args.chunk_size
+    chunks_x = (tilemap.grid_width + args.chunk_size - 1) // args.chunk_size
+    chunks_y = (tilemap.grid_height + args.chunk_size - 1) // args.chunk_size
+    chunks = [(chunk_x, chunk_y) for chunk_y in range(chunks_y) for chunk_x in range(chunks_x)]
+    old_time = new_time = None
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        old = [bake_per_tile(tilemap, old_tiles, args.chunk_size, *chunk) for chunk in chunks]
+        elapsed = time.perf_counter() - start
+        old_time = elapsed if old_time is None else min(old_time, elapsed)
+        start = time.perf_counter()
+        new = [cache.bake_chunk(tilemap, *chunk) for chunk in chunks]
+        elapsed = time.perf_counter() - start
+        new_time = elapsed if new_time is None else min(new_time, elapsed)
+    size = (args.chunk_size * tilemap.tile_size, args.chunk_size * tilemap.tile_size)
+    mismatches = sum(1 for a, b in zip(old, new) if composited(a, size) != composited(b, size))
+    print(f"bake {len(chunks)} chunks: per-tile SRCALPHA {old_time * 1000:.2f} ms, atlas tiles {new_time * 1000:.2f} ms "
+          f"({old_time / new_time:.1f}x), {mismatches} chunks differ")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import sys
+import os
+import argparse
+import io
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.trace import Tracer
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-event cost of trace channels compared with formatted prints")
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+    
+    tracer = Tracer()
+    channel = tracer.channel("physics", (("y_from", "f"), ("y_to", "f"), ("vel_y_from", "f"), ("vel_y_to", "f"),
+                                         ("ground_from", "b"), ("ground_to", "b")))
+    values = (32.0, 34.5, 40.0, 53.3, False, True)
+    
+    start = time.perf_counter()
+    for _ in range(args.events):
+        if channel.enabled:
+            channel.emit(*values)
+    disabled = time.perf_counter() - start
+    
+    path = os.path.join(tempfile.mkdtemp(), "bench.trace")
+    tracer.start(path)
+    start = time.perf_counter()
+    for _ in range(args.events):
+        if channel.enabled:
+            channel.emit(*values)
+    enabled = time.perf_counter() - start
+    tracer.stop()
+    
+    sink = io.StringIO()
+    start = time.perf_counter()
+    for _ in range(args.events):
+        y_from, y_to, vel_from, vel_to, ground_from, ground_to = values
+        print(f"Y: {y_from:.2f} -> {y_to:.2f} | VelY: {vel_from:.2f} -> {vel_to:.2f} | Ground: {ground_from} -> {ground_to}", file=sink)
+    printed = time.perf_counter() - start
+    
+    print(f"disabled channel: {disabled * 1e9 / args.events:8.1f} ns/event")
+    print(f"enabled channel:  {enabled * 1e9 / args.events:8.1f} ns/event, {tracer.recorded} recorded, {tracer.dropped} dropped, "
+          f"{os.path.getsize(path) / max(1, tracer.recorded):.1f} bytes/event on disk")
+    print(f"print to memory:  {printed * 1e9 / args.events:8.1f} ns/event (a terminal is slower still)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+import sys
+import os
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from engine.transition import Transition
+
+def copying_render(screen, font, logo, alpha, text):
+    screen.fill((0, 0, 0))
+    if text:
+        surface = font.render("powered by", False, (255, 255, 255)).convert_alpha()
+    else:
+        surface = logo.copy()
+    surface.set_alpha(alpha)
+    return screen.blit(surface, surface.get_rect(center=screen.get_rect().center))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-frame splash rendering with copies against a prepared Transition")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--size", default="320x180")
+    args = parser.parse_args()
+    width, _, height = args.size.partition("x")
+    size = (int(width), int(height))
+    
+    pygame.init()
+    pygame.display.set_mode(size)
+    screen = pygame.Surface(size).convert()
+    font = pygame.font.Font(None, 20)
+    logo = pygame.image.load(os.path.join("Assets", "Util", "engine_logo.png")).convert_alpha()
+    logo = pygame.transform.scale(logo, (int(size[0] * 0.8), int(size[0] * 0.8 * logo.get_height() / logo.get_width())))
+    text = font.render("powered by", False, (255, 255, 255)).convert_alpha()
+    alphas = [frame * 255 // args.frames for frame in range(args.frames)]
+    
+    for label, is_text in (("text", True), ("logo", False)):
+        start = time.perf_counter()
+        for alpha in alphas:
+            copying_render(screen, font, logo, alpha, is_text)
+        copying = (time.perf_counter() - start) / args.frames
+        
+        transition = Transition([("fade", label, 1.0, 0, 255)], size)
+        transition.add_layer(label, text if is_text else logo)
+        pixels = 0
+        for frame in range(args.frames):
+            transition.update(1.0 / args.frames)
+            pixels += sum(rect.width * rect.height for rect in transition.render(screen))
+        print(f"{label}: copy per frame {copying * 1e6:.1f} us, transition {transition.average_render_time() * 1e6:.1f} us "
+              f"({copying / transition.average_render_time():.1f}x), {pixels / args.frames:.0f} px dirty/frame")
+    
+    fade = Transition.fade(size, duration=1.0)
+    for frame in range(args.frames):
+        fade.update(1.0 / args.frames)
+        fade.render(screen)
+    print(f"full-screen fade overlay: {fade.average_render_time() * 1e6:.1f} us/frame")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+import sys
+import os
+import math
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from Core.tilemap import Tilemap
+
+SKY = (135, 206, 235)
+
+def camera_path(kind, frames, max_x, max_y, rng):
+    x = max_x / 2
+    y = max_y / 2
+    for frame in range(frames):
+        if kind == "still":
+            pass
+        elif kind == "walk":
+            x = (x + 1.3) % max_x
+        elif kind == "diagonal":
+            x = (x + 2.1) % max_x
+            y = max_y / 2 + math.sin(frame * 0.05) * max_y / 2
+        elif kind == "jumpy":
+            if frame % 30 == 0:
+                x = rng.uniform(0, max_x)
+                y = rng.uniform(0, max_y)
+            else:
+                x = min(max_x, x + 1.7)
+        yield x, y
+
+def full_redraw(tilemap, screen, camera_x, camera_y):
+    screen.fill(SKY)
+    tilemap.render(screen, math.floor(camera_x), math.floor(camera_y))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare scroll-reuse world layer rendering against full redraws")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--tileset", default=os.path.join("Assets", "world_tileset.png"))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--edits", type=int, default=1, help="tile edits per 10 frames during the verification pass")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    pygame.init()
+    pygame.display.set_mode((320, 180))
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(args.level) or not tilemap.load_tileset(args.tileset):
+        return 1
+    
+    screen = pygame.Surface((320, 180)).convert()
+    reference = pygame.Surface((320, 180)).convert()
+    max_x = max(0, tilemap.grid_width * tilemap.tile_size - 320)
+    max_y = max(0, tilemap.grid_height * tilemap.tile_size - 180)
+    tile_count = len(tilemap.tile_surfaces)
+    failures = 0
+    
+    for kind in ("still", "walk", "diagonal", "jumpy"):
+        rng = random.Random(args.seed)
+        tilemap.disable_world_layer()
+        path = list(camera_path(kind, args.frames, max_x, max_y, rng))
+        
+        start = time.perf_counter()
+        for camera_x, camera_y in path:
+            full_redraw(tilemap, screen, camera_x, camera_y)
+        full_time = time.perf_counter() - start
+        
+        layer = tilemap.enable_world_layer(320, 180, SKY)
+        update_time = 0.0
+        start = time.perf_counter()
+        for camera_x, camera_y in path:
+            update_start = time.perf_counter()
+            surface = layer.render(tilemap, camera_x, camera_y)
+            update_time += time.perf_counter() - update_start
+            screen.blit(surface, (0, 0))
+        layer_time = time.perf_counter() - start
+        
+        print(f"{kind:>8}: full {full_time * 1e6 / args.frames:7.1f} us/frame, "
+              f"layer {layer_time * 1e6 / args.frames:7.1f} us/frame ({full_time / layer_time:.1f}x, "
+              f"{update_time * 1e6 / args.frames:.1f} us updating the layer, the rest compositing), "
+              f"{layer.full_redraws} full redraws, {layer.scrolls} scrolls")
+        
+        layer = tilemap.enable_world_layer(320, 180, SKY)
+        for frame, (camera_x, camera_y) in enumerate(path):
+            if args.edits and frame % 10 == 0:
+                for _ in range(args.edits):
+                    grid_x = int((camera_x + rng.uniform(0, 320)) // tilemap.tile_size)
+                    grid_y = int((camera_y + rng.uniform(0, 180)) // tilemap.tile_size)
+                    tilemap.set_tile(grid_x, grid_y, rng.randint(0, tile_count))
+            tilemap.render_world_layer(screen, camera_x, camera_y)
+            full_redraw(tilemap, reference, camera_x, camera_y)
+            if pygame.image.tobytes(screen, "RGB") != pygame.image.tobytes(reference, "RGB"):
+                failures += 1
+                print(f"  mismatch against full redraw on {kind} frame {frame}")
+                break
+    
+    tilemap.disable_world_layer()
+    print("verification: " + ("layer matches full redraw on every frame" if not failures else f"{failures} paths diverged"))
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from Core.grid import TileGrid, BitGrid
+from Core.level_format import write_chunked_level
+from Core.tilemap import Tilemap
+
+def build_templates(chunk_size, count=16, seed=1):
+    rng = random.Random(seed)
+    templates = []
+    for _ in range(count):
+        tiles = TileGrid(chunk_size, chunk_size)
+        collision = BitGrid(chunk_size, chunk_size)
+        ground = rng.randrange(chunk_size // 2, chunk_size)
+        for y in range(ground, chunk_size):
+            tiles.fill_region(0, y, chunk_size, 1, rng.randrange(1, 8))
+            collision.fill_region(0, y, chunk_size, 1, True)
+        for _ in range(4):
+            x = rng.randrange(chunk_size - 8)
+            y = rng.randrange(ground)
+            tiles.fill_region(x, y, 8, 1, 3)
+            collision.fill_region(x, y, 8, 1, True)
+        templates.append((tiles.cells.tobytes(), bytes(collision.bits)))
+    return templates
+
+def write_synthetic_world(filepath, grid_width, grid_height, chunk_size):
+    templates = build_templates(chunk_size)
+    write_chunked_level(filepath, 16, grid_width, grid_height,
+                        lambda chunk_x, chunk_y: templates[(chunk_x * 7 + chunk_y * 13) % len(templates)],
+                        chunk_size)
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk a camera across a synthetic streamed world and check the memory ceiling")
+    parser.add_argument("--size", type=int, default=10000, help="world width and height in tiles")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--budget-mb", type=float, default=4.0, help="resident chunk memory budget")
+    parser.add_argument("--ceiling-mb", type=float, default=16.0, help="fail if traced Python memory exceeds this")
+    parser.add_argument("--speed", type=float, default=8000.0, help="camera speed in pixels per second")
+    parser.add_argument("--prefetch", type=int, default=2, help="prefetch margin in chunks")
+    parser.add_argument("--no-sleep", action="store_true", help="do not pace frames at 60 Hz")
+    parser.add_argument("--edit-every", type=int, default=10, help="edit the tile under the camera every N frames (0 disables)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.lvlc")
+        start = time.perf_counter()
+        write_synthetic_world(path, args.size, args.size, args.chunk_size)
+        print(f"wrote {args.size}x{args.size} world ({os.path.getsize(path) / 1e6:.0f} MB) in {time.perf_counter() - start:.1f} s")
+        
+        tracemalloc.start()
+        tilemap = Tilemap()
+        tilemap.load_streamed_world(path, int(args.budget_mb * 1024 * 1024), args.prefetch)
+        
+        view_width, view_height = 320, 180
+        world_pixels = args.size * tilemap.tile_size
+        dt = 1 / 60
+        step = args.speed * dt
+        camera_x = camera_y = 0.0
+        tilemap.update_streaming(camera_x, camera_y, view_width, view_height, block=True)
+        
+        frames = 0
+        peak_resident = 0
+        frame_times = []
+        edits = {}
+        probe = pygame.Rect(0, 0, 16, 16)
+        
+        while camera_x < world_pixels - view_width and camera_y < world_pixels - view_height:
+            frame_start = time.perf_counter()
+            camera_x += step
+            camera_y += step * 0.5
+            tilemap.update_streaming(camera_x, camera_y, view_width, view_height, args.speed, args.speed * 0.5)
+            
+            probe.center = (int(camera_x + view_width // 2), int(camera_y + view_height // 2))
+            tilemap.get_collision_tiles_in_rect(probe)
+            tilemap.is_collision_at_position(probe.centerx, probe.bottom)
+            grid_x = probe.centerx // tilemap.tile_size
+            grid_y = probe.centery // tilemap.tile_size
+            if args.edit_every and frames % args.edit_every == 0 and tilemap.stream.chunk_for_cell(grid_x, grid_y):
+                tile_id = frames % 200 + 8
+                tilemap.set_tile(grid_x, grid_y, tile_id)
+                tilemap.set_collision(grid_x, grid_y, not tilemap.collision_data.get(grid_x, grid_y))
+                edits[(grid_x, grid_y)] = (tile_id, tilemap.collision_data.get(grid_x, grid_y))
+            
+            peak_resident = max(peak_resident, tilemap.stream.resident_bytes)
+            frames += 1
+            elapsed = time.perf_counter() - frame_start
+            frame_times.append(elapsed)
+            if not args.no_sleep and elapsed < dt:
+                time.sleep(dt - elapsed)
+            
+            if camera_y >= world_pixels - view_height - step:
+                camera_y = 0.0
+        
+        _, peak_traced = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stream = tilemap.stream
+        
+        lost = 0
+        for (grid_x, grid_y), (tile_id, solid) in random.Random(3).sample(sorted(edits.items()), min(200, len(edits))):
+            tilemap.update_streaming(grid_x * tilemap.tile_size, grid_y * tilemap.tile_size, view_width, view_height, block=True)
+            if tilemap.world_data.get(grid_x, grid_y) != tile_id or tilemap.collision_data.get(grid_x, grid_y) != solid:
+                lost += 1
+        tilemap.close_stream()
+    
+    frame_times.sort()
+    print(f"frames: {frames}")
+    print(f"chunk loads: {stream.load_count}, evictions: {stream.eviction_count}, unloaded-cell misses: {stream.miss_count}")
+    print(f"edits: {len(edits)} cells, {stream.writeback_count} dirty chunks written back, {lost} edits lost after eviction")
+    print(f"update p50: {frame_times[len(frame_times) // 2] * 1000:.3f} ms, p99: {frame_times[int(len(frame_times) * 0.99)] * 1000:.3f} ms")
+    print(f"peak resident chunks: {peak_resident / (1024 * 1024):.2f} MB (budget {args.budget_mb:.1f} MB)")
+    print(f"peak traced memory: {peak_traced / (1024 * 1024):.2f} MB (ceiling {args.ceiling_mb:.1f} MB)")
+    
+    if peak_traced > args.ceiling_mb * 1024 * 1024:
+        print("FAIL: memory ceiling exceeded")
+        return 1
+    if lost:
+        print("FAIL: edits lost after eviction")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+import os
+import threading
+from collections import OrderedDict, deque
+import pygame
+from Core.level_format import load_level
+
+class AssetJob:
+    def __init__(self, kind, path):
+        self.kind = kind
+        self.path = path
+        self.variants = []
+        self.surfaces = {}
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+    
+    def run(self):
+        try:
+            if self.kind == "level":
+                self.result = load_level(self.path)
+            else:
+                self.result = pygame.image.load(self.path)
+        except Exception as e:
+            self.error = e
+
+class AssetManager:
+    def __init__(self, budget=32 * 1024 * 1024, threaded=True):
+        self.budget = budget
+        self.cache = OrderedDict()
+        self.cache_bytes = 0
+        self.levels = {}
+        self.jobs = {}
+        self.requests = deque()
+        self.completed = deque()
+        self.condition = threading.Condition()
+        self.running = True
+        self.preloading = []
+        
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+        
+        self.thread = None
+        if threaded:
+            self.thread = threading.Thread(target=self.loader_loop, name="asset-loader", daemon=True)
+            self.thread.start()
+    
+    def loader_loop(self):
+        while True:
+            with self.condition:
+                while self.running and not self.requests:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                job = self.requests.popleft()
+            
+            job.run()
+            self.finish(job)
+    
+    def finish(self, job):
+        self.completed.append(job)
+        job.done.set()
+    
+    def submit(self, kind, path):
+        job = self.jobs.get((kind, path))
+        if job is not None:
+            return job
+        job = AssetJob(kind, path)
+        self.jobs[(kind, path)] = job
+        self.loads += 1
+        if self.thread is None:
+            job.run()
+            self.finish(job)
+            return job
+        with self.condition:
+            self.requests.append(job)
+            self.condition.notify()
+        return job
+    
+    def wait(self, job):
+        with self.condition:
+            queued = job in self.requests
+            if queued:
+                self.requests.remove(job)
+        if queued:
+            job.run()
+            self.finish(job)
+        else:
+            job.done.wait()
+        self.integrate()
+        if job.error is not None:
+            raise job.error
+    
+    def integrate(self):
+        while self.completed:
+            job = self.completed.popleft()
+            self.jobs.pop((job.kind, job.path), None)
+            if job.error is not None:
+                continue
+            if job.kind == "level":
+                self.levels[job.path] = job.result
+                continue
+            for key in job.variants:
+                job.surfaces[key] = self.store(key, self.prepare(job.result, key[1], key[2]))
+    
+    def update(self):
+        if self.completed:
+            self.integrate()
+    
+    def request(self, path, mode="alpha", size=None):
+        key = (path, mode, size)
+        if key in self.cache:
+            return key
+        job = self.submit("image", path)
+        if key not in job.variants:
+            job.variants.append(key)
+        return key
+    
+    def get(self, path, mode="alpha", size=None):
+        key = (path, mode, size)
+        surface = self.lookup(key)
+        if surface is not None:
+            return surface
+        
+        self.misses += 1
+        if size is not None:
+            base = self.lookup((path, mode, None))
+            if base is not None:
+                return self.store(key, self.prepare(base, None, size))
+        
+        self.request(path, mode, size)
+        job = self.submit("image", path)
+        self.wait(job)
+        return job.surfaces[key]
+    
+    def get_solid(self, size, color, mode="opaque"):
+        key = ("#solid", mode, (size, tuple(color)))
+        surface = self.lookup(key)
+        if surface is not None:
+            return surface
+        self.misses += 1
+        surface = pygame.Surface(size, pygame.SRCALPHA if mode == "alpha" else 0)
+        surface.fill(color)
+        return self.store(key, self.prepare(surface, mode, None))
+    
+    def lookup(self, key):
+        surface = self.cache.get(key)
+        if surface is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+        return surface
+    
+    def prepare(self, surface, mode, size):
+        if pygame.display.get_surface() is not None:
+            if mode == "alpha":
+                surface = surface.convert_alpha()
+            elif mode == "opaque":
+                surface = surface.convert()
+        if size is not None and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        return surface
+    
+    def store(self, key, surface):
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        old = self.cache.pop(key, None)
+        if old is not None:
+            self.cache_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        if size > self.budget:
+            return surface
+        while self.cache and self.cache_bytes + size > self.budget:
+            _, evicted = self.cache.popitem(last=False)
+            self.cache_bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+        self.cache[key] = surface
+        self.cache_bytes += size
+        return surface
+    
+    def request_level(self, path):
+        if path not in self.levels:
+            self.submit("level", path)
+    
+    def take_level(self, path):
+        level = self.levels.pop(path, None)
+        if level is not None:
+            return level
+        self.misses += 1
+        self.wait(self.submit("level", path))
+        return self.levels.pop(path)
+    
+    def preload(self, manifest):
+        for entry in manifest:
+            kind, path = entry[0], entry[1]
+            if not os.path.exists(path):
+                continue
+            if kind == "level":
+                self.request_level(path)
+                job = self.jobs.get(("level", path))
+            else:
+                self.request(path, *entry[2:])
+                job = self.jobs.get(("image", path))
+            if job is not None:
+                self.preloading.append(job)
+    
+    def progress(self):
+        if not self.preloading:
+            return 1.0
+        return sum(1 for job in self.preloading if job.done.is_set()) / len(self.preloading)
+    
+    def is_ready(self):
+        if any(not job.done.is_set() for job in self.preloading):
+            return False
+        self.integrate()
+        self.preloading.clear()
+        return True
+    
+    def describe(self):
+        return (f"{len(self.cache)} surfaces, {self.cache_bytes // 1024} KiB/{self.budget // 1024} KiB, "
+                f"{self.hits} hits, {self.misses} misses, {self.loads} loads, {self.evictions} evictions")
+    
+    def close(self):
+        for level in self.levels.values():
+            level.close()
+        self.levels.clear()
+        if self.thread is None:
+            return
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+        self.thread = None
@@ -0,0 +1,193 @@
+import pygame
+import os
+import struct
+import zlib
+from array import array
+
+KEY_ALIASES = {"jump": "space"}
+
+def key_code(name):
+    code = getattr(pygame, "K_" + name, None)
+    if code is None:
+        code = getattr(pygame, "K_" + name.upper(), None)
+    if code is None:
+        raise ValueError(f"Unknown key {name}")
+    return code
+
+class KeyState:
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+    
+    def __getitem__(self, key):
+        return key in self.pressed
+    
+    def press(self, key):
+        self.pressed.add(key)
+    
+    def release(self, key):
+        self.pressed.discard(key)
+    
+    def clear(self):
+        self.pressed.clear()
+
+class KeyboardInput:
+    def poll(self, tick):
+        return pygame.key.get_pressed()
+
+class ScriptedInput:
+    def __init__(self, steps, loop=True):
+        self.steps = [(frames, KeyState(keys)) for frames, keys in steps]
+        self.loop = loop
+        self.length = sum(frames for frames, _ in self.steps)
+        self.idle = KeyState()
+    
+    @classmethod
+    def parse(cls, text, loop=True):
+        steps = []
+        for part in text.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            names, _, frames = part.partition(":")
+            keys = []
+            for name in names.split("+"):
+                name = name.strip().lower()
+                if name and name != "idle":
+                    keys.append(key_code(KEY_ALIASES.get(name, name)))
+            steps.append((int(frames) if frames else 1, keys))
+        return cls(steps, loop)
+    
+    def poll(self, tick):
+        if not self.length:
+            return self.idle
+        if self.loop:
+            tick %= self.length
+        for frames, keys in self.steps:
+            if tick < frames:
+                return keys
+            tick -= frames
+        return self.idle
+
+RECORDED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_a, pygame.K_d, pygame.K_SPACE, pygame.K_x,
+                 pygame.K_UP, pygame.K_w, pygame.K_F1)
+RECORDING_MAGIC = b'IREP'
+RECORDING_VERSION = 1
+RECORDING_HEADER = struct.Struct('<4sHHHI')
+CHECKPOINT_INTERVAL = 60
+
+def state_checksum(values):
+    return zlib.crc32(struct.pack(f'<{len(values)}d', *values))
+
+def file_checksum(filepath):
+    if not filepath or not os.path.exists(filepath):
+        return 0
+    with open(filepath, 'rb') as file:
+        return zlib.crc32(file.read())
+
+class InputRecorder:
+    def __init__(self, source, keys=RECORDED_KEYS, state=None):
+        self.source = source
+        self.keys = tuple(keys)
+        self.state = state
+        self.masks = array('H')
+        self.checkpoints = {}
+    
+    def poll(self, tick):
+        pressed = self.source.poll(tick)
+        mask = 0
+        for bit, key in enumerate(self.keys):
+            if pressed[key]:
+                mask |= 1 << bit
+        
+        if tick < len(self.masks):
+            self.masks[tick] = mask
+        else:
+            self.masks.extend([0] * (tick - len(self.masks)))
+            self.masks.append(mask)
+        
+        if self.state and tick % CHECKPOINT_INTERVAL == 0:
+            self.checkpoints[tick] = state_checksum(self.state())
+        return pressed
+    
+    def save(self, filepath, tick_rate, level_path=None):
+        runs = []
+        for mask in self.masks:
+            if runs and runs[-1][1] == mask:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, mask])
+        
+        level = (level_path or "").encode()
+        with open(filepath, 'wb') as file:
+            file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, tick_rate, len(self.keys), len(self.masks)))
+            file.write(struct.pack(f'<{len(self.keys)}I', *self.keys))
+            file.write(struct.pack('<HI', len(level), file_checksum(level_path)))
+            file.write(level)
+            file.write(struct.pack('<I', len(runs)))
+            for count, mask in runs:
+                file.write(struct.pack('<IH', count, mask))
+            file.write(struct.pack('<I', len(self.checkpoints)))
+            for tick, checksum in sorted(self.checkpoints.items()):
+                file.write(struct.pack('<II', tick, checksum))
+
+class ReplayInput:
+    def __init__(self, filepath, state=None):
+        with open(filepath, 'rb') as file:
+            data = file.read()
+        
+        magic, version, self.tick_rate, key_count, self.tick_count = RECORDING_HEADER.unpack_from(data, 0)
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"{filepath} is not an input recording")
+        if version != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version {version}")
+        offset = RECORDING_HEADER.size
+        
+        self.keys = struct.unpack_from(f'<{key_count}I', data, offset)
+        offset += 4 * key_count
+        level_length, self.level_checksum = struct.unpack_from('<HI', data, offset)
+        offset += 6
+        self.level_path = data[offset:offset + level_length].decode() or None
+        offset += level_length
+        
+        self.masks = array('H')
+        run_count, = struct.unpack_from('<I', data, offset)
+        offset += 4
+        for _ in range(run_count):
+            count, mask = struct.unpack_from('<IH', data, offset)
+            offset += 6
+            self.masks.extend(array('H', [mask]) * count)
+        
+        self.checkpoints = {}
+        checkpoint_count, = struct.unpack_from('<I', data, offset)
+        offset += 4
+        for _ in range(checkpoint_count):
+            tick, checksum = struct.unpack_from('<II', data, offset)
+            offset += 8
+            self.checkpoints[tick] = checksum
+        
+        self.state = state
+        self.checked = set()
+        self.key_states = {}
+        self.idle = KeyState()
+        self.verified = 0
+        self.mismatch = None
+    
+    def level_matches(self, level_path):
+        return file_checksum(level_path) == self.level_checksum
+    
+    def poll(self, tick):
+        if self.state and tick in self.checkpoints and tick not in self.checked:
+            self.checked.add(tick)
+            if state_checksum(self.state()) == self.checkpoints[tick]:
+                self.verified += 1
+            elif self.mismatch is None:
+                self.mismatch = tick
+        
+        if tick >= len(self.masks):
+            return self.idle
+        mask = self.masks[tick]
+        keys = self.key_states.get(mask)
+        if keys is None:
+            keys = KeyState(key for bit, key in enumerate(self.keys) if mask & (1 << bit))
+            self.key_states[mask] = keys
+        return keys
@@ -0,0 +1,49 @@
+import sys
+import os
+import argparse
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.level_format import load_level, save_binary_level, save_chunked_level, save_json_level, is_binary_level
+
+def convert(input_path, output_path, output_format=None, chunk_size=64):
+    if output_format is None:
+        if output_path.lower().endswith(".json"):
+            output_format = "json"
+        elif output_path.lower().endswith(".lvlc"):
+            output_format = "chunked"
+        else:
+            output_format = "binary"
+    
+    start = time.perf_counter()
+    with load_level(input_path) as level:
+        load_time = time.perf_counter() - start
+        
+        if output_format == "json":
+            save_json_level(output_path, level)
+        elif output_format == "chunked":
+            save_chunked_level(output_path, level, chunk_size)
+        else:
+            save_binary_level(output_path, level)
+    
+    print(f"{input_path} ({'binary' if is_binary_level(input_path) else 'json'}, {os.path.getsize(input_path)} bytes, loaded in {load_time * 1000:.1f} ms)")
+    print(f"  -> {output_path} ({output_format}, {os.path.getsize(output_path)} bytes)")
+    print(f"  {level.grid_width}x{level.grid_height} tiles, tile size {level.tile_size}, viewport {level.viewport_width}x{level.viewport_height}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert levels between the editor JSON format, the binary .lvl format and the chunked .lvlc streaming format")
+    parser.add_argument("input", help="level file to read (JSON or binary, detected from the header)")
+    parser.add_argument("output", help="level file to write")
+    parser.add_argument("--to", choices=["json", "binary", "chunked"], help="output format (default: from output extension)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="tiles per chunk side for chunked output (multiple of 8)")
+    args = parser.parse_args()
+    
+    try:
+        convert(args.input, args.output, args.to, args.chunk_size)
+    except Exception as e:
+        print(f"Failed to convert level: {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
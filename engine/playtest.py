@@ -0,0 +1,216 @@
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from Core.tilemap import Tilemap
+from Core.player import Player
+from Core.collision_system import CollisionSystem
+from Core.level_format import load_level, save_binary_level, is_binary_level
+from engine.input import ScriptedInput, ReplayInput
+
+WORKER = {}
+
+def share_level(level_path, directory):
+    if is_binary_level(level_path):
+        return level_path
+    shared_path = os.path.join(directory, os.path.splitext(os.path.basename(level_path))[0] + ".lvl")
+    save_binary_level(shared_path, load_level(level_path))
+    return shared_path
+
+def random_script(seed, ticks):
+    rng = random.Random(seed)
+    steps = []
+    total = 0
+    while total < ticks:
+        frames = rng.randint(10, 60)
+        keys = []
+        direction = rng.random()
+        if direction < 0.6:
+            keys.append(pygame.K_RIGHT)
+        elif direction < 0.8:
+            keys.append(pygame.K_LEFT)
+        if rng.random() < 0.5:
+            jump = rng.randint(4, min(frames, 14))
+            steps.append((jump, keys + [pygame.K_SPACE]))
+            frames -= jump
+            total += jump
+        if frames:
+            steps.append((frames, keys))
+        total += frames
+    return ScriptedInput(steps, loop=False)
+
+def init_worker(level_path, options):
+    tilemap = Tilemap()
+    if not tilemap.load_tilemap(level_path):
+        raise RuntimeError(f"Worker could not load {level_path}")
+    WORKER["tilemap"] = tilemap
+    WORKER["options"] = options
+
+def run_spec(spec):
+    tilemap = WORKER["tilemap"]
+    options = WORKER["options"]
+    kind, value = spec
+    started = time.perf_counter()
+    
+    try:
+        if kind == "recording":
+            input_source = ReplayInput(value)
+            ticks = min(options["ticks"], input_source.tick_count)
+            dt = 1.0 / input_source.tick_rate
+        else:
+            input_source = random_script(value, options["ticks"])
+            ticks = options["ticks"]
+            dt = 1.0 / options["tick_rate"]
+        
+        spawn_x, spawn_y = options["spawn"]
+        player = Player(spawn_x, spawn_y)
+        collision_system = CollisionSystem(options["mode"])
+        world_width = tilemap.grid_width * tilemap.tile_size
+        world_height = tilemap.grid_height * tilemap.tile_size
+        goal_x = options["goal_x"] if options["goal_x"] is not None else world_width - tilemap.tile_size
+        stuck_ticks = options["stuck_ticks"]
+        anchor_x = player.x
+        anchor_y = player.y
+        anchor_tick = 0
+        status = "timeout"
+        detail = ""
+        tick = 0
+        
+        for tick in range(ticks):
+            player.update(input_source.poll(tick), dt, collision_system, tilemap)
+            rect = player.get_rect()
+            
+            if tilemap.get_collision_rects_in_rect(rect):
+                status = "clipped"
+                detail = f"overlapping solid tiles at ({player.x:.1f}, {player.y:.1f})"
+                break
+            if player.y > world_height:
+                status = "fell"
+                detail = f"left the world at x={player.x:.1f}"
+                break
+            if player.x + player.width >= goal_x:
+                status = "finished"
+                break
+            
+            if abs(player.x - anchor_x) > options["stuck_distance"] or abs(player.y - anchor_y) > options["stuck_distance"]:
+                anchor_x = player.x
+                anchor_y = player.y
+                anchor_tick = tick
+            elif tick - anchor_tick >= stuck_ticks:
+                status = "stuck"
+                detail = f"within {options['stuck_distance']}px of ({anchor_x:.1f}, {anchor_y:.1f}) for {stuck_ticks} ticks"
+                break
+        
+        final_x = player.x
+        final_y = player.y
+        player.destroy()
+        return {"kind": kind, "run": str(value), "status": status, "detail": detail, "ticks": tick + 1,
+                "x": final_x, "y": final_y, "elapsed": time.perf_counter() - started}
+    except Exception as e:
+        return {"kind": kind, "run": str(value), "status": "error", "detail": str(e), "ticks": 0,
+                "x": 0.0, "y": 0.0, "elapsed": time.perf_counter() - started}
+
+def run_batch(level_path, specs, options, workers=None):
+    with tempfile.TemporaryDirectory() as directory:
+        shared_path = share_level(level_path, directory)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers, initializer=init_worker, initargs=(shared_path, options)) as pool:
+            for result in pool.imap_unordered(run_spec, specs):
+                yield result
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def build_report(results, elapsed, require_finish):
+    failing = ("clipped", "fell", "stuck", "error") + (("timeout",) if require_finish else ())
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    
+    run_times = [result["elapsed"] for result in results]
+    total_ticks = sum(result["ticks"] for result in results)
+    failures = [result for result in results if result["status"] in failing]
+    return {
+        "runs": len(results),
+        "passed": len(results) - len(failures),
+        "failed": len(failures),
+        "statuses": counts,
+        "wall_time": elapsed,
+        "run_time_mean": sum(run_times) / len(run_times) if run_times else 0.0,
+        "run_time_p95": percentile(run_times, 0.95),
+        "ticks_per_second": total_ticks / elapsed if elapsed else 0.0,
+        "failures": sorted(failures, key=lambda result: (result["status"], result["run"])),
+        "slowest": sorted(results, key=lambda result: -result["elapsed"])[:5],
+    }
+
+def print_report(report):
+    statuses = ", ".join(f"{status} {count}" for status, count in sorted(report["statuses"].items()))
+    print(f"{report['passed']}/{report['runs']} passed ({statuses})")
+    print(f"wall {report['wall_time']:.2f}s, run mean {report['run_time_mean'] * 1000:.1f} ms, "
+          f"p95 {report['run_time_p95'] * 1000:.1f} ms, {report['ticks_per_second']:.0f} ticks/s across workers")
+    for result in report["failures"][:20]:
+        print(f"  FAIL {result['status']:<8} {result['kind']} {result['run']}: tick {result['ticks']} {result['detail']}")
+
+def collect_specs(recordings, random_runs, seed):
+    specs = [("recording", path) for path in recordings]
+    specs.extend(("random", seed + index) for index in range(random_runs))
+    return specs
+
+def main():
+    parser = argparse.ArgumentParser(description="Run recorded and randomized playtests against a level across a process pool")
+    parser.add_argument("--level", default=os.path.join("Assets", "lvl.json"))
+    parser.add_argument("--recordings", nargs="*", default=[], help="input recordings made with main.py --record")
+    parser.add_argument("--random", type=int, default=200, help="number of randomized input runs")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=3600, help="tick limit per run")
+    parser.add_argument("--tick-rate", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--spawn", default="32,32", help="player spawn position in pixels")
+    parser.add_argument("--goal-x", type=float, default=None, help="x in pixels that counts as finishing (default: right edge)")
+    parser.add_argument("--stuck-ticks", type=int, default=600)
+    parser.add_argument("--stuck-distance", type=float, default=8.0)
+    parser.add_argument("--mode", default="discrete", choices=CollisionSystem.MODES)
+    parser.add_argument("--require-finish", action="store_true", help="count runs that never reach the goal as failures")
+    parser.add_argument("--report", help="write the aggregated report as JSON")
+    parser.add_argument("--quiet", action="store_true", help="do not print each result as it arrives")
+    args = parser.parse_args()
+    
+    spawn_x, spawn_y = (float(value) for value in args.spawn.split(","))
+    options = {"ticks": args.ticks, "tick_rate": args.tick_rate, "spawn": (spawn_x, spawn_y), "goal_x": args.goal_x,
+               "stuck_ticks": args.stuck_ticks, "stuck_distance": args.stuck_distance, "mode": args.mode}
+    specs = collect_specs(args.recordings, args.random, args.seed)
+    if not specs:
+        print("Nothing to run")
+        return 1
+    
+    results = []
+    started = time.perf_counter()
+    try:
+        for result in run_batch(args.level, specs, options, args.workers):
+            results.append(result)
+            if not args.quiet:
+                print(f"[{len(results)}/{len(specs)}] {result['status']:<8} {result['kind']} {result['run']} "
+                      f"{result['ticks']} ticks {result['elapsed'] * 1000:.1f} ms")
+    except Exception as e:
+        print(f"Failed to run playtests: {e}")
+        return 1
+    
+    report = build_report(results, time.perf_counter() - started, args.require_finish)
+    print_report(report)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0 if report["failed"] == 0 else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import csv
+import json
+from time import perf_counter
+import numpy as np
+import pygame
+from Core.text_cache import TextCache, GlyphAtlas
+
+EVENTS = 0
+SPLASH = 1
+INPUT = 2
+TIMESTEP = 3
+PLAYER = 4
+COLLISION = 5
+CAMERA = 6
+TILEMAP = 7
+ENTITIES = 8
+DEBUG = 9
+PRESENT = 10
+IDLE = 11
+PHASE_NAMES = ("events", "splash", "input", "timestep", "player", "collision", "camera", "tilemap", "entities", "debug",
+               "present", "idle")
+
+def percentile_index(count, fraction):
+    return min(count - 1, int(fraction * count))
+
+class FrameProfiler:
+    def __init__(self, capacity=600, phases=PHASE_NAMES):
+        self.capacity = capacity
+        self.phases = phases
+        self.series = phases + ("frame",)
+        self.buffer = np.zeros((len(self.series), capacity))
+        self.current = [0.0] * len(phases)
+        self.cursor = 0
+        self.count = 0
+        self.frames = 0
+        self.last = perf_counter()
+        self.frame_start = self.last
+    
+    def begin_frame(self):
+        current = self.current
+        for index in range(len(current)):
+            current[index] = 0.0
+        self.last = self.frame_start = perf_counter()
+    
+    def lap(self, phase):
+        now = perf_counter()
+        self.current[phase] += now - self.last
+        self.last = now
+    
+    def move(self, source, target, elapsed):
+        self.current[source] -= elapsed
+        self.current[target] += elapsed
+    
+    def end_frame(self):
+        column = self.buffer[:, self.cursor]
+        column[:-1] = self.current
+        column[-1] = self.last - self.frame_start
+        self.cursor = (self.cursor + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        self.frames += 1
+    
+    def samples(self):
+        if self.count < self.capacity:
+            return self.buffer[:, :self.count]
+        return np.concatenate((self.buffer[:, self.cursor:], self.buffer[:, :self.cursor]), axis=1)
+    
+    def summary(self):
+        count = self.count
+        if not count:
+            return {name: {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0} for name in self.series}
+        values = self.buffer[:, :count]
+        ordered = np.sort(values, axis=1)
+        means = values.mean(axis=1)
+        p50 = ordered[:, percentile_index(count, 0.5)]
+        p95 = ordered[:, percentile_index(count, 0.95)]
+        p99 = ordered[:, percentile_index(count, 0.99)]
+        return {name: {"mean": float(means[row]), "p50": float(p50[row]), "p95": float(p95[row]),
+                       "p99": float(p99[row]), "max": float(ordered[row, -1])}
+                for row, name in enumerate(self.series)}
+    
+    def export(self, filepath):
+        try:
+            if filepath.lower().endswith(".json"):
+                self.export_json(filepath)
+            else:
+                self.export_csv(filepath)
+            return True
+        except Exception as e:
+            print(f"Failed to export frame profile: {e}")
+            return False
+    
+    def export_csv(self, filepath):
+        rows = (self.samples() * 1000).T
+        first = self.frames - self.count
+        with open(filepath, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + [f"{name}_ms" for name in self.series])
+            for index, row in enumerate(rows):
+                writer.writerow([first + index] + [f"{value:.4f}" for value in row])
+    
+    def export_json(self, filepath):
+        samples = self.samples() * 1000
+        data = {
+            "frames": self.frames,
+            "samples": self.count,
+            "phases": {name: {key: value * 1000 for key, value in stats.items()} for name, stats in self.summary().items()},
+            "frames_ms": {name: samples[row].tolist() for row, name in enumerate(self.series)},
+        }
+        with open(filepath, 'w') as file:
+            json.dump(data, file)
+
+class ProfilerHUD:
+    def __init__(self, profiler, budget=1 / 60, refresh_rate=4):
+        self.profiler = profiler
+        self.budget = budget
+        self.refresh_rate = refresh_rate
+        self.next_refresh = 0.0
+        self.visible = False
+        self.font = None
+        self.glyphs = None
+        self.text_cache = TextCache()
+        self.surface = None
+        self.row_height = 9
+        self.label_width = 44
+        self.bar_width = 64
+        self.number_width = 72
+    
+    def toggle(self):
+        self.visible = not self.visible
+        self.next_refresh = 0.0
+    
+    def build(self):
+        if not self.font:
+            pygame.font.init()
+            self.font = pygame.font.Font(None, 12)
+            self.glyphs = GlyphAtlas(self.font)
+        
+        summary = self.profiler.summary()
+        names = self.profiler.series
+        width = self.label_width + self.bar_width + self.number_width + 6
+        height = (len(names) + 1) * self.row_height + 4
+        surface = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill((0, 0, 0))
+        
+        self.glyphs.draw(surface, f"p50/p95/p99 ms, bar = {self.budget * 1000:.1f} ms", (2, 2))
+        bar_left = self.label_width + 2
+        for row, name in enumerate(names, 1):
+            stats = summary[name]
+            y = row * self.row_height + 2
+            surface.blit(self.text_cache.render(self.font, name, (200, 200, 200)), (2, y))
+            p50, p95, p99 = (min(self.bar_width, int(stats[key] / self.budget * self.bar_width)) for key in ("p50", "p95", "p99"))
+            pygame.draw.rect(surface, (40, 40, 40), (bar_left, y + 1, self.bar_width, self.row_height - 3))
+            pygame.draw.rect(surface, (200, 160, 40), (bar_left, y + 1, p95, self.row_height - 3))
+            pygame.draw.rect(surface, (60, 200, 90), (bar_left, y + 1, p50, self.row_height - 3))
+            if p99:
+                pygame.draw.line(surface, (230, 60, 60), (bar_left + p99 - 1, y), (bar_left + p99 - 1, y + self.row_height - 2))
+            self.glyphs.draw(surface, f"{stats['p50'] * 1000:.2f}/{stats['p95'] * 1000:.2f}/{stats['p99'] * 1000:.2f}",
+                             (bar_left + self.bar_width + 4, y))
+        return surface
+    
+    def render(self, screen):
+        if not self.visible:
+            return None
+        now = perf_counter()
+        if self.surface is None or now >= self.next_refresh:
+            self.next_refresh = now + (1.0 / self.refresh_rate if self.refresh_rate else 0.0)
+            self.surface = self.build()
+        position = (screen.get_width() - self.surface.get_width() - 2, screen.get_height() - self.surface.get_height() - 2)
+        return screen.blit(self.surface, position)
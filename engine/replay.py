@@ -0,0 +1,108 @@
+import sys
+import os
+import csv
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engine.profiler import EVENTS, PRESENT, IDLE
+
+PHASES = ("update", "collision", "render", "present")
+
+def run_replay(game, replay, present=True):
+    window = game.window
+    collision_system = game.collision_system
+    game.start()
+    window.max_fps = 0
+    collision_system.timing = True
+    step = game.timestep.step
+    profiler = game.profiler
+    rows = []
+    
+    while game.tick_count < replay.tick_count and window.running:
+        profiler.begin_frame()
+        window.handle_events()
+        profiler.lap(EVENTS)
+        window.dt = step
+        
+        start = time.perf_counter()
+        game.update()
+        updated = time.perf_counter()
+        game.render()
+        rendered = time.perf_counter()
+        if present:
+            window.present()
+        profiler.lap(PRESENT)
+        profiler.move(PRESENT, IDLE, window.wait_time)
+        profiler.end_frame()
+        presented = time.perf_counter()
+        
+        collision = collision_system.frame_time
+        rows.append((game.tick_count, updated - start - collision, collision, rendered - updated, presented - rendered))
+    
+    return rows
+
+def write_profile(filepath, rows):
+    with open(filepath, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["tick"] + [f"{phase}_ms" for phase in PHASES])
+        for tick, *times in rows:
+            writer.writerow([tick] + [f"{value * 1000:.4f}" for value in times])
+
+def read_profile(filepath):
+    rows = []
+    with open(filepath, newline='') as file:
+        reader = csv.reader(file)
+        next(reader)
+        for row in reader:
+            rows.append((int(row[0]), *(float(value) / 1000 for value in row[1:])))
+    return rows
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def summarize(rows):
+    summary = {}
+    for index, phase in enumerate(PHASES, 1):
+        values = [row[index] for row in rows]
+        mean = sum(values) / len(values) if values else 0.0
+        summary[phase] = (mean, percentile(values, 0.5), percentile(values, 0.95), max(values, default=0.0))
+    return summary
+
+def print_summary(rows, baseline=None):
+    summary = summarize(rows)
+    reference = summarize(baseline) if baseline else None
+    print(f"{len(rows)} frames")
+    print(f"{'phase':<10} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}" + (f" {'mean vs base':>13}" if reference else ""))
+    for phase in PHASES:
+        mean, p50, p95, worst = summary[phase]
+        line = f"{phase:<10} {mean * 1000:>9.3f} {p50 * 1000:>9.3f} {p95 * 1000:>9.3f} {worst * 1000:>9.3f}"
+        if reference:
+            base_mean = reference[phase][0]
+            change = (mean - base_mean) / base_mean * 100 if base_mean else 0.0
+            line += f" {change:>+12.1f}%"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize replay timing profiles, optionally against a baseline")
+    parser.add_argument("profile", help="CSV written by main.py --replay ... --profile")
+    parser.add_argument("--baseline", help="profile from another build of the same recording")
+    args = parser.parse_args()
+    
+    try:
+        rows = read_profile(args.profile)
+        baseline = read_profile(args.baseline) if args.baseline else None
+    except Exception as e:
+        print(f"Failed to read profile: {e}")
+        return 1
+    
+    if baseline and len(baseline) != len(rows):
+        print(f"Warning: baseline has {len(baseline)} frames, profile has {len(rows)}")
+    print_summary(rows, baseline)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
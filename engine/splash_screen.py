@@ -1,9 +1,12 @@
 import pygame
 import os
+from engine.transition import Transition
 
 class SplashScreen:
-    def __init__(self, window_manager):
+    def __init__(self, window_manager, assets=None):
         self.window = window_manager
+        self.assets = assets
+        self.engine_logo_path = None
         self.engine_logo_img = None
         
         self.load_images()
@@ -11,24 +14,52 @@ class SplashScreen:
         self.fade_duration = 1.0
         self.display_duration = 1.5
         
-        self.state = "fade_in_powered"
-        self.timer = 0.0
-        self.alpha = 0
-        
         pygame.font.init()
         self.font = pygame.font.Font(None, 20)
+        self.text_img = self.font.render("powered by", False, (255, 255, 255))
+        if pygame.display.get_surface() is not None:
+            self.text_img = self.text_img.convert_alpha()
+        
+        fade = self.fade_duration
+        display = self.display_duration
+        self.transition = Transition([("fade_in_powered", "powered", fade, 0, 255),
+                                      ("display_powered", "powered", display, 255, 255),
+                                      ("fade_out_powered", "powered", fade, 255, 0),
+                                      ("fade_in_engine", "engine", fade, 0, 255),
+                                      ("display_engine", "engine", display, 255, 255),
+                                      ("fade_out_engine", "engine", fade, 255, 0)],
+                                     (self.window.base_width, self.window.base_height))
+        self.transition.add_layer("powered", self.text_img)
+        self.transition.add_layer("engine", self.get_logo)
+    
+    @property
+    def state(self):
+        return self.transition.state
+    
+    @property
+    def alpha(self):
+        return self.transition.alpha
         
     def load_images(self):
         engine_logo_path = os.path.join("Assets", "Util", "engine_logo.png")
         
-        if os.path.exists(engine_logo_path):
+        if os.path.exists(engine_logo_path) and self.assets:
+            self.engine_logo_path = engine_logo_path
+            self.assets.request(engine_logo_path)
+        elif os.path.exists(engine_logo_path):
             original_img = pygame.image.load(engine_logo_path).convert_alpha()
             self.engine_logo_img = self.scale_image_to_fit(original_img)
         else:
             self.engine_logo_img = pygame.Surface((200, 100))
             self.engine_logo_img.fill((100, 255, 100))
     
-    def scale_image_to_fit(self, image):
+    def get_logo(self):
+        if self.engine_logo_img is None:
+            original_img = self.assets.get(self.engine_logo_path)
+            self.engine_logo_img = self.assets.get(self.engine_logo_path, size=self.fit_size(original_img))
+        return self.engine_logo_img
+    
+    def fit_size(self, image):
         img_width, img_height = image.get_size()
         screen_width, screen_height = self.window.base_width, self.window.base_height
         
@@ -36,72 +67,17 @@ class SplashScreen:
         scale_y = screen_height / img_height
         scale = min(scale_x, scale_y) * 0.8
         
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
-        
-        scaled_img = pygame.Surface((new_width, new_height))
-        scaled_img = pygame.transform.scale(image, (new_width, new_height))
-        return scaled_img
+        return int(img_width * scale), int(img_height * scale)
+    
+    def scale_image_to_fit(self, image):
+        return pygame.transform.scale(image, self.fit_size(image))
     
     def update(self, dt):
-        self.timer += dt
-        
-        if self.state == "fade_in_powered":
-            self.alpha = min(255, (self.timer / self.fade_duration) * 255)
-            if self.timer >= self.fade_duration:
-                self.timer = 0
-                self.state = "display_powered"
-                
-        elif self.state == "display_powered":
-            if self.timer >= self.display_duration:
-                self.timer = 0
-                self.state = "fade_out_powered"
-                
-        elif self.state == "fade_out_powered":
-            self.alpha = max(0, 255 - (self.timer / self.fade_duration) * 255)
-            if self.timer >= self.fade_duration:
-                self.timer = 0
-                self.alpha = 0
-                self.state = "fade_in_engine"
-                
-        elif self.state == "fade_in_engine":
-            self.alpha = min(255, (self.timer / self.fade_duration) * 255)
-            if self.timer >= self.fade_duration:
-                self.timer = 0
-                self.state = "display_engine"
-                
-        elif self.state == "display_engine":
-            if self.timer >= self.display_duration:
-                self.timer = 0
-                self.state = "fade_out_engine"
-                
-        elif self.state == "fade_out_engine":
-            self.alpha = max(0, 255 - (self.timer / self.fade_duration) * 255)
-            if self.timer >= self.fade_duration:
-                return True
-                
-        return False
+        return self.transition.update(dt)
     
     def render(self):
-        self.window.clear((0, 0, 0))
-        
-        if self.state in ["fade_in_powered", "display_powered", "fade_out_powered"]:
-            text_surface = self.font.render("powered by", False, (255, 255, 255))
-            text_surface = text_surface.convert_alpha()
-            text_surface.set_alpha(self.alpha)
-            
-            text_rect = text_surface.get_rect()
-            center_x = (self.window.base_width - text_rect.width) // 2
-            center_y = (self.window.base_height - text_rect.height) // 2
-            
-            self.window.virtual_screen.blit(text_surface, (center_x, center_y))
+        changed = self.transition.render(self.window.virtual_screen)
+        if self.transition.render_frames == 1:
+            self.window.mark_all_dirty()
         else:
-            current_img = self.engine_logo_img
-            img_copy = current_img.copy()
-            img_copy.set_alpha(self.alpha)
-            
-            img_rect = img_copy.get_rect()
-            center_x = (self.window.base_width - img_rect.width) // 2
-            center_y = (self.window.base_height - img_rect.height) // 2
-            
-            self.window.virtual_screen.blit(img_copy, (center_x, center_y))
\ No newline at end of file
+            self.window.mark_dirty_rects(changed)
@@ -1,11 +1,14 @@
 import sys
-import json
 import os
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 import pygame
-import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.grid import TileGrid, BitGrid
+from Core.collision_geometry import CollisionGeometry
+from Core.level_format import Level, load_level, save_binary_level, save_json_level
 
 class TilemapCanvas(QWidget):
     def __init__(self, parent=None):
@@ -24,8 +27,10 @@ class TilemapCanvas(QWidget):
         
         self.grid_width = 100
         self.grid_height = 100
-        self.world_data = np.zeros((self.grid_height, self.grid_width), dtype=int)
-        self.collision_data = np.zeros((self.grid_height, self.grid_width), dtype=bool)
+        self.world_data = TileGrid(self.grid_width, self.grid_height)
+        self.collision_data = BitGrid(self.grid_width, self.grid_height)
+        self.collision_geometry = CollisionGeometry()
+        self.rebuild_collision_geometry()
         
         self.show_grid = True
         self.show_viewport = True
@@ -64,6 +69,9 @@ class TilemapCanvas(QWidget):
                 tile_pixmap = self.tileset_image.copy(tile_rect)
                 self.tile_surfaces.append(tile_pixmap)
     
+    def rebuild_collision_geometry(self):
+        self.collision_geometry.build(self.collision_data, self.tile_size)
+    
     def set_edit_mode(self, mode):
         self.edit_mode = mode
         if mode == "paint":
@@ -88,7 +96,7 @@ class TilemapCanvas(QWidget):
             
             self.camera_x = new_screen_x - mouse_pos.x()
             self.camera_y = new_screen_y - mouse_pos.y()
-
+        
         self.update()
         self.parent.update_status()
     
@@ -212,6 +220,7 @@ class TilemapCanvas(QWidget):
         
         if 0 <= world_x < self.grid_width and 0 <= world_y < self.grid_height:
             self.collision_data[world_y, world_x] = not self.collision_data[world_y, world_x]
+            self.collision_geometry.invalidate_cell(world_x, world_y)
             self.update()
     
     def add_collision(self, pos):
@@ -219,6 +228,7 @@ class TilemapCanvas(QWidget):
         
         if 0 <= world_x < self.grid_width and 0 <= world_y < self.grid_height:
             self.collision_data[world_y, world_x] = True
+            self.collision_geometry.invalidate_cell(world_x, world_y)
             self.update()
     
     def remove_collision(self, pos):
@@ -226,6 +236,7 @@ class TilemapCanvas(QWidget):
         
         if 0 <= world_x < self.grid_width and 0 <= world_y < self.grid_height:
             self.collision_data[world_y, world_x] = False
+            self.collision_geometry.invalidate_cell(world_x, world_y)
             self.update()
     
     def reset_view(self):
@@ -236,27 +247,20 @@ class TilemapCanvas(QWidget):
         self.parent.update_status()
     
     def clear_world(self):
-        self.world_data = np.zeros((self.grid_height, self.grid_width), dtype=int)
+        self.world_data = TileGrid(self.grid_width, self.grid_height)
         self.update()
     
     def clear_collisions(self):
-        self.collision_data = np.zeros((self.grid_height, self.grid_width), dtype=bool)
+        self.collision_data = BitGrid(self.grid_width, self.grid_height)
+        self.rebuild_collision_geometry()
         self.update()
     
     def resize_world(self, width, height):
-        old_world_data = self.world_data.copy()
-        old_collision_data = self.collision_data.copy()
-        
         self.grid_width = width
         self.grid_height = height
-        self.world_data = np.zeros((height, width), dtype=int)
-        self.collision_data = np.zeros((height, width), dtype=bool)
-        
-        copy_height = min(old_world_data.shape[0], height)
-        copy_width = min(old_world_data.shape[1], width)
-        
-        self.world_data[:copy_height, :copy_width] = old_world_data[:copy_height, :copy_width]
-        self.collision_data[:copy_height, :copy_width] = old_collision_data[:copy_height, :copy_width]
+        self.world_data = self.world_data.resized(width, height)
+        self.collision_data = self.collision_data.resized(width, height)
+        self.rebuild_collision_geometry()
         
         self.update()
     
@@ -287,14 +291,18 @@ class TilemapCanvas(QWidget):
                     scaled_pixmap = tile_pixmap.scaled(int(scaled_tile_size), int(scaled_tile_size), Qt.KeepAspectRatio, Qt.FastTransformation)
                     painter.drawPixmap(int(screen_x), int(screen_y), scaled_pixmap)
                 
-                if self.show_collision and self.collision_data[y, x]:
-                    collision_color = QColor(255, 100, 150, 120)
-                    painter.fillRect(int(screen_x), int(screen_y), int(scaled_tile_size), int(scaled_tile_size), collision_color)
-                
                 if self.show_grid and self.zoom >= 0.5:
                     painter.setPen(QColor(100, 100, 100))
                     painter.drawRect(int(screen_x), int(screen_y), int(scaled_tile_size), int(scaled_tile_size))
         
+        if self.show_collision:
+            collision_color = QColor(255, 100, 150, 120)
+            visible = pygame.Rect(int(self.camera_x / self.zoom), int(self.camera_y / self.zoom),
+                                  int(self.width() / self.zoom) + self.tile_size, int(self.height() / self.zoom) + self.tile_size)
+            for solid in self.collision_geometry.query(visible):
+                painter.fillRect(int(solid.x * self.zoom - self.camera_x), int(solid.y * self.zoom - self.camera_y),
+                                 int(solid.width * self.zoom), int(solid.height * self.zoom), collision_color)
+        
         if self.show_viewport:
             viewport_x = (self.viewport_width / 2) * self.zoom - self.camera_x
             viewport_y = (self.viewport_height / 2) * self.zoom - self.camera_y
@@ -667,6 +675,7 @@ class TilemapEditor(QMainWindow):
     
     def on_tile_size_changed(self):
         self.canvas.tile_size = self.tile_size_spin.value()
+        self.canvas.rebuild_collision_geometry()
         if self.canvas.tileset_image:
             self.canvas.extract_tiles()
             self.palette.set_tiles(self.canvas.tile_surfaces)
@@ -706,30 +715,20 @@ class TilemapEditor(QMainWindow):
     
     def open_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Tilemap", "", "JSON Files (*.json)")
+            self, "Open Tilemap", "", "Level Files (*.json *.lvl)")
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                self.canvas.tile_size = data.get('tile_size', 16)
-                self.canvas.grid_width = data.get('grid_width', 100)
-                self.canvas.grid_height = data.get('grid_height', 100)
-                self.canvas.viewport_width = data.get('viewport_width', 320)
-                self.canvas.viewport_height = data.get('viewport_height', 180)
-                
-                world_data = data.get('world_data', [])
-                if world_data:
-                    self.canvas.world_data = np.array(world_data, dtype=int)
-                else:
-                    self.canvas.world_data = np.zeros((self.canvas.grid_height, self.canvas.grid_width), dtype=int)
-                
-                collision_data = data.get('collision_data', [])
-                if collision_data:
-                    self.canvas.collision_data = np.array(collision_data, dtype=bool)
-                else:
-                    self.canvas.collision_data = np.zeros((self.canvas.grid_height, self.canvas.grid_width), dtype=bool)
+                with load_level(file_path) as level:
+                    self.canvas.tile_size = level.tile_size
+                    self.canvas.grid_width = level.grid_width
+                    self.canvas.grid_height = level.grid_height
+                    self.canvas.viewport_width = level.viewport_width
+                    self.canvas.viewport_height = level.viewport_height
+                    
+                    self.canvas.world_data = level.world_data.copy()
+                    self.canvas.collision_data = level.collision_data.copy()
+                self.canvas.rebuild_collision_geometry()
                 
                 self.world_width_spin.setValue(self.canvas.grid_width)
                 self.world_height_spin.setValue(self.canvas.grid_height)
@@ -752,7 +751,7 @@ class TilemapEditor(QMainWindow):
     
     def save_file_as(self):
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Tilemap", "", "JSON Files (*.json)")
+            self, "Save Tilemap", "", "JSON Files (*.json);;Binary Level Files (*.lvl)")
         
         if file_path:
             self.save_to_file(file_path)
@@ -761,18 +760,13 @@ class TilemapEditor(QMainWindow):
     
     def save_to_file(self, file_path):
         try:
-            data = {
-                'tile_size': self.canvas.tile_size,
-                'grid_width': self.canvas.grid_width,
-                'grid_height': self.canvas.grid_height,
-                'viewport_width': self.canvas.viewport_width,
-                'viewport_height': self.canvas.viewport_height,
-                'world_data': self.canvas.world_data.tolist(),
-                'collision_data': self.canvas.collision_data.tolist()
-            }
+            level = Level(self.canvas.tile_size, self.canvas.world_data, self.canvas.collision_data,
+                          self.canvas.viewport_width, self.canvas.viewport_height)
             
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            if file_path.lower().endswith(".lvl"):
+                save_binary_level(file_path, level)
+            else:
+                save_json_level(file_path, level)
                 
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to save file: {str(e)}")
@@ -0,0 +1,29 @@
+class FixedTimestep:
+    def __init__(self, tick_rate=60, max_steps=5):
+        self.tick_rate = tick_rate
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+    
+    def advance(self, frame_time):
+        self.accumulator += max(0.0, frame_time)
+        steps = int(self.accumulator / self.step)
+        
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.step
+            self.accumulator -= (steps - self.max_steps) * self.step
+            steps = self.max_steps
+        
+        self.accumulator -= steps * self.step
+        if self.accumulator < 0:
+            self.accumulator = 0.0
+        self.ticks += steps
+        self.alpha = self.accumulator / self.step
+        return steps
+    
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
@@ -0,0 +1,63 @@
+import sys
+import os
+import argparse
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Core.trace import read_trace
+
+def format_value(value):
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a binary trace recorded with main.py --trace")
+    parser.add_argument("trace", help="trace file to read")
+    parser.add_argument("--channel", action="append", help="only show these channels (repeatable)")
+    parser.add_argument("--frames", help="frame range to show, e.g. 100:200")
+    parser.add_argument("--jsonl", metavar="FILE", help="export the selected records as JSON lines")
+    parser.add_argument("--summary", action="store_true", help="only print per-channel record counts")
+    parser.add_argument("--limit", type=int, default=0, help="stop after this many records (0 shows all)")
+    args = parser.parse_args()
+    
+    first_frame, last_frame = 0, None
+    if args.frames:
+        start, _, end = args.frames.partition(":")
+        first_frame = int(start) if start else 0
+        last_frame = int(end) if end else None
+    
+    counts = {}
+    shown = 0
+    output = open(args.jsonl, 'w') if args.jsonl else None
+    try:
+        for name, frame, timestamp, values in read_trace(args.trace):
+            if args.channel and name not in args.channel:
+                continue
+            if frame < first_frame or (last_frame is not None and frame > last_frame):
+                continue
+            
+            counts[name] = counts.get(name, 0) + 1
+            if output:
+                output.write(json.dumps({"channel": name, "frame": frame, "time": timestamp, **values}) + "\n")
+            elif not args.summary:
+                fields = " | ".join(f"{field}: {format_value(value)}" for field, value in values.items())
+                print(f"{frame:>7} {timestamp * 1000:10.2f} ms  {name:<16} {fields}")
+            
+            shown += 1
+            if args.limit and shown >= args.limit:
+                break
+    except Exception as e:
+        print(f"Failed to read trace: {e}")
+        return 1
+    finally:
+        if output:
+            output.close()
+    
+    if args.summary or output:
+        for name, count in sorted(counts.items()):
+            print(f"{name}: {count} records")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
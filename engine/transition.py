@@ -0,0 +1,132 @@
+import time
+import pygame
+
+class Timeline:
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.reset()
+    
+    def reset(self):
+        self.index = 0
+        self.timer = 0.0
+        self.finished = not self.steps
+        self.value = self.steps[0][3] if self.steps else 0
+    
+    @property
+    def step(self):
+        return self.steps[min(self.index, len(self.steps) - 1)]
+    
+    @property
+    def state(self):
+        return self.step[0]
+    
+    @property
+    def layer(self):
+        return self.step[1]
+    
+    def update(self, dt):
+        if self.finished:
+            return True
+        self.timer += dt
+        while True:
+            name, layer, duration, start, end = self.steps[self.index]
+            if self.timer < duration:
+                self.value = start + (end - start) * (self.timer / duration)
+                return False
+            self.value = end
+            if self.index == len(self.steps) - 1:
+                self.finished = True
+                return True
+            self.timer -= duration
+            self.index += 1
+
+class Transition:
+    def __init__(self, steps, size, background=(0, 0, 0)):
+        self.timeline = Timeline(steps)
+        self.bounds = pygame.Rect((0, 0), size)
+        self.background = background
+        self.layers = {}
+        self.rendered_key = None
+        self.rendered_rect = None
+        
+        self.render_time = 0.0
+        self.render_total = 0.0
+        self.render_frames = 0
+    
+    @classmethod
+    def fade(cls, size, color=(0, 0, 0), duration=0.5, start=255, end=0):
+        overlay = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert()
+        overlay.fill(color)
+        transition = cls([("fade", "overlay", duration, start, end)], size, None)
+        transition.add_layer("overlay", overlay, (0, 0))
+        return transition
+    
+    def add_layer(self, name, surface, position=None):
+        self.layers[name] = [surface, position]
+    
+    def prepare(self, name):
+        layer = self.layers.get(name)
+        if layer is None:
+            return None, None
+        surface, position = layer
+        if callable(surface):
+            surface = layer[0] = surface()
+        if position is None:
+            position = layer[1] = surface.get_rect(center=self.bounds.center).topleft
+        return surface, position
+    
+    @property
+    def state(self):
+        return self.timeline.state
+    
+    @property
+    def alpha(self):
+        return int(self.timeline.value)
+    
+    @property
+    def finished(self):
+        return self.timeline.finished
+    
+    def update(self, dt):
+        return self.timeline.update(dt)
+    
+    def reset(self):
+        self.timeline.reset()
+        self.rendered_key = None
+        self.rendered_rect = None
+    
+    def render(self, target):
+        start = time.perf_counter()
+        key = (self.timeline.layer, self.alpha)
+        if self.background is not None and key == self.rendered_key:
+            self.record(start)
+            return []
+        self.rendered_key = key
+        
+        changed = []
+        if self.background is not None:
+            if self.rendered_rect is None:
+                target.fill(self.background)
+                changed.append(self.bounds)
+            elif self.rendered_rect:
+                target.fill(self.background, self.rendered_rect)
+                changed.append(self.rendered_rect)
+        
+        surface, position = self.prepare(self.timeline.layer)
+        self.rendered_rect = pygame.Rect(0, 0, 0, 0)
+        if surface is not None and self.alpha > 0:
+            surface.set_alpha(self.alpha)
+            self.rendered_rect = target.blit(surface, position)
+            changed.append(self.rendered_rect)
+        self.record(start)
+        return changed
+    
+    def record(self, start):
+        self.render_time = time.perf_counter() - start
+        self.render_total += self.render_time
+        self.render_frames += 1
+    
+    def average_render_time(self):
+        return self.render_total / self.render_frames if self.render_frames else 0.0
@@ -1,35 +1,120 @@
 import pygame
+import os
 import sys
+import time
+
+PRESENT_BACKENDS = ("software", "scaled", "sdl2")
 
 class WindowManager:
-    def __init__(self, width=320, height=180, title="2D Platformer"):
+    def __init__(self, width=320, height=180, title="2D Platformer", headless=False, max_fps=60, backend="software", window_size=None):
+        self.headless = headless
+        self.max_fps = max_fps
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
         
         pygame.transform.set_smoothscale_backend('GENERIC')
         
         self.base_width = width
         self.base_height = height
-        self.scale = self.calculate_scale()
+        self.title = title
+        self.renderer = None
+        self.texture = None
+        self.present_time = 0.0
+        self.wait_time = 0.0
+        self.present_total = 0.0
+        self.present_frames = 0
+        
+        self.dirty_threshold = 0.5
+        self.dirty_rects = []
+        self.all_dirty = True
+        self.full_presents = 0
+        self.partial_presents = 0
+        self.skipped_presents = 0
+        self.presented_pixels = 0
         
-        self.screen = pygame.display.set_mode((self.base_width * self.scale, self.base_height * self.scale))
-        self.virtual_screen = pygame.Surface((self.base_width, self.base_height))
+        if backend not in PRESENT_BACKENDS:
+            raise ValueError(f"Unknown present backend {backend}")
+        self.backend = "software" if headless else backend
+        if headless:
+            window_size = (width, height)
+        self.open_display(window_size)
         
         pygame.display.set_caption(title)
         
         self.clock = pygame.time.Clock()
         self.running = True
         self.dt = 0
-        
+    
     def calculate_scale(self):
         info = pygame.display.Info()
         scale_x = info.current_w // self.base_width
         scale_y = info.current_h // self.base_height
         return max(1, min(scale_x, scale_y))
     
+    def letterbox(self, window_width, window_height):
+        scale = max(1, min(window_width // self.base_width, window_height // self.base_height))
+        width = self.base_width * scale
+        height = self.base_height * scale
+        return scale, pygame.Rect((window_width - width) // 2, (window_height - height) // 2, width, height)
+    
+    def open_display(self, window_size):
+        if self.backend == "scaled":
+            try:
+                self.open_scaled()
+                return
+            except pygame.error as e:
+                print(f"Failed to open SCALED display, using software scaling: {e}")
+                self.backend = "software"
+        
+        if window_size is None:
+            scale = self.calculate_scale()
+            window_size = (self.base_width * scale, self.base_height * scale)
+        self.scale, self.viewport = self.letterbox(*window_size)
+        
+        if self.backend == "sdl2":
+            try:
+                self.open_renderer(window_size)
+                return
+            except (ImportError, pygame.error) as e:
+                print(f"Failed to create SDL renderer, using software scaling: {e}")
+                self.backend = "software"
+                self.renderer = None
+                self.texture = None
+        
+        self.open_software(window_size)
+    
+    def open_software(self, window_size):
+        self.screen = pygame.display.set_mode(window_size)
+        self.screen.fill((0, 0, 0))
+        self.target = self.screen.subsurface(self.viewport)
+        self.virtual_screen = pygame.Surface((self.base_width, self.base_height)).convert()
+    
+    def open_scaled(self):
+        self.screen = pygame.display.set_mode((self.base_width, self.base_height), pygame.SCALED)
+        self.scale = 1
+        self.viewport = self.screen.get_rect()
+        self.target = None
+        self.virtual_screen = self.screen
+    
+    def open_renderer(self, window_size):
+        from pygame._sdl2 import video
+        
+        self.screen = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        window = video.Window(self.title, window_size)
+        self.renderer = video.Renderer(window)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.texture = video.Texture(self.renderer, (self.base_width, self.base_height), streaming=True)
+        self.target = None
+        self.virtual_screen = pygame.Surface((self.base_width, self.base_height)).convert()
+    
     def handle_events(self):
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == pygame.QUIT or event.type == pygame.WINDOWCLOSE:
                 self.running = False
+            elif event.type == pygame.WINDOWEXPOSED or event.type == pygame.VIDEOEXPOSE:
+                self.all_dirty = True
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
@@ -37,13 +122,100 @@ class WindowManager:
     def clear(self, color=(0, 0, 0)):
         self.virtual_screen.fill(color)
     
+    def mark_dirty(self, rect):
+        self.dirty_rects.append(rect)
+    
+    def mark_dirty_rects(self, rects):
+        self.dirty_rects.extend(rects)
+    
+    def mark_all_dirty(self):
+        self.all_dirty = True
+    
+    def collect_dirty(self):
+        if self.all_dirty:
+            return None
+        
+        view = self.virtual_screen.get_rect()
+        merged = []
+        for rect in self.dirty_rects:
+            rect = rect.clip(view)
+            if not rect.width or not rect.height:
+                continue
+            index = rect.collidelist(merged)
+            while index >= 0:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        
+        if sum(rect.width * rect.height for rect in merged) > self.dirty_threshold * view.width * view.height:
+            return None
+        return merged
+    
     def present(self):
-        scaled_surface = pygame.transform.scale(self.virtual_screen, 
-                                              (self.base_width * self.scale, self.base_height * self.scale))
-        pygame.transform.set_smoothscale_backend('GENERIC')
-        self.screen.blit(scaled_surface, (0, 0))
-        pygame.display.flip()
-        self.dt = self.clock.tick(60) / 1000.0
+        if self.headless:
+            self.dirty_rects.clear()
+            return
+        start = time.perf_counter()
+        rects = self.collect_dirty()
+        self.dirty_rects.clear()
+        self.all_dirty = False
+        
+        if rects is not None and not rects:
+            self.skipped_presents += 1
+            self.presented_pixels = 0
+        elif rects is None:
+            self.full_presents += 1
+            self.presented_pixels = self.base_width * self.base_height
+            self.present_full()
+        else:
+            self.partial_presents += 1
+            self.presented_pixels = sum(rect.width * rect.height for rect in rects)
+            self.present_rects(rects)
+        
+        self.present_time = time.perf_counter() - start
+        self.present_total += self.present_time
+        self.present_frames += 1
+        start = time.perf_counter()
+        self.dt = self.clock.tick(self.max_fps) / 1000.0
+        self.wait_time = time.perf_counter() - start
+    
+    def present_full(self):
+        if self.backend == "software":
+            if self.scale == 1:
+                self.target.blit(self.virtual_screen, (0, 0))
+            else:
+                pygame.transform.scale(self.virtual_screen, self.viewport.size, self.target)
+            pygame.display.flip()
+        elif self.backend == "sdl2":
+            self.texture.update(self.virtual_screen)
+            self.renderer.clear()
+            self.texture.draw(dstrect=self.viewport)
+            self.renderer.present()
+        else:
+            pygame.display.flip()
+    
+    def present_rects(self, rects):
+        if self.backend == "sdl2":
+            self.present_full()
+            return
+        if self.backend == "scaled":
+            pygame.display.update(rects)
+            return
+        
+        scale = self.scale
+        left, top = self.viewport.topleft
+        display_rects = []
+        for rect in rects:
+            scaled = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+            if scale == 1:
+                self.target.blit(self.virtual_screen, rect.topleft, rect)
+            else:
+                pygame.transform.scale(self.virtual_screen.subsurface(rect), scaled.size, self.target.subsurface(scaled))
+            display_rects.append(scaled.move(left, top))
+        pygame.display.update(display_rects)
+    
+    def average_present_time(self):
+        return self.present_total / self.present_frames if self.present_frames else 0.0
     
     def quit(self):
         pygame.quit()
@@ -1,48 +1,110 @@
 import pygame
 import os
+import math
+import time
 from engine.window_manager import WindowManager
 from engine.splash_screen import SplashScreen
+from engine.timestep import FixedTimestep
+from engine.input import KeyboardInput
+from engine.assets import AssetManager
+from engine.profiler import FrameProfiler, ProfilerHUD, EVENTS, SPLASH, INPUT, TIMESTEP, PLAYER, COLLISION, CAMERA, TILEMAP, ENTITIES, DEBUG, PRESENT, IDLE
 from Core.player import Player
 from Core.tilemap import Tilemap
 from Core.collision_system import CollisionSystem
 from Core.debug_system import DebugSystem
+from Core.ecs import create_default_world
+from Core.level_format import is_chunked_level
+from Core.trace import tracer
 
 class Game:
-    def __init__(self):
-        self.window = WindowManager()
-        self.splash = SplashScreen(self.window)
-        self.player = Player(32, 32)
+    def __init__(self, tick_rate=60, max_catch_up=5, headless=False, input_source=None, level_path=None,
+                 present_backend="software", window_size=None, incremental_world=True):
+        self.window = WindowManager(headless=headless, backend=present_backend, window_size=window_size)
+        self.timestep = FixedTimestep(tick_rate, max_catch_up)
+        self.input = input_source if input_source is not None else KeyboardInput()
+        self.tick_count = 0
+        self.assets = AssetManager()
+        self.splash = SplashScreen(self.window, self.assets)
+        self.world = create_default_world()
+        self.player = Player(32, 32, self.world, self.assets)
         self.tilemap = Tilemap()
+        self.sky_color = (135, 206, 235)
+        self.overlay_rects = None
+        if incremental_world:
+            self.tilemap.enable_world_layer(self.window.base_width, self.window.base_height, self.sky_color)
         self.collision_system = CollisionSystem()
+        self.collision_system.register_entity(self.player.entity, self.player.x, self.player.y, self.player.width, self.player.height)
         self.debug_system = DebugSystem()
+        self.profiler = FrameProfiler()
+        self.profiler_hud = ProfilerHUD(self.profiler, 1.0 / self.timestep.tick_rate)
+        self.profiler_key_down = False
+        self.collision_system.timing = True
         self.game_started = False
         
         self.camera_x = 0
         self.camera_y = 0
+        self.prev_camera_x = 0
+        self.prev_camera_y = 0
+        self.camera_smoothing = 0.1
         
-        self.load_level()
+        self.level_path = level_path
+        self.tileset_path = os.path.join("Assets","world_tileset.png")
+        self.level_loaded = False
+        self.preload_level()
+        
+    def preload_level(self):
+        if not self.level_path:
+            self.level_path = self.find_level_file()
+        manifest = [("image", self.tileset_path)]
+        if self.level_path and not is_chunked_level(self.level_path):
+            manifest.append(("level", self.level_path))
+        self.assets.preload(manifest)
         
     def load_level(self):
-        tilemap_path = os.path.join("Assets","lvl.json")
-        tileset_path = os.path.join("Assets","world_tileset.png")
+        tilemap_path = self.level_path
+        tileset_path = self.tileset_path
         
-        if os.path.exists(tilemap_path):
-            self.tilemap.load_tilemap(tilemap_path)
+        if tilemap_path:
+            self.tilemap.load_tilemap(tilemap_path, self.assets)
+            self.tilemap.update_streaming(self.player.x - self.window.base_width // 2, self.player.y - self.window.base_height // 2,
+                                          self.window.base_width, self.window.base_height, block=True)
         
         if os.path.exists(tileset_path):
-            self.tilemap.load_tileset(tileset_path)
+            self.tilemap.load_tileset(tileset_path, self.assets)
+        self.level_loaded = True
+        
+    def start(self):
+        if not self.level_loaded:
+            self.load_level()
+        self.game_started = True
+        self.timestep.reset()
+        
+    def find_level_file(self):
+        candidates = [os.path.join("Assets", name) for name in ("lvl.lvlc", "lvl.lvl", "lvl.json")]
+        existing = [path for path in candidates if os.path.exists(path)]
+        if not existing:
+            return None
+        return max(existing, key=os.path.getmtime)
         
     def handle_debug_input(self, keys):
         if keys[pygame.K_F1]:
             self.debug_system.toggle()
             self.collision_system.enable_debug(self.debug_system.enabled)
+        if keys[pygame.K_F2] and not self.profiler_key_down:
+            self.profiler_hud.toggle()
+            self.overlay_rects = None
+        self.profiler_key_down = keys[pygame.K_F2]
+        
+    def checkpoint_state(self):
+        return (self.player.x, self.player.y, self.player.vel_x, self.player.vel_y, self.camera_x, self.camera_y)
         
-    def update_camera(self):
+    def update_camera(self, dt):
         target_x = self.player.x - self.window.base_width // 2
         target_y = self.player.y - self.window.base_height // 2
         
-        self.camera_x += (target_x - self.camera_x) * 0.1
-        self.camera_y += (target_y - self.camera_y) * 0.1
+        follow = 1.0 - (1.0 - self.camera_smoothing) ** (dt * 60)
+        self.camera_x += (target_x - self.camera_x) * follow
+        self.camera_y += (target_y - self.camera_y) * follow
         
         world_width = self.tilemap.grid_width * self.tilemap.tile_size
         world_height = self.tilemap.grid_height * self.tilemap.tile_size
@@ -52,48 +114,143 @@ class Game:
         
     def update(self):
         if not self.game_started:
+            tracer.next_frame()
+            self.assets.update()
+            if not self.level_loaded and self.assets.is_ready():
+                self.load_level()
             splash_done = self.splash.update(self.window.dt)
             if splash_done:
-                self.game_started = True
-        else:
-            keys = pygame.key.get_pressed()
-            self.handle_debug_input(keys)
-            
-            self.player.update(keys, self.window.dt, self.collision_system, self.tilemap)
-            self.update_camera()
-            
-            if self.debug_system.enabled:
-                self.debug_system.clear_info()
-                self.debug_system.add_info("Player X", f"{self.player.x:.1f}")
-                self.debug_system.add_info("Player Y", f"{self.player.y:.1f}")
-                self.debug_system.add_info("Vel X", f"{self.player.vel_x:.1f}")
-                self.debug_system.add_info("Vel Y", f"{self.player.vel_y:.1f}")
-                self.debug_system.add_info("On Ground", self.player.on_ground)
-                self.debug_system.add_info("Camera X", f"{self.camera_x:.1f}")
-                self.debug_system.add_info("Camera Y", f"{self.camera_y:.1f}")
+                self.start()
+            self.profiler.lap(SPLASH)
+            return
         
+        profiler = self.profiler
+        keys = self.input.poll(self.tick_count)
+        profiler.lap(INPUT)
+        self.handle_debug_input(keys)
+        profiler.lap(DEBUG)
+        steps = self.timestep.advance(self.window.dt)
+        profiler.lap(TIMESTEP)
+        for step in range(steps):
+            if step:
+                keys = self.input.poll(self.tick_count)
+                profiler.lap(INPUT)
+            self.tick(keys, self.timestep.step)
+        
+    def tick(self, keys, dt):
+        tracer.next_frame()
+        self.tick_count += 1
+        self.prev_camera_x = self.camera_x
+        self.prev_camera_y = self.camera_y
+        self.collision_system.begin_frame()
+        
+        profiler = self.profiler
+        self.world.update(dt, keys, self.collision_system, self.tilemap)
+        profiler.lap(PLAYER)
+        profiler.move(PLAYER, COLLISION, self.collision_system.frame_time)
+        if self.debug_system.enabled or self.profiler_hud.visible:
+            self.collision_system.find_entity_pairs()
+        profiler.lap(COLLISION)
+        self.update_camera(dt)
+        self.tilemap.update_streaming(self.camera_x, self.camera_y, self.window.base_width, self.window.base_height,
+                                      self.player.vel_x, self.player.vel_y)
+        profiler.lap(CAMERA)
+        
+        if self.debug_system.wants_info():
+            self.debug_system.clear_info()
+            self.debug_system.add_info("Player X", f"{self.player.x:.1f}")
+            self.debug_system.add_info("Player Y", f"{self.player.y:.1f}")
+            self.debug_system.add_info("Vel X", f"{self.player.vel_x:.1f}")
+            self.debug_system.add_info("Vel Y", f"{self.player.vel_y:.1f}")
+            self.debug_system.add_info("On Ground", self.player.on_ground)
+            self.debug_system.add_info("Camera X", f"{self.camera_x:.1f}")
+            self.debug_system.add_info("Camera Y", f"{self.camera_y:.1f}")
+            stats = self.collision_system.broadphase.stats
+            self.debug_system.add_info("Entities", stats.entities)
+            self.debug_system.add_info("Pairs", f"{stats.overlapping_pairs}/{stats.candidate_pairs}")
+            self.debug_system.add_info("Tick", f"{self.timestep.tick_rate} Hz, dropped {self.timestep.dropped_time:.2f}s")
+            for name, elapsed in self.world.system_times.items():
+                self.debug_system.add_info(f"{name} ms", f"{elapsed * 1000:.2f}")
+            if self.tilemap.world_layer:
+                self.debug_system.add_info("World redraw px", self.tilemap.world_layer.redrawn_pixels)
+            self.debug_system.add_info("Presented px", self.window.presented_pixels)
+            self.debug_system.add_info(f"present ms ({self.window.backend})", f"{self.window.present_time * 1000:.2f}")
+        profiler.lap(DEBUG)
+    
     def render(self):
+        profiler = self.profiler
         if not self.game_started:
             self.splash.render()
+            profiler.lap(SPLASH)
         else:
-            self.window.clear((135, 206, 235))
+            alpha = self.timestep.alpha
+            camera_x = math.floor(self.prev_camera_x + (self.camera_x - self.prev_camera_x) * alpha)
+            camera_y = math.floor(self.prev_camera_y + (self.camera_y - self.prev_camera_y) * alpha)
+            
+            screen = self.window.virtual_screen
+            if self.tilemap.world_layer:
+                changed = self.tilemap.render_world_layer(screen, camera_x, camera_y, self.overlay_rects)
+            else:
+                self.window.clear(self.sky_color)
+                self.tilemap.render(screen, camera_x, camera_y)
+                changed = None
+            profiler.lap(TILEMAP)
+            self.world.render(screen, camera_x, camera_y, alpha)
             
-            self.tilemap.render(self.window.virtual_screen, self.camera_x, self.camera_y)
-            self.player.render(self.window.virtual_screen, self.camera_x, self.camera_y)
+            if changed is None:
+                self.window.mark_all_dirty()
+            else:
+                self.window.mark_dirty_rects(changed)
+            self.window.mark_dirty_rects(self.world.drawn_rects)
+            self.overlay_rects = list(self.world.drawn_rects)
+            profiler.lap(ENTITIES)
             
             if self.debug_system.enabled:
-                self.debug_system.render_grid(self.window.virtual_screen, self.tilemap.tile_size, self.camera_x, self.camera_y)
-                self.collision_system.render_debug(self.window.virtual_screen, self.camera_x, self.camera_y)
-                self.collision_system.render_entity_debug(self.window.virtual_screen, self.player, self.camera_x, self.camera_y)
-                
-            self.debug_system.render_info(self.window.virtual_screen)
-            self.debug_system.render_fps(self.window.virtual_screen, self.window.clock)
+                self.debug_system.render_grid(screen, self.tilemap.tile_size, camera_x, camera_y)
+                self.collision_system.render_debug(screen, camera_x, camera_y)
+                self.collision_system.render_entity_debug(screen, self.player, camera_x, camera_y)
+                self.debug_system.render_info(screen)
+                self.debug_system.render_fps(screen, self.window.clock)
+                self.window.mark_all_dirty()
+                self.overlay_rects = None
+            
+            hud_rect = self.profiler_hud.render(screen)
+            if hud_rect:
+                self.window.mark_dirty(hud_rect)
+                if self.overlay_rects is not None:
+                    self.overlay_rects.append(hud_rect)
+            profiler.lap(DEBUG)
         
     def run(self):
+        profiler = self.profiler
         while self.window.running:
+            profiler.begin_frame()
             self.window.handle_events()
+            profiler.lap(EVENTS)
             self.update()
             self.render()
             self.window.present()
+            profiler.lap(PRESENT)
+            profiler.move(PRESENT, IDLE, self.window.wait_time)
+            profiler.end_frame()
+        
+        self.window.quit()
+        
+    def run_headless(self, ticks, render_every=0):
+        self.start()
+        step = self.timestep.step
+        
+        start = time.perf_counter()
+        profiler = self.profiler
+        for index in range(ticks):
+            profiler.begin_frame()
+            keys = self.input.poll(self.tick_count)
+            profiler.lap(INPUT)
+            self.tick(keys, step)
+            if render_every and (index + 1) % render_every == 0:
+                self.render()
+            profiler.end_frame()
+        elapsed = time.perf_counter() - start
         
-        self.window.quit()
\ No newline at end of file
+        pygame.quit()
+        return ticks, elapsed
\ No newline at end of file
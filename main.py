@@ -1,5 +1,107 @@
+import argparse
 from game import Game
+from engine.window_manager import PRESENT_BACKENDS
+from engine.input import ScriptedInput, KeyboardInput, InputRecorder, ReplayInput
+from engine.replay import run_replay, write_profile, print_summary
+from Core.trace import tracer
+
+DEFAULT_SCRIPT = "right+jump:12,right:78,left+jump:12,left:78"
+
+def parse_input(parser, script):
+    try:
+        return ScriptedInput.parse(script)
+    except ValueError as e:
+        parser.error(f"Invalid input script: {e}")
+
+def parse_size(text):
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game")
+    parser.add_argument("--level", help="level file to load (default: newest Assets/lvl.*)")
+    parser.add_argument("--present", default="software", choices=PRESENT_BACKENDS, help="how the 320x180 frame is scaled to the window")
+    parser.add_argument("--window", type=parse_size, metavar="WxH", help="window size; the frame is integer scaled and letterboxed inside it")
+    parser.add_argument("--full-redraw", action="store_true", help="redraw every visible tile each frame instead of scrolling the world layer")
+    parser.add_argument("--tick-rate", type=int, default=60, help="simulation ticks per second")
+    parser.add_argument("--max-catch-up", type=int, default=5, help="most ticks simulated for one rendered frame")
+    parser.add_argument("--headless", action="store_true", help="run without a display as fast as possible")
+    parser.add_argument("--ticks", type=int, default=3600, help="ticks to simulate in headless mode")
+    parser.add_argument("--render-every", type=int, default=0, help="render every N ticks in headless mode (0 = never)")
+    parser.add_argument("--input", metavar="SCRIPT", help=f"scripted input such as \"{DEFAULT_SCRIPT}\" (default in headless mode)")
+    parser.add_argument("--record", metavar="FILE", help="record per-tick input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recording one tick per frame and profile it")
+    parser.add_argument("--profile", metavar="CSV", help="write the replay's per-frame timings to CSV")
+    parser.add_argument("--frame-profile", metavar="FILE", help="on exit, write per-phase frame timings to FILE (.json for a percentile summary, otherwise CSV)")
+    parser.add_argument("--trace", metavar="FILE", help="record trace channels to FILE (view with engine/trace_viewer.py)")
+    parser.add_argument("--trace-channels", default="", help="comma separated channels to record (default: all)")
+    args = parser.parse_args(argv)
+    if args.replay and args.record:
+        parser.error("--record and --replay cannot be combined")
+    script = args.input if args.input is not None else (DEFAULT_SCRIPT if args.headless and not args.replay else None)
+    args.input_source = parse_input(parser, script) if script else None
+    return args
+
+def replay(args):
+    try:
+        recording = ReplayInput(args.replay)
+    except Exception as e:
+        print(f"Failed to load recording: {e}")
+        return
+    
+    level_path = args.level or recording.level_path
+    if not recording.level_matches(level_path):
+        print(f"Warning: {level_path} differs from the level the recording was made on")
+    
+    game = Game(recording.tick_rate, args.max_catch_up, args.headless, recording, level_path, args.present, args.window, not args.full_redraw)
+    recording.state = game.checkpoint_state
+    rows = run_replay(game, recording, not args.headless)
+    
+    if recording.mismatch is not None:
+        print(f"Replay diverged at tick {recording.mismatch} ({recording.verified} checkpoints matched)")
+    else:
+        print(f"Replay matched {recording.verified}/{len(recording.checkpoints)} checkpoints")
+    if args.profile:
+        write_profile(args.profile, rows)
+    if args.frame_profile:
+        game.profiler.export(args.frame_profile)
+    print_summary(rows)
+    if not args.headless:
+        print(f"present backend {game.window.backend}: {game.window.average_present_time() * 1000:.3f} ms/frame")
+
+def play(args):
+    input_source = args.input_source
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(input_source or KeyboardInput())
+        input_source = recorder
+    
+    game = Game(args.tick_rate, args.max_catch_up, args.headless, input_source, args.level, args.present, args.window, not args.full_redraw)
+    if recorder:
+        recorder.state = game.checkpoint_state
+    
+    try:
+        if args.headless:
+            ticks, elapsed = game.run_headless(args.ticks, args.render_every)
+            print(f"Simulated {ticks} ticks in {elapsed:.2f}s: {ticks / elapsed:.0f} ticks/s, "
+                  f"{ticks / args.tick_rate / elapsed:.1f}x real time")
+        else:
+            game.run()
+    finally:
+        if recorder:
+            recorder.save(args.record, args.tick_rate, game.level_path)
+        if args.frame_profile:
+            game.profiler.export(args.frame_profile)
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    args = parse_args()
+    if args.trace:
+        tracer.start(args.trace, [name for name in args.trace_channels.split(",") if name])
+    
+    try:
+        if args.replay:
+            replay(args)
+        else:
+            play(args)
+    finally:
+        tracer.stop()
\ No newline at end of file